@@ -8,6 +8,11 @@ class Archiver(Agent("archiver")):
     def record_scaling_event(self):
         for package in self.listen("worker:scaling", state_key="core_archiver"):
             message = Collection(**package.message)
+            if "error" in package.message:
+                # Worker start failures carry no scaling metrics
+                self.warning(f"Worker processor for {message.worker_type} failed to start: {message.error}")
+                continue
+
             self.save_instance(
                 self._scaling_event,
                 None,
@@ -17,7 +22,9 @@ class Archiver(Agent("archiver")):
                     "worker_type": message.worker_type,
                     "worker_max_count": message.worker_max_count,
                     "worker_count": message.worker_count,
+                    "worker_desired": message.worker_desired,
                     "task_count": message.task_count,
+                    "task_rate": message.task_rate,
                     "workers_created": message.workers_created,
                 },
             )
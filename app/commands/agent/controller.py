@@ -22,3 +22,21 @@ class Controller(Agent("controller")):
                 worker.scale_agents(agent_count)
             else:
                 worker.scale_agents(0)
+
+        self.prewarm_workers()
+
+    def prewarm_workers(self):
+        def prewarm(worker_type):
+            worker = self.get_provider(
+                "worker",
+                settings.WORKER_PROVIDER,
+                app,
+                worker_type=worker_type,
+                command_name=self.get_full_name(),
+                command_options={},
+            )
+            count = worker.prewarm()
+            if count:
+                self.notice(f"Prewarming {count} {worker_type} workers at {self.time.now_string}")
+
+        self.run_list(self._scaling_event.get_worker_types(settings.WORKER_SCALING_HISTORY_DAYS), prewarm)
@@ -7,3 +7,4 @@ class Clear(Command("cache.clear")):
     def exec(self):
         caches[settings.CACHE_MIDDLEWARE_ALIAS].clear()
         caches[settings.CACHE_MIDDLEWARE_ALIAS].close()
+        self.manager.index.clear_spec_cache()
@@ -1,13 +1,23 @@
+import copy
+
+from systems.cache.records import get_record_cache
 from systems.commands.index import CommandMixin
 
 
 class ConfigMixin(CommandMixin("config")):
-    def get_config(self, name, default=None, required=False):
+    def get_config(self, name, default=None, required=False, cache=True):
         if not name:
             return default
 
-        config = self.get_instance(self._config, name, required=required, cache=False)
-        if config is None:
-            return default
+        if cache:
+            config = get_record_cache(self._config.name).get(name, self._config.retrieve)
+            if config is None and required:
+                self.error(f"{self._config.name.title()} {name} does not exist")
+            if config is None or not config.initialize(self):
+                return default
+        else:
+            config = self.get_instance(self._config, name, required=required, cache=False)
+            if config is None:
+                return default
 
-        return config.value
+        return copy.deepcopy(config.value)
@@ -4,6 +4,7 @@ import threading
 from django.conf import settings
 from django.utils import timezone
 from systems.commands.index import CommandMixin
+from systems.commands.log import flush_log_messages, get_log_writer
 
 
 class LogMixin(CommandMixin("log")):
@@ -29,19 +30,24 @@ class LogMixin(CommandMixin("log")):
         return self.log_entry.name if self.log_result else "<none>"
 
     def log_message(self, data, log=True):
-        def _create_log_message(command, data, _log):
-            if getattr(command, "log_entry", None) and _log:
-                command.log_entry.messages.create(data=data)
+        if self.log_result:
+            messages = []
+            command = self
 
-            if command.exec_parent:
-                _create_log_message(command.exec_parent, data, True)
+            while command:
+                if getattr(command, "log_entry", None) and log:
+                    messages.append(self._log_message.model(log=command.log_entry, data=data))
 
-        if self.log_result:
-            with self.log_lock:
-                _create_log_message(self, data, log)
+                command = command.exec_parent
+                log = True
+
+            if messages:
+                get_log_writer().add(messages)
 
     def log_status(self, status, check_log_result=False, schedule=None):
         if not check_log_result or self.log_result:
+            flush_log_messages()
+
             with self.log_lock:
                 if getattr(self, "log_entry", None):
                     if schedule:
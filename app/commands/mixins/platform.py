@@ -1,3 +1,6 @@
+import copy
+
+from systems.cache.records import get_record_cache
 from systems.commands.index import CommandMixin
 
 
@@ -25,10 +28,16 @@ class PlatformMixin(CommandMixin("platform")):
         host.save()
         return host
 
-    def get_state(self, name, default=None):
-        instance = self.get_instance(self._state, name, required=False, cache=False)
+    def get_state(self, name, default=None, cache=True):
+        if cache:
+            instance = get_record_cache(self._state.name).get(name, self._state.retrieve)
+            if instance is None or not instance.initialize(self):
+                instance = None
+        else:
+            instance = self.get_instance(self._state, name, required=False, cache=False)
+
         if instance:
-            return instance.value
+            return copy.deepcopy(instance.value)
         return default
 
     def set_state(self, name, value=None):
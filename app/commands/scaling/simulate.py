@@ -0,0 +1,48 @@
+from django.conf import settings
+from services.celery import app
+from systems.commands.index import Command
+
+
+class Simulate(Command("scaling.simulate")):
+    def exec(self):
+        worker_types = self.scaling_worker_types
+        if not worker_types:
+            worker_types = self._scaling_event.get_worker_types(self.scaling_history_days)
+
+        results = [
+            [
+                self.key_color("Worker type"),
+                self.key_color("Policy"),
+                self.key_color("Events"),
+                self.key_color("Cold starts"),
+                self.key_color("Worker shortfall"),
+                self.key_color("Peak workers"),
+                self.key_color("Worker hours"),
+            ]
+        ]
+        for worker_type in worker_types:
+            worker = self.get_provider(
+                "worker",
+                settings.WORKER_PROVIDER,
+                app,
+                worker_type=worker_type,
+                command_name=self.get_full_name(),
+                command_options={},
+            )
+            history = list(self._scaling_event.get_history(worker_type, self.scaling_history_days))
+
+            for policy_name in self.scaling_policies:
+                metrics = worker.simulate_scaling(policy_name, history)
+                results.append(
+                    [
+                        self.value_color(worker_type),
+                        self.value_color(policy_name),
+                        metrics["events"],
+                        metrics["cold_starts"],
+                        metrics["worker_shortfall"],
+                        metrics["worker_peak"],
+                        f"{metrics['worker_hours']:.2f}",
+                    ]
+                )
+
+        self.table(results, "simulation")
@@ -1,4 +1,5 @@
 from django.conf import settings
+from systems.cache.records import invalidate_record_cache
 from systems.models.index import Model, ModelFacade
 from utility.data import format_value
 
@@ -12,8 +13,19 @@ class ConfigFacade(ModelFacade("config")):
                 command.notice("\n".join(["Loading Zimagi system configurations", "-" * terminal_width]))
                 command.notice("-" * terminal_width)
 
+    def clear(self, **filters):
+        result = super().clear(**filters)
+        invalidate_record_cache(self.name)
+        return result
+
 
 class Config(Model("config")):
     def save(self, *args, **kwargs):
         self.value = format_value(self.value_type, self.value)
         super().save(*args, **kwargs)
+        invalidate_record_cache(self.facade.name, self.name)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        invalidate_record_cache(self.facade.name, self.name)
+        return result
@@ -0,0 +1,23 @@
+# Generated by Django 4.1.13 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scaling_event", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scalingevent",
+            name="worker_desired",
+            field=models.IntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name="scalingevent",
+            name="task_rate",
+            field=models.FloatField(null=True),
+        ),
+    ]
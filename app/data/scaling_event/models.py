@@ -1,10 +1,26 @@
+from datetime import timedelta
+
 from django.utils.timezone import now
 from systems.models.index import Model, ModelFacade
 from utility.data import create_token
 
 
 class ScalingEventFacade(ModelFacade("scaling_event")):
-    pass
+
+    def get_history(self, worker_type, days):
+        return (
+            self.filter(worker_type=worker_type, created__gte=now() - timedelta(days=days))
+            .order_by("created")
+            .values_list("created", "task_count", "task_rate")
+        )
+
+    def get_worker_types(self, days):
+        return list(
+            self.filter(created__gte=now() - timedelta(days=days))
+            .order_by("worker_type")
+            .values_list("worker_type", flat=True)
+            .distinct()
+        )
 
 
 class ScalingEvent(Model("scaling_event")):
@@ -0,0 +1,20 @@
+from systems.cache.records import invalidate_record_cache
+from systems.models.index import Model, ModelFacade
+
+
+class StateFacade(ModelFacade("state")):
+    def clear(self, **filters):
+        result = super().clear(**filters)
+        invalidate_record_cache(self.name)
+        return result
+
+
+class State(Model("state")):
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        invalidate_record_cache(self.facade.name, self.name)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        invalidate_record_cache(self.facade.name, self.name)
+        return result
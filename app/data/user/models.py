@@ -55,6 +55,12 @@ class User(Model("user"), DerivedAbstractModel(base_user, "AbstractBaseUser", "p
 
     objects = UserManager()
 
+    def set_password(self, raw_password):
+        from systems.api.auth import token_cache
+
+        super().set_password(raw_password)
+        token_cache.clear()
+
     def save(self, *args, **kwargs):
         if not self.password and self.name == settings.ADMIN_USER:
             self.set_password(settings.DEFAULT_ADMIN_TOKEN)
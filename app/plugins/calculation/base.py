@@ -7,7 +7,7 @@ import re
 import yaml
 from django.conf import settings
 from systems.plugins.index import BasePlugin
-from utility.data import ensure_list
+from utility.data import LRUCache, ensure_list, iterate_chunks
 from utility.text import Template
 
 logger = logging.getLogger(__name__)
@@ -52,6 +52,7 @@ class BaseProvider(BasePlugin("calculation")):
         super().__init__(type, name, command)
         self.id = id
         self.config = config
+        self.query_cache = LRUCache()
 
     def check(self, *args):
         for arg in args:
@@ -72,12 +73,41 @@ class BaseProvider(BasePlugin("calculation")):
     def process(self, reset):
         facade = self.command.facade(self.field_data, False)
         success = True
-        for record in self.load_items(facade, reset):
-            if not self.process_item(facade, record):
-                success = False
+
+        self.query_cache.size = int(self.field_query_cache_size or 0)
+        self.query_cache.clear()
+
+        if self.field_batch_size and not self.field_record and self._check_batch(facade):
+            for records in self.load_batches(facade, reset):
+                if not self.process_batch(facade, records):
+                    success = False
+        else:
+            for record in self.load_items(facade, reset):
+                if not self.process_item(facade, record):
+                    success = False
+
+        if self.query_cache.hits or self.query_cache.misses:
+            self.command.info(
+                f"Calculation {self.id} parameter query cache: "
+                f"{self.query_cache.hits} hits / {self.query_cache.misses} misses"
+            )
         if not success:
             self.abort("Calculations failed with errors")
 
+    def _check_batch(self, facade):
+        # Bulk updates skip model saves and only make saved values visible after each batch
+        if not facade.check_bulk_save_methods():
+            self.command.warning(f"Calculation {self.id} saves {facade.name} records individually (custom model saves)")
+            return False
+
+        for name, query in (self.field_params or {}).items():
+            if isinstance(query, dict) and self._check_query_saved(query):
+                self.command.warning(
+                    f"Calculation {self.id} saves records individually (parameter {name} reads saved values)"
+                )
+                return False
+        return True
+
     def load_items(self, facade, reset):
         filters = self._interpolate_values(self.field_filters)
         if not reset and not self.field_record:
@@ -85,25 +115,20 @@ class BaseProvider(BasePlugin("calculation")):
 
         return facade.values(*self._collect_fields(facade), **filters)
 
+    def load_batches(self, facade, reset):
+        items = self.load_items(facade, reset)
+        if getattr(items, "iterator", None):
+            items = items.iterator(chunk_size=self.field_batch_size)
+
+        return iterate_chunks(items, self.field_batch_size)
+
     def process_item(self, facade, record):
         key = record[facade.key()]
-        params = ParameterData(self._collect_parameter_values(record))
-        success = True
-
-        try:
-            value = self.calc(params)
-        except SilentException:
-            value = None
-        except Exception as error:
-            record_render = yaml.dump(record, indent=2)
-            self.command.error(f"Error: {error}:\n\n{record_render}\n{params}", terminate=False)
-            value = None
-            success = False
+        value, success = self._calculate_value(record)
 
         if self._validate_value(key, value, record):
             if not self.field_disable_save:
-                if "formatter" in self.config:
-                    value = self._get_formatter_value(key, self.config["formatter"], value, record)
+                value = self._format_value(key, value, record)
 
                 if not self.field_record:
                     self._save_column(facade, value, record)
@@ -115,20 +140,66 @@ class BaseProvider(BasePlugin("calculation")):
             self.command.warning(f"Skipping {self.id} {key} value {value}: {record}")
         return success
 
+    def process_batch(self, facade, records):
+        values = {}
+        success = True
+
+        for record in records:
+            value, item_success = self._calculate_value(record)
+            if not item_success:
+                success = False
+
+            self._collect_column_value(facade, values, value, record)
+
+        self._save_columns(facade, values)
+        return success
+
+    def _calculate_value(self, record):
+        params = ParameterData(self._collect_parameter_values(record))
+        try:
+            return (self.calc(params), True)
+        except SilentException:
+            return (None, True)
+        except Exception as error:
+            record_render = yaml.dump(record, indent=2)
+            self.command.error(f"Error: {error}:\n\n{record_render}\n{params}", terminate=False)
+            return (None, False)
+
+    def _format_value(self, key, value, record):
+        if "formatter" in self.config:
+            value = self._get_formatter_value(key, self.config["formatter"], value, record)
+        return value
+
+    def _collect_column_value(self, facade, values, value, record):
+        key = record[facade.key()]
+
+        if self._validate_value(key, value, record):
+            if not self.field_disable_save:
+                values[record[facade.pk]] = self._format_value(key, value, record)
+        else:
+            self.command.warning(f"Skipping {self.id} {key} value {value}: {record}")
+
+    def _save_columns(self, facade, values):
+        if values:
+            if facade.check_bulk_save_methods():
+                facade.bulk_update_field(self.field_field, values, batch_size=self.field_batch_size)
+            else:
+                for id, value in values.items():
+                    self._save_column(facade, value, {facade.pk: id})
+
     def _get_parents(self, record):
         parents = {}
         if self.field_parents:
             for data_name, record_spec in self.field_parents.items():
-                facade = self.command.facade(data_name, False)
                 values = self._interpolate_values(record_spec, record)
+                facade = self._get_scoped_facade(self.command.facade(data_name, False), values)
 
-                self._set_scope(facade, values)
                 instance, created = facade.store(values[facade.key()], values)
                 parents[data_name] = getattr(instance, facade.pk)
 
         return parents
 
-    def _set_scope(self, facade, values):
+    def _get_scoped_facade(self, facade, values):
         scope = {}
 
         for field in facade.scope_fields:
@@ -138,7 +209,7 @@ class BaseProvider(BasePlugin("calculation")):
             elif field_id in values:
                 scope[field_id] = values[field_id]
 
-        facade.set_scope(scope)
+        return facade.scope(scope)
 
     def _save_column(self, facade, value, record):
         instance = facade.retrieve_by_id(record[facade.pk])
@@ -154,7 +225,7 @@ class BaseProvider(BasePlugin("calculation")):
             record[data_name] = data_value
 
         values = self._interpolate_values(record_spec, record)
-        self._set_scope(facade, values)
+        facade = self._get_scoped_facade(facade, values)
         facade.store(values[facade.key()], values)
 
     def _collect_fields(self, facade):
@@ -199,16 +270,23 @@ class BaseProvider(BasePlugin("calculation")):
                 values[name] = record[query]
             else:
                 data = query.get("data", self.field_data)
-                facade = self.command.facade(data, False)
                 filters = self._interpolate_values(query.get("filters", {}), record)
-
-                if query.get("order", None):
-                    facade.set_order(query["order"])
-
-                if query.get("limit", None):
-                    facade.set_limit(query["limit"])
-
-                results = list(facade.field_values(query["field"], **filters))
+                cache_key = (
+                    data,
+                    tuple(sorted((key, repr(value)) for key, value in filters.items())),
+                    tuple(ensure_list(query.get("order", None))),
+                    query.get("limit", None),
+                    query["field"],
+                )
+                cache = not self._check_query_saved(query)
+                results = self.query_cache.get(cache_key) if cache else None
+
+                if results is None:
+                    facade = self.command.facade(data, False).order(query.get("order", None)).limit(query.get("limit", None))
+                    results = list(facade.field_values(query["field"], **filters))
+                    if cache:
+                        self.query_cache.set(cache_key, results)
+                results = list(results)
 
                 if query.get("limit", None) and query["limit"] == 1:
                     values[name] = results[0] if results else None
@@ -217,6 +295,21 @@ class BaseProvider(BasePlugin("calculation")):
 
         return values
 
+    def _check_query_saved(self, query):
+        # Queries that read data saved during the run change with each saved result so they can not be reused
+        data = query.get("data", self.field_data)
+
+        if self.field_record:
+            return data in (self.field_record.get("_data", self.field_data), *(self.field_parents or {}).keys())
+        if data != self.field_data:
+            return False
+
+        fields = [query["field"], *(query.get("filters", None) or {}).keys(), *ensure_list(query.get("order", None))]
+        for field in fields:
+            if re.split(r"__|\.", re.sub(r"^[~-]", "", field))[0] in (self.field_field, "updated"):
+                return True
+        return False
+
     def _interpolate_values(self, specs, record=None):
         data = {}
 
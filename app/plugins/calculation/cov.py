@@ -5,5 +5,9 @@ from systems.plugins.index import BaseProvider
 
 class Provider(BaseProvider("calculation", "cov")):
     def calc(self, p):
-        data = self.prepare_list(p.a)
+        data = self.prepare_list(p.a, 2)
         return stdev(data) / mean(data)
+
+    def calc_vector(self, values):
+        window = self.rolling(values)
+        return window.std() / window.mean()
@@ -7,3 +7,9 @@ class Provider(BaseProvider("calculation", "min_max_scale")):
         low = min(values)
         range = max(values) - low
         return (values[-1] - low) / range if range != 0 else None
+
+    def calc_vector(self, values):
+        window = self.rolling(values)
+        low = window.min()
+        range = window.max() - low
+        return ((self.window_current(values) - low) / range).where(range != 0)
@@ -5,4 +5,7 @@ from systems.plugins.index import BaseProvider
 
 class Provider(BaseProvider("calculation", "stdev")):
     def calc(self, p):
-        return stdev(self.prepare_list(p.a))
+        return stdev(self.prepare_list(p.a, 2))
+
+    def calc_vector(self, values):
+        return self.rolling(values).std()
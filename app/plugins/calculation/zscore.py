@@ -5,6 +5,11 @@ from systems.plugins.index import BaseProvider
 
 class Provider(BaseProvider("calculation", "zscore")):
     def calc(self, p):
-        values = self.prepare_list(p.a)
+        values = self.prepare_list(p.a, 2)
         std_dev = stdev(values)
         return (values[-1] - mean(values)) / std_dev if std_dev != 0 else None
+
+    def calc_vector(self, values):
+        window = self.rolling(values)
+        std_dev = window.std()
+        return ((self.window_current(values) - window.mean()) / std_dev).where(std_dev != 0)
@@ -10,6 +10,10 @@ class BaseProvider(BasePlugin("formatter")):
         # Override in subclass.
         return value
 
+    def format_series(self, values, data):
+        # Override in subclass with a formatted Series (None formats each value)
+        return None
+
     def format_value(self, value, record, provider, **config):
         if "id" not in config:
             config["id"] = self.field_id
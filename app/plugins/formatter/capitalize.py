@@ -12,3 +12,13 @@ class Provider(BaseProvider("formatter", "capitalize")):
             else:
                 value = value.capitalize()
         return value
+
+    def format_series(self, values, data):
+        values = super().format_series(values, data)
+        if self.field_words:
+            values = values.str.split(r"\s+", regex=True).map(
+                lambda items: " ".join([item.capitalize() for item in items]), na_action="ignore"
+            )
+        else:
+            values = values.str.capitalize()
+        return values.where(values.notna(), None)
@@ -1,5 +1,6 @@
 import datetime
 
+import pandas
 from systems.plugins.index import BaseProvider
 
 
@@ -13,3 +14,12 @@ class Provider(BaseProvider("formatter", "date")):
             self.error(f"Value {value} is not a valid date according to pattern: {self.field_format}")
 
         return value.date()
+
+    def format_series(self, values, data):
+        strings = values.map(lambda value: str(int(value) if isinstance(value, float) else value))
+        parsed = pandas.to_datetime(strings, format=self.field_format, errors="coerce")
+
+        for value in strings[parsed.isna()]:
+            self.error(f"Value {value} is not a valid date according to pattern: {self.field_format}")
+
+        return parsed.dt.date
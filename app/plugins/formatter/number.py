@@ -1,5 +1,6 @@
 import math
 
+import pandas
 from systems.plugins.index import BaseProvider
 from utility.data import number
 
@@ -15,3 +16,9 @@ class Provider(BaseProvider("formatter", "number")):
         if value is None or math.isnan(value):
             return None
         return number(value)
+
+    def format_series(self, values, data):
+        numbers = pandas.to_numeric(values, errors="coerce")
+        formatted = pandas.Series([None] * len(values.index), index=values.index, dtype=object)
+        formatted[numbers.notna()] = numbers.dropna().astype(int).tolist()
+        return formatted
@@ -7,3 +7,9 @@ class Provider(BaseProvider("formatter", "remove_suffix")):
         if value is not None and self.field_suffix:
             value = value.removesuffix(self.field_suffix)
         return value
+
+    def format_series(self, values, data):
+        values = super().format_series(values, data)
+        if self.field_suffix:
+            values = values.str.removesuffix(self.field_suffix)
+        return values.where(values.notna(), None)
@@ -8,3 +8,6 @@ class Provider(BaseProvider("formatter", "string")):
         if not value or (not isinstance(value, str) and math.isnan(value)):
             return None
         return str(value)
+
+    def format_series(self, values, data):
+        return values.astype(str).astype(object).where(values.notna() & values.astype(bool), None)
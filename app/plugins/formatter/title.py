@@ -5,3 +5,7 @@ class Provider(BaseProvider("formatter", "title")):
     def format(self, value, record):
         value = super().format(value, record)
         return value.title() if value else None
+
+    def format_series(self, values, data):
+        values = super().format_series(values, data)
+        return values.str.title().where(values.notna(), None)
@@ -5,3 +5,7 @@ class Provider(BaseProvider("formatter", "upper")):
     def format(self, value, record):
         value = super().format(value, record)
         return value.upper() if value else None
+
+    def format_series(self, values, data):
+        values = super().format_series(values, data)
+        return values.str.upper().where(values.notna(), None)
@@ -1,39 +1,94 @@
+import importlib
 import re
 import zipfile
+from contextlib import contextmanager
 
 import pandas
 import requests
 from django.conf import settings
 from systems.commands.args import get_type
 from systems.plugins.index import ProviderMixin
-from utility.temp import TempDir
+from utility.temp import temp_dir
 
 
 class CSVSourceMixin(ProviderMixin("csv_source")):
-    def load_csv_data_from_file(self, file, columns, archive_file=None, separator=",", data_type=None, header=None):
+    download_chunk_size = 1048576
+
+    def load_csv_data_from_file(
+        self, file, columns, archive_file=None, separator=",", data_type=None, header=None, chunk_size=None
+    ):
+        data_type = self.get_column_type(data_type)
+        if chunk_size:
+            return self._load_csv_chunks(file, columns, archive_file, separator, data_type, header, chunk_size)
+
+        with self._open_csv_file(file, archive_file) as open_file:
+            options = self._get_csv_options(open_file, columns, separator, data_type, header)
+            file_data = pandas.read_csv(open_file(), **options)
+
+        return self._get_csv_dataframe(file_data, columns, data_type)
+
+    def _load_csv_chunks(self, file, columns, archive_file, separator, data_type, header, chunk_size):
+        with self._open_csv_file(file, archive_file) as open_file:
+            options = self._get_csv_options(open_file, columns, separator, data_type, header, chunk_size)
+
+            with pandas.read_csv(open_file(), **options) as reader:
+                for file_data in reader:
+                    yield self._get_csv_dataframe(file_data, columns, data_type)
+
+    @contextmanager
+    def _open_csv_file(self, file, archive_file=None):
         zipped_file = True if file.endswith(".zip") else False
-        temp = TempDir()
 
-        if re.match(r"^https?\:\/\/", file):
-            response = requests.get(file)
-            if not isinstance(response.content, str) and not zipped_file:
-                content = response.content.decode("utf-8")
+        with temp_dir() as temp:
+            if re.match(r"^https?\:\/\/", file):
+                file = self._download_csv_file(temp, file)
             else:
-                content = response.content
+                file = settings.MANAGER.index.get_module_file(file)
 
-            file = temp.save(content, binary=zipped_file)
-        else:
-            file = settings.MANAGER.index.get_module_file(file)
+            if zipped_file:
+                with zipfile.ZipFile(file, "r") as archive:
+                    member = archive_file if archive_file else archive.namelist()[0]
+                    yield lambda: archive.open(member)
+            else:
+                yield lambda: file
 
-        if zipped_file:
-            with zipfile.ZipFile(file, "r") as archive:
-                archive.extractall(temp.base_path)
-            file = temp.path(archive_file)
+    def _download_csv_file(self, temp, url):
+        file = temp.path("download")
 
-        data_type = self.get_column_type(data_type)
-        file_data = pandas.read_csv(file, sep=separator, engine="python", dtype=data_type, header=header)
-        temp.delete()
+        with requests.get(url, stream=True) as response:
+            response.raise_for_status()
+
+            with open(file, "wb") as download_file:
+                for content in response.iter_content(chunk_size=self.download_chunk_size):
+                    download_file.write(content)
+        return file
+
+    def _get_csv_engine(self, separator, header=None, chunk_size=None):
+        engine = self.field_csv_engine
+
+        if engine == "pyarrow" and (chunk_size or header is None or not importlib.util.find_spec("pyarrow")):
+            engine = "c"
+        if engine != "python" and len(separator) > 1:
+            engine = "python"
+        return engine
+
+    def _get_csv_options(self, open_file, columns, separator, data_type, header, chunk_size=None):
+        engine = self._get_csv_engine(separator, header, chunk_size)
+        options = {"sep": separator, "engine": engine, "dtype": data_type, "header": header}
+
+        if columns:
+            file_columns = pandas.read_csv(
+                open_file(), sep=separator, engine=self._get_csv_engine(separator, header, True), header=header, nrows=0
+            ).columns
+            usecols = [column for column in file_columns if column in columns]
+            if usecols:
+                options["usecols"] = usecols
+
+        if chunk_size:
+            options["chunksize"] = chunk_size
+        return options
 
+    def _get_csv_dataframe(self, file_data, columns, data_type):
         if columns:
             return pandas.DataFrame(file_data, columns=columns, dtype=data_type).drop_duplicates(columns)
         else:
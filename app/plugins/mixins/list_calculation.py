@@ -1,14 +1,155 @@
+import math
+import re
+
+import numpy
+import pandas
+from django.conf import settings
 from systems.plugins.index import ProviderMixin
+from utility.data import ensure_list, iterate_chunks
 
 
 class ListCalculationMixin(ProviderMixin("list_calculation")):
-    def prepare_list(self, list_data):
+    def prepare_list(self, list_data, min_values=1):
         if not isinstance(list_data, (list, tuple)):
             self.abort("Calculation requires a list parameter")
 
         list_data = [value for value in list(list_data) if value is not None]
 
-        if len(list_data) == 0 or (self.field_min_values is not None and len(list_data) < self.field_min_values):
+        if len(list_data) < max(min_values, self.field_min_values or 1):
             self.set_null()
 
-        return reversed(list_data) if self.field_reverse else list_data
+        return list(reversed(list_data)) if self.field_reverse else list_data
+
+    def process(self, reset):
+        if not self.field_vectorize or self.field_record:
+            return super().process(reset)
+        if self.calc_vector.__func__ is ListCalculationMixin.calc_vector:
+            self.abort(f"Calculation provider {self.name} does not support vectorized processing")
+
+        facade = self.command.facade(self.field_data, False)
+        query = self._get_vector_query()
+        scope_fields = self._vector_scope
+        order_fields = [field for field, descending in self._vector_order]
+        success = True
+
+        fields = [*self._collect_fields(facade), *scope_fields, *order_fields, query["field"]]
+        dataframe = facade.dataframe(*list(dict.fromkeys(fields)))
+        if dataframe.empty:
+            return
+
+        # Windows trail the current record in the opposite direction of the parameter query order
+        dataframe = dataframe.sort_values(
+            [*scope_fields, *order_fields],
+            ascending=[True] * len(scope_fields) + [descending for field, descending in self._vector_order],
+            kind="stable",
+        )
+        series = pandas.to_numeric(dataframe[query["field"]], errors="coerce")
+
+        def calculate(values):
+            nonlocal success
+            if self._vector_window and (self.field_min_values or 1) > self._vector_window:
+                return pandas.Series(numpy.nan, index=values.index)
+            try:
+                return self.calc_vector(values)
+            except Exception as error:
+                self.command.error(f"Error: {error}:\n\n{values.to_dict()}", terminate=False)
+                success = False
+                return pandas.Series(numpy.nan, index=values.index)
+
+        if scope_fields:
+            results = series.groupby([dataframe[field] for field in scope_fields], sort=False).transform(calculate)
+        else:
+            results = calculate(series)
+
+        # Order ties share the window of the last tied record since the query bound includes every tie
+        tie_keys = [dataframe[field] for field in [*scope_fields, order_fields[0]]]
+        tie_last = series.groupby(tie_keys, sort=False, dropna=False).cumcount(ascending=False) == 0
+        results = results.where(tie_last).groupby(tie_keys, sort=False, dropna=False).transform("last")
+
+        targets = pandas.Series(True, index=dataframe.index)
+        if self.field_filters:
+            target_ids = set(facade.field_values(facade.pk, **self._interpolate_values(self.field_filters)))
+            targets &= dataframe[facade.pk].isin(target_ids)
+        if not reset:
+            targets &= dataframe[self.field_field].isna()
+
+        results = results[targets]
+        dataframe = dataframe[targets]
+
+        columns = list(dataframe.columns)
+        records = zip(dataframe.itertuples(index=False, name=None), results.tolist())
+
+        for batch in iterate_chunks(records, self.field_batch_size or settings.CALCULATION_VECTOR_BATCH_SIZE):
+            values = {}
+            for row, value in batch:
+                self._collect_column_value(facade, values, self._get_vector_value(value), dict(zip(columns, row)))
+
+            self._save_columns(facade, values)
+
+        if not success:
+            self.abort("Calculations failed with errors")
+
+    def calc_vector(self, values):
+        # Override in subclass with a Series of results for a sorted Series of parameter "a" values
+        return None
+
+    def rolling(self, values):
+        if self._vector_window:
+            return values.rolling(window=self._vector_window, min_periods=self.field_min_values or 1)
+        return values.expanding(min_periods=self.field_min_values or 1)
+
+    def window_current(self, values):
+        # Last element of each parameter list, which is the oldest window value unless the list is reversed
+        positions = numpy.arange(len(values))
+        valid_positions = pandas.Series(numpy.where(values.notna(), positions, numpy.nan))
+
+        if self._vector_window:
+            starts = numpy.maximum(positions - self._vector_window + 1, 0)
+        else:
+            starts = numpy.zeros(len(values), dtype=int)
+
+        if self.field_reverse:
+            current = valid_positions.ffill().to_numpy()
+            found = current >= starts
+        else:
+            current = valid_positions.bfill().to_numpy()[starts]
+            found = current <= positions
+
+        found &= ~numpy.isnan(current)
+        results = numpy.full(len(values), numpy.nan)
+        results[found] = values.to_numpy(dtype=float)[current[found].astype(int)]
+        return pandas.Series(results, index=values.index)
+
+    def _get_vector_query(self):
+        query = (self.field_params or {}).get("a", None)
+
+        if not isinstance(query, dict) or not query.get("order", None):
+            self.abort("Vectorized list calculations require an ordered parameter 'a' query")
+        if query.get("data", self.field_data) != self.field_data:
+            self.abort("Vectorized list calculations require parameter 'a' data to match calculation data")
+
+        self._vector_window = query.get("limit", None)
+        self._vector_scope = ensure_list(self.field_window_scope) if self.field_window_scope else []
+        self._vector_order = [(re.sub(r"^[~-]", "", field), field[0] in ("~", "-")) for field in ensure_list(query["order"])]
+        order_field, descending = self._vector_order[0]
+
+        window_filters = {field: field for field in self._vector_scope}
+        window_filters[f"{order_field}__{'lte' if descending else 'gte'}"] = order_field
+        query_filters = {}
+
+        for field, value in (query.get("filters", None) or {}).items():
+            match = re.match(r"^\@\{?([a-zA-Z0-9\_\-]+)\}?$", value.strip()) if isinstance(value, str) else None
+            query_filters[re.sub(r"\.", "__", field)] = match.group(1) if match else value
+
+        if query_filters != window_filters:
+            self.abort(
+                "Vectorized list calculations require parameter 'a' filters to match the window scope and order: {}".format(
+                    {field: f"@{value}" for field, value in window_filters.items()}
+                )
+            )
+        return query
+
+    def _get_vector_value(self, value):
+        if value is None or not math.isfinite(value):
+            return None
+        return value
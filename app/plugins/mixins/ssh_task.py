@@ -14,6 +14,7 @@ class SSHTaskMixin(ProviderMixin("ssh_task")):
             timeout=self.field_timeout,
             port=self.field_port,
             env=env,
+            pool=True,
         )
 
     def _ssh_exec(self, command, args=None, options=None, env=None, sudo=False, ssh=None):
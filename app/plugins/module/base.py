@@ -38,6 +38,7 @@ class BaseProvider(BasePlugin("module")):
             self.manager.index.save_module_config(
                 instance.name, {"remote": self.get_remote(instance), "reference": instance.reference}
             )
+            self.manager.index.clear_spec_cache()
 
     def get_module_name(self, instance):
         return instance.get_id()
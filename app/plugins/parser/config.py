@@ -1,6 +1,7 @@
 import re
 
 from django.conf import settings
+from systems.cache.records import get_record_cache
 from systems.plugins.index import BaseProvider
 from utility.data import dump_json
 
@@ -23,12 +24,16 @@ class Provider(BaseProvider("parser", "config")):
 
     @classmethod
     def _load_config_variables(cls, command, reset=False):
-        if reset or not getattr(cls, "_config_variables", None):
-            cls._config_variables = {}
-            if command.require_db():
-                for config in command._config.all():
-                    cls._config_variables[config.name] = config.value
-        return cls._config_variables
+        if not command.require_db():
+            return {}
+
+        def load_config():
+            return {config.name: config.value for config in command._config.all()}
+
+        config_cache = get_record_cache(command._config.name)
+        if reset:
+            config_cache.invalidate()
+        return config_cache.get_all(load_config)
 
     def __init__(self, type, name, command, config):
         super().__init__(type, name, command, config)
@@ -51,7 +51,7 @@ class Provider(BaseProvider("parser", "reference")):
 
                 scope_filters[scope_field.strip()] = normalize_value(scope_value)
 
-            facade.set_scope(scope_filters)
+            facade = facade.scope(scope_filters)
 
         names = ref_match.group(5)
         if names:
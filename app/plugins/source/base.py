@@ -1,18 +1,132 @@
 import copy
 import datetime
 import logging
+import threading
 
+import numpy
 import pandas
 from django.conf import settings
+from django.core.exceptions import ValidationError
 from django.utils.timezone import make_aware
 from pandas._libs.tslibs.timestamps import Timestamp
 from systems.plugins.index import BasePlugin
 from systems.plugins.parser import FormatterParser
-from utility.data import dump_json, ensure_list, get_identifier, prioritize, serialize
+from utility.data import dump_json, ensure_list, get_identifier, iterate_chunks, prioritize, serialize
 
 logger = logging.getLogger(__name__)
 
 
+class ValidatedRecords(list):
+    def __init__(self):
+        super().__init__()
+        self.formatted = []
+
+    def append(self, record, formatted=None):
+        super().append(record)
+        self.formatted.append(formatted if formatted else {})
+
+
+class RelationResolver:
+    query_size = 1000
+
+    def __init__(self, provider):
+        self.provider = provider
+        self.lock = threading.Lock()
+        self.index = {}
+
+    def load(self, relations, records):
+        for field, spec in relations.items():
+            self._load_relation(spec, records)
+
+    def resolve(self, spec, scope, values):
+        index_key = self._get_index_key(spec, scope)
+        values = self._normalize_values(spec, values)
+        relation_index = self.index.get(index_key, {})
+        missing = [value for value in values if value not in relation_index]
+
+        if missing:
+            self._query(spec, index_key, scope, missing)
+            relation_index = self.index.get(index_key, {})
+
+        ids = []
+        for value in values:
+            id = relation_index.get(value, None)
+            if id is not None and id not in ids:
+                ids.append(id)
+
+        if spec.get("multiple", False):
+            return ids if ids else None
+        return ids[0] if ids else None
+
+    def _load_relation(self, spec, records):
+        if "value" in spec:
+            return
+
+        for scope_spec in (spec.get("scope", None) or {}).values():
+            if isinstance(scope_spec, dict):
+                self._load_relation(scope_spec, records)
+
+        queries = {}
+        for index, record in enumerate(records):
+            lookup = self.provider._get_relation_lookup(spec, index, record)
+            if lookup is not None:
+                scope, values = lookup
+                index_key = self._get_index_key(spec, scope)
+                relation_index = self.index.get(index_key, {})
+                query = queries.setdefault(index_key, (scope, {}))
+
+                for value in self._normalize_values(spec, values):
+                    if value not in relation_index:
+                        query[1][value] = True
+
+        for index_key, (scope, values) in queries.items():
+            if values:
+                self._query(spec, index_key, scope, list(values.keys()))
+
+    def _query(self, spec, index_key, scope, values):
+        facade = self.provider.command.facade(spec["data"], False).scope(scope)
+        key_field = self._get_key_field(spec)
+        results = {}
+
+        for query_values in iterate_chunks(values, self.query_size):
+            for item in facade.values(*dict.fromkeys([facade.pk, key_field]), **{f"{key_field}__in": query_values}):
+                results.setdefault(item[key_field], item[facade.pk])
+
+        # Only hits are indexed, so keys created later in the import (including by
+        # earlier rows of the same page) are looked up again when requested
+        with self.lock:
+            relation_index = self.index.setdefault(index_key, {})
+            for value in values:
+                if value in results:
+                    relation_index[value] = results[value]
+
+    def _normalize_values(self, spec, values):
+        field = self.provider.facade_index[spec["data"]].field_index.get(self._get_key_field(spec), None)
+        if getattr(field, "is_relation", False):
+            field = getattr(field, "target_field", None)
+
+        normalized = {}
+        for value in values:
+            if field is not None:
+                try:
+                    value = field.to_python(value)
+                except (TypeError, ValueError, ValidationError):
+                    continue
+            if value is not None:
+                normalized[value] = True
+        return list(normalized.keys())
+
+    def _get_key_field(self, spec):
+        return spec.get("key_field", self.provider.facade_index[spec["data"]].key())
+
+    def _get_index_key(self, spec, scope):
+        return (
+            spec["data"],
+            self._get_key_field(spec),
+            tuple(sorted((field, str(value)) for field, value in scope.items())),
+        )
+
+
 class BaseProvider(BasePlugin("source")):
     page_count = 100
 
@@ -24,6 +138,7 @@ class BaseProvider(BasePlugin("source")):
         self.import_columns = self._get_import_columns()
 
         self.facade_index = settings.MANAGER.index.get_facade_index()
+        self.relation_resolver = RelationResolver(self)
         self.state_id = f"import:{id}:{get_identifier(config)}"
 
         self.formatter_parser = FormatterParser(id, command)
@@ -39,11 +154,18 @@ class BaseProvider(BasePlugin("source")):
 
     def process(self):
         data_map = prioritize(self.field_data, True)
+        chunks = self.load_chunks() if self.field_chunk_size else None
+
+        if chunks is not None:
+            for chunk in chunks:
+                self.update_series(data_map, {"_default": chunk})
+            return
+
         data = self.load()
 
         if data is not None:
             if isinstance(data, pandas.DataFrame):
-                data = {"_default": data.to_dict("records")}
+                data = {"_default": data}
             self.update_series(data_map, data)
         else:
             data = {}
@@ -103,10 +225,13 @@ class BaseProvider(BasePlugin("source")):
                 series_name = name
 
             series = data[series_name] if "_default" not in data else data["_default"]
-            series = copy.deepcopy(series)
             columns = self._get_import_columns(name)
 
-            if isinstance(series, (list, tuple)):
+            if isinstance(series, pandas.DataFrame):
+                series = series.reindex(columns=columns)
+
+            elif isinstance(series, (list, tuple)):
+                series = copy.deepcopy(series)
                 for index, item in enumerate(series):
                     if isinstance(item, dict):
                         series[index] = [item[column] for column in columns if column in item]
@@ -134,6 +259,10 @@ class BaseProvider(BasePlugin("source")):
         # Override in subclass
         return None  # Return a Pandas dataframe unless overriding validate method
 
+    def load_chunks(self):
+        # Override in subclass
+        return None  # Return an iterator of Pandas dataframes with at most chunk_size rows
+
     def load_contexts(self):
         # Override in subclass
         return None  # Return a list of context values
@@ -147,28 +276,39 @@ class BaseProvider(BasePlugin("source")):
         return []  # Return a list of record values or a dictionary of named record values
 
     def validate(self, name, data):
-        saved_data = []
-
-        for index, row in data.iterrows():
-            record = row.to_dict()
+        saved_data = ValidatedRecords()
+        data = data.astype(object).where(data.notna(), None)
+        series_validators = set()
 
-            for key, value in record.items():
-                if not isinstance(value, (list, tuple)) and pandas.isna(value):
-                    record[key] = None
+        valid = self._validate_series(name, data, series_validators)
+        records = data.to_dict("records")
+        positions = []
 
-            relations_ok = self._validate_relations(name, index, record)
-            fields_ok = self._validate_fields(name, index, record)
+        for position, (index, record) in enumerate(zip(data.index, records)):
+            relations_ok = self._validate_relations(name, index, record, series_validators)
+            fields_ok = self._validate_fields(name, index, record, series_validators)
 
-            if relations_ok and fields_ok:
-                saved_data.append(record)
+            if valid[position] and relations_ok and fields_ok:
+                positions.append(position)
             else:
                 self.command.warning(f"Skipping {self.id} {name} record {index}: {dump_json(record, indent=2)}")
 
+        # Formatters only see validated rows so skipped records can not abort the import
+        formatted = self._format_series(name, data.iloc[positions]) if positions else {}
+
+        for valid_position, position in enumerate(positions):
+            saved_data.append(records[position], {field: values[valid_position] for field, values in formatted.items()})
+
         return saved_data
 
     def save(self, name, records):
         if records:
             main_facade = self.command.facade(name, False)
+            formatted = getattr(records, "formatted", None)
+            bulk_save = self._check_bulk_save(name, main_facade)
+            bulk_records = []
+
+            self.relation_resolver.load(self.get_relations(name), records)
 
             for index, record in enumerate(records):
                 add_record = True
@@ -212,6 +352,8 @@ class BaseProvider(BasePlugin("source")):
 
                     if "value" in spec:
                         value = spec["value"]
+                    elif formatted and field in formatted[index]:
+                        value = formatted[index][field]
                     else:
                         value = self._get_field_value(spec, index, record)
 
@@ -230,13 +372,16 @@ class BaseProvider(BasePlugin("source")):
                     logger.info(
                         f"Saving {main_facade.name} record for {provider_type} {key_value}: [ {scope_relations} ] - {model_data}"  # noqa: E501
                     )
-                    self.command.save_instance(
-                        main_facade,
-                        key_value,
-                        fields={**multi_relations, **scope_relations, **model_data, "provider_type": provider_type},
-                        quiet=True,
-                        normalize=False,
-                    )
+                    if bulk_save:
+                        bulk_records.append((key_value, {**scope_relations, **model_data}))
+                    else:
+                        self.command.save_instance(
+                            main_facade,
+                            key_value,
+                            fields={**multi_relations, **scope_relations, **model_data, "provider_type": provider_type},
+                            quiet=True,
+                            normalize=False,
+                        )
                 else:
                     if warn_on_failure:
                         self.command.warning(
@@ -249,6 +394,22 @@ class BaseProvider(BasePlugin("source")):
                             )
                         )
 
+            if bulk_records:
+                self.command.save_instances(main_facade, bulk_records, batch_size=self.field_chunk_size)
+
+    def _check_bulk_save(self, name, facade):
+        if not self.field_chunk_size or not facade.check_bulk_store():
+            return False
+
+        for field, spec in self.get_relations(name).items():
+            if spec.get("multiple", False):
+                return False
+
+        for field in self.get_map(name).keys():
+            if field == "provider_type" or "__" in field or "." in field:
+                return False
+        return True
+
     def _get_column(self, column_spec):
         if isinstance(column_spec, dict):
             return column_spec.get("column", None)
@@ -301,17 +462,20 @@ class BaseProvider(BasePlugin("source")):
         if "value" in spec:
             return spec["value"]
 
-        facade = self.command.facade(spec["data"], False)
-        key_field = spec.get("key_field", facade.key())
-        multiple = spec.get("multiple", False)
-        relation_filters = {}
+        lookup = self._get_relation_lookup(spec, index, record)
+        if lookup is None:
+            return None
+
+        return self.relation_resolver.resolve(spec, *lookup)
+
+    def _get_relation_lookup(self, spec, index, record):
         scope_filters = {}
         value = None
 
         if spec.get("column", None):
             value = record[spec["column"]]
         if value is None:
-            return value
+            return None
 
         if spec.get("scope", False):
             for scope_field, scope_spec in spec["scope"].items():
@@ -322,46 +486,21 @@ class BaseProvider(BasePlugin("source")):
                 else:
                     scope_filters[scope_field] = self.formatter_parser.parse(scope_field, scope_spec, record)
 
-            facade.set_scope(scope_filters)
-
-        if value is not None:
-            if multiple and not isinstance(value, (list, tuple)):
-                value = str(value).split(spec.get("separator", ","))
-
-            if "formatter" in spec:
-                value = self._get_formatter_value(index, spec["column"], spec["formatter"], value, record)
+        if spec.get("multiple", False) and not isinstance(value, (list, tuple)):
+            value = str(value).split(spec.get("separator", ","))
 
-            if multiple:
-                relation_filters[f"{key_field}__in"] = value
-            else:
-                relation_filters[key_field] = value
-
-        relation_data = list(facade.values(facade.pk, **relation_filters))
-        value = None
-
-        if relation_data:
-            if multiple:
-                value = []
-                for item in relation_data:
-                    value.append(item[facade.pk])
-            else:
-                value = relation_data[0][facade.pk]
+        if "formatter" in spec:
+            value = self._get_formatter_value(index, spec["column"], spec["formatter"], value, record)
 
-        return value
+        return (scope_filters, ensure_list(value))
 
     def _get_field_value(self, spec, index, record):
         value = []
         for column in ensure_list(spec["column"]):
-            column_value = record[column]
-
-            if isinstance(column_value, Timestamp):
-                column_value = column_value.to_pydatetime()
+            column_value = self._normalize_value(record[column])
 
             if isinstance(column_value, datetime.datetime):
-                if not column_value.tzinfo:
-                    record[column] = make_aware(column_value)
-                else:
-                    record[column] = column_value
+                record[column] = column_value
 
             value.append(record[column])
 
@@ -376,7 +515,70 @@ class BaseProvider(BasePlugin("source")):
                 value = self._get_formatter_value(index, spec["column"], spec["formatter"], value, record)
         return value
 
-    def _validate_relations(self, name, index, record):
+    def _normalize_value(self, value):
+        if isinstance(value, Timestamp):
+            value = value.to_pydatetime()
+
+        if isinstance(value, datetime.datetime) and not value.tzinfo:
+            value = make_aware(value)
+        return value
+
+    def _get_series_column(self, data, column):
+        columns = ensure_list(column)
+        if len(columns) == 1 and columns[0] in data.columns:
+            return columns[0]
+        return None
+
+    def _validate_series(self, name, data, series_validators):
+        valid = numpy.ones(len(data.index), dtype=bool)
+
+        def validate_column(key, column, validators):
+            column = self._get_series_column(data, column)
+            if column is not None:
+                for provider, config in validators.items():
+                    series_valid = self._get_validator(f"{name}:{column}", provider, config).validate_series(
+                        data[column], data
+                    )
+                    if series_valid is not None:
+                        valid[:] &= series_valid.to_numpy(dtype=bool)
+                        series_validators.add((*key, provider))
+
+        for relation_field, relation_spec in self.get_relations(name).items():
+            if "validators" in relation_spec and not relation_spec.get("multiple", False):
+                validate_column(("relation", relation_field), relation_spec["column"], relation_spec["validators"])
+
+        for field, column_spec in self.get_map(name).items():
+            if isinstance(column_spec, dict) and "validators" in column_spec:
+                validate_column(("field", field), column_spec["column"], column_spec["validators"])
+
+        return valid
+
+    def _format_series(self, name, data):
+        formatted = {}
+
+        for field, spec in self.get_map(name).items():
+            if isinstance(spec, dict) and "formatter" in spec and "value" not in spec:
+                column = self._get_series_column(data, spec["column"])
+                if column is None:
+                    continue
+
+                values = data[column].map(self._normalize_value)
+                for formatter_spec in ensure_list(spec["formatter"]):
+                    if isinstance(formatter_spec, str):
+                        formatter_spec = {"provider": formatter_spec}
+
+                    values = self._get_formatter(
+                        f"{name}:{column}", formatter_spec.get("provider", "base"), formatter_spec
+                    ).format_series(values, data)
+                    if values is None:
+                        break
+
+                if values is not None:
+                    formatted[field] = values.tolist()
+
+        return formatted
+
+    def _validate_relations(self, name, index, record, series_validators=None):
         success = True
 
         for relation_field, relation_spec in self.get_relations(name).items():
@@ -390,16 +592,26 @@ class BaseProvider(BasePlugin("source")):
                         column_value = str(column_value).split(separator)
 
                 for provider, config in relation_spec["validators"].items():
+                    if series_validators and ("relation", relation_field, provider) in series_validators:
+                        continue
                     if not self._run_validator(validator_id, provider, config, column_value, record):
                         success = False
 
         return success
 
-    def _validate_fields(self, name, index, record):
+    def _validate_fields(self, name, index, record, series_validators=None):
         success = True
 
         for field, column_spec in self.get_map(name).items():
             if isinstance(column_spec, dict) and "validators" in column_spec:
+                validators = {
+                    provider: config
+                    for provider, config in column_spec["validators"].items()
+                    if not series_validators or ("field", field, provider) not in series_validators
+                }
+                if not validators:
+                    continue
+
                 validator_id = "{}:{}:{}".format(name, index, column_spec["column"])
                 column_values = []
 
@@ -414,23 +626,29 @@ class BaseProvider(BasePlugin("source")):
                 if len(column_values) == 1:
                     column_values = column_values[0]
 
-                for provider, config in column_spec["validators"].items():
+                for provider, config in validators.items():
                     if not self._run_validator(validator_id, provider, config, column_values, record):
                         success = False
 
         return success
 
-    def _run_validator(self, id, provider, config, value, record):
+    def _get_validator(self, id, provider, config):
         if config is None:
             config = {}
         config["id"] = f"{self.id}:{id}"
-        return self.command.get_provider("validator", provider, config).validate(value, record)
+        return self.command.get_provider("validator", provider, config)
 
-    def _run_formatter(self, id, provider, config, value, record):
+    def _run_validator(self, id, provider, config, value, record):
+        return self._get_validator(id, provider, config).validate(value, record)
+
+    def _get_formatter(self, id, provider, config):
         if config is None:
             config = {}
         config["id"] = f"{self.id}:{id}"
-        return self.command.get_provider("formatter", provider, config).format(value, record)
+        return self.command.get_provider("formatter", provider, config)
+
+    def _run_formatter(self, id, provider, config, value, record):
+        return self._get_formatter(id, provider, config).format(value, record)
 
     def _get_formatter_value(self, index, column, spec, value, record):
         if isinstance(spec, str):
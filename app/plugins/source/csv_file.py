@@ -11,3 +11,14 @@ class Provider(BaseProvider("source", "csv_file")):
             data_type=self.field_data_type,
             header=self.field_header,
         )
+
+    def load_chunks(self):
+        return self.load_csv_data_from_file(
+            self.field_file,
+            self.import_columns,
+            archive_file=self.field_archive_file,
+            separator=self.field_separator,
+            data_type=self.field_data_type,
+            header=self.field_header,
+            chunk_size=self.field_chunk_size,
+        )
@@ -1,4 +1,7 @@
+import pandas
+from django.core.exceptions import ValidationError
 from systems.plugins.index import BasePlugin
+from utility.data import iterate_chunks
 
 
 class BaseProvider(BasePlugin("validator")):
@@ -10,5 +13,50 @@ class BaseProvider(BasePlugin("validator")):
         # Override in subclass.
         return True
 
-    def warning(self, message):
-        self.command.warning(f"Validator {self.name} {self.field_id} failed: {message}")
+    def validate_series(self, values, data):
+        # Override in subclass with a boolean Series of valid values (None validates each value)
+        return None
+
+    def warning(self, message, index=None):
+        id = self.field_id if index is None else f"{self.field_id}[{index}]"
+        self.command.warning(f"Validator {self.name} {id} failed: {message}")
+
+    def warning_series(self, invalid, values, message):
+        for index, value in values[invalid].items():
+            self.warning(message(value), index)
+        return ~invalid
+
+    def get_existing_values(self, values, data, query_size=1000):
+        # Only queryable per column when scope values do not reference record columns
+        scope = self.field_scope if self.field_scope else {}
+        if any(scope_value in data.columns for scope_value in scope.values()):
+            return None
+
+        facade = self.command.facade(self.field_data, False)
+        if scope:
+            facade = facade.scope(scope)
+
+        field = self.field_field if self.field_field else facade.key()
+        values = self.normalize_series(facade, field, values)
+        existing = set()
+
+        for chunk in iterate_chunks(list(dict.fromkeys(values.dropna())), query_size):
+            existing.update(facade.field_values(field, **{f"{field}__in": chunk}))
+
+        return field, values.isin(existing) & values.notna(), f"within scope {scope}" if scope else ""
+
+    def normalize_series(self, facade, field, values):
+        # Convert values to the model field type so pandas floats match integer keys
+        model_field = facade.field_index.get(field, None)
+        if getattr(model_field, "is_relation", False):
+            model_field = getattr(model_field, "target_field", None)
+
+        def normalize(value):
+            if value is None or model_field is None:
+                return value
+            try:
+                return model_field.to_python(value)
+            except (TypeError, ValueError, ValidationError):
+                return None
+
+        return pandas.Series([normalize(value) for value in values], index=values.index, dtype=object)
@@ -1,5 +1,8 @@
 import datetime
+import math
 
+import numpy
+import pandas
 from systems.plugins.index import BaseProvider
 from utility.data import ensure_list
 
@@ -11,16 +14,44 @@ class Provider(BaseProvider("validator", "date_time")):
             return False
 
         if value:
-            if isinstance(value, float):
-                value = int(value)
+            if not self.check_format(self.get_string(value)):
+                self.warning(f"Value {value} is not a valid date time according to pattern: {self.field_format}")
+                return False
+        return True
 
-            for date_format in ensure_list(self.field_format):
-                try:
-                    datetime.datetime.strptime(str(value), date_format)
-                    return True
-                except ValueError as e:
-                    pass
+    def validate_series(self, values, data):
+        present = values.notna() & values.astype(bool)
+        valid = pandas.Series(True, index=values.index)
 
-            self.warning(f"Value {value} is not a valid date time according to pattern: {self.field_format}")
-            return False
-        return True
+        if not self.field_empty:
+            valid = self.warning_series(~present, values, lambda value: "Empty strings not allowed")
+
+        strings = values.where(present, "").map(self.get_string)
+        parsed = pandas.Series(False, index=values.index)
+
+        for date_format in ensure_list(self.field_format):
+            parsed |= pandas.to_datetime(strings, format=date_format, errors="coerce").notna()
+
+        # Dates outside of the pandas timestamp range (1677 - 2262) are coerced to NaT
+        for position in numpy.flatnonzero(present & ~parsed):
+            parsed.iloc[position] = self.check_format(strings.iloc[position])
+
+        return valid & self.warning_series(
+            present & ~parsed,
+            values,
+            lambda value: f"Value {value} is not a valid date time according to pattern: {self.field_format}",
+        )
+
+    def get_string(self, value):
+        if isinstance(value, float) and math.isfinite(value):
+            value = int(value)
+        return str(value)
+
+    def check_format(self, value):
+        for date_format in ensure_list(self.field_format):
+            try:
+                datetime.datetime.strptime(value, date_format)
+                return True
+            except ValueError:
+                pass
+        return False
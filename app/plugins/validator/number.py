@@ -1,16 +1,17 @@
 import math
 
+import numpy
+import pandas
 from systems.plugins.index import BaseProvider
-from utility.data import number
 
 
 class Provider(BaseProvider("validator", "number")):
     def validate(self, value, record):
-        try:
-            value = number(value)
-        except (ValueError, TypeError):
+        number = self.parse_number(value)
+        if number is None:
             self.warning(f"Value {value} is not a number")
             return False
+        value = number
 
         if not self.field_nan and math.isnan(value):
             self.warning("Value can not be NaN")
@@ -27,3 +28,43 @@ class Provider(BaseProvider("validator", "number")):
                 return False
 
         return True
+
+    def validate_series(self, values, data):
+        numbers = pandas.to_numeric(values, errors="coerce").to_numpy(dtype=float, copy=True)
+        not_numbers = numpy.zeros(len(values), dtype=bool)
+
+        # Values pandas can not convert are parsed the same way as validate() (NaN strings, digit separators)
+        for position in numpy.flatnonzero(numpy.isnan(numbers)):
+            number = self.parse_number(values.iloc[position])
+            if number is None:
+                not_numbers[position] = True
+            else:
+                numbers[position] = number
+
+        numbers = pandas.Series(numbers, index=values.index)
+        not_numbers = pandas.Series(not_numbers, index=values.index)
+
+        valid = self.warning_series(not_numbers, values, lambda value: f"Value {value} is not a number")
+        if not self.field_nan:
+            valid &= self.warning_series(numbers.isna() & ~not_numbers, values, lambda value: "Value can not be NaN")
+
+        if self.field_min is not None:
+            valid &= self.warning_series(
+                valid & (numbers < self.field_min),
+                values,
+                lambda value: f"Value {value} is below minimum allowed: {self.field_min}",
+            )
+        if self.field_max is not None:
+            valid &= self.warning_series(
+                valid & (numbers > self.field_max),
+                values,
+                lambda value: f"Value {value} is above maximum allowed: {self.field_max}",
+            )
+        return valid
+
+    def parse_number(self, value):
+        # Floats are compared untruncated against the minimum and maximum
+        try:
+            return float(value)
+        except (ValueError, TypeError, OverflowError):
+            return None
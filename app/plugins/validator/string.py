@@ -20,3 +20,17 @@ class Provider(BaseProvider("validator", "string")):
                 return False
 
         return True
+
+    def validate_series(self, values, data):
+        strings = values.map(lambda value: isinstance(value, str))
+        valid = self.warning_series(~strings, values, lambda value: f"Value {value} is not a string")
+
+        if not self.field_empty:
+            valid &= self.warning_series(valid & values.eq(""), values, lambda value: "Empty strings not allowed")
+
+        if self.field_pattern:
+            matches = values.where(valid, "").str.match(self.field_pattern).fillna(False).astype(bool)
+            valid &= self.warning_series(
+                valid & ~matches, values, lambda value: f"Value {value} does not match pattern: {self.field_pattern}"
+            )
+        return valid
@@ -19,7 +19,7 @@ class Provider(BaseProvider("validator", "unique")):
                     scope_value = record[scope_value]
                 scope[scope_field] = scope_value
 
-            facade.set_scope(scope)
+            facade = facade.scope(scope)
             scope_text = f"within scope {scope}"
 
         field = self.field_field if self.field_field else facade.key()
@@ -29,3 +29,16 @@ class Provider(BaseProvider("validator", "unique")):
             self.warning(f"Model {self.field_data} {field}: {value} already exists {scope_text}")
             return False
         return True
+
+    def validate_series(self, values, data):
+        lookup = self.get_existing_values(values, data)
+        if lookup is None:
+            return None
+
+        field, exists, scope_text = lookup
+        valid = self.warning_series(values.isna(), values, lambda value: "Value can not be nothing to check for duplicate")
+        return valid & self.warning_series(
+            values.notna() & exists,
+            values,
+            lambda value: f"Model {self.field_data} {field}: {value} already exists {scope_text}",
+        )
@@ -1,11 +1,130 @@
+import collections
+import logging
+import math
 import re
+import threading
+from datetime import timedelta
 
 from django.conf import settings
-from systems.celery.worker import RedisConnectionMixin
+from django.utils import timezone
+from systems.celery.worker import RedisConnectionMixin, worker_reserve_key
 from systems.plugins.index import BasePlugin
 from utility.data import create_token
 from utility.time import Time
 
+logger = logging.getLogger(__name__)
+
+
+class ScalingPolicy:
+    name = "reactive"
+
+    def __init__(self, worker_type, history=None):
+        self.worker_type = worker_type
+
+        for created, task_count, task_rate in history or []:
+            self.record(created, task_count, task_rate)
+
+    def record(self, time, task_count, task_rate):
+        # Reactive scaling only considers the current queue
+        pass
+
+    def get_task_workers(self, task_count, task_rate):
+        # Size for queued tasks plus those expected to arrive before the next scaling cycle
+        expected_tasks = (task_count or 0) + ((task_rate or 0) * settings.WORKER_SCALE_INTERVAL)
+        return math.ceil(expected_tasks / max(settings.WORKER_TASKS_PER_WORKER, 1))
+
+    def get_worker_desired(self, time, task_count, task_rate):
+        return max(self.get_task_workers(task_count, task_rate), 1)
+
+    def get_worker_reserve(self, time):
+        return 0
+
+
+class PredictiveScalingPolicy(ScalingPolicy):
+    name = "predictive"
+
+    def __init__(self, worker_type, history=None):
+        self.task_rate = 0.0
+        self.demand = {}
+        self.peaks = collections.deque()
+        super().__init__(worker_type, history)
+
+    def record(self, time, task_count, task_rate):
+        smoothing = settings.WORKER_SCALING_SMOOTHING
+        bucket, day = self._get_bucket(time)
+
+        self.task_rate = (smoothing * (task_rate or 0)) + ((1 - smoothing) * self.task_rate)
+        self.demand[bucket] = (max(self._get_demand(bucket, day), self.get_task_workers(task_count, task_rate)), day)
+
+    def get_worker_desired(self, time, task_count, task_rate):
+        worker_desired = max(
+            super().get_worker_desired(time, task_count, max(task_rate or 0, self.task_rate)),
+            self.get_forecast(time),
+        )
+        # Monotonic queue of the largest recent decisions so scaling down waits out short lulls
+        while self.peaks and self.peaks[-1][1] <= worker_desired:
+            self.peaks.pop()
+        self.peaks.append((time, worker_desired))
+        return self._get_peak(time)
+
+    def get_worker_reserve(self, time):
+        return max(self.get_forecast(time), self._get_peak(time))
+
+    def get_forecast(self, time):
+        bucket_seconds = max(settings.WORKER_SCALING_BUCKET_MINUTES, 1) * 60
+        forecast = 0
+
+        # Check every time of day bucket that starts before prewarmed workers would be ready
+        for offset in [*range(0, settings.WORKER_PREWARM_SECONDS, bucket_seconds), settings.WORKER_PREWARM_SECONDS]:
+            forecast = max(forecast, self._get_demand(*self._get_bucket(time + timedelta(seconds=offset))))
+        return math.ceil(forecast)
+
+    def _get_peak(self, time):
+        while self.peaks and self.peaks[0][0] < time - timedelta(seconds=settings.WORKER_SCALE_DOWN_DELAY):
+            self.peaks.popleft()
+        return self.peaks[0][1] if self.peaks else 0
+
+    def _get_bucket(self, time):
+        time = timezone.localtime(time)
+        return ((time.hour * 60) + time.minute) // max(settings.WORKER_SCALING_BUCKET_MINUTES, 1), time.toordinal()
+
+    def _get_demand(self, bucket, day):
+        if bucket not in self.demand:
+            return 0
+
+        demand, demand_day = self.demand[bucket]
+        # Daily bursts are carried forward at full strength while one off bursts fade each day they do not recur
+        return demand * ((1 - settings.WORKER_SCALING_SMOOTHING) ** max(day - demand_day - 1, 0))
+
+
+SCALING_POLICIES = {policy.name: policy for policy in (ScalingPolicy, PredictiveScalingPolicy)}
+
+_scaling_policies = {}
+_scaling_policy_lock = threading.Lock()
+
+
+def get_scaling_policy(command, worker_type, name=None, history=None):
+    name = name if name else settings.WORKER_SCALING_POLICY
+    if name not in SCALING_POLICIES:
+        command.error(f"Worker scaling policy {name} is not supported: {', '.join(SCALING_POLICIES.keys())}")
+
+    if history is not None:
+        return SCALING_POLICIES[name](worker_type, history)
+
+    with _scaling_policy_lock:
+        policy_key = (name, worker_type)
+        policy_info = _scaling_policies.get(policy_key, None)
+        if policy_info and policy_info[0] > timezone.now():
+            return policy_info[1]
+
+    policy = SCALING_POLICIES[name](
+        worker_type,
+        command.facade("scaling_event", False).get_history(worker_type, settings.WORKER_SCALING_HISTORY_DAYS),
+    )
+    with _scaling_policy_lock:
+        _scaling_policies[policy_key] = (timezone.now() + timedelta(seconds=settings.WORKER_SCALING_HISTORY_REFRESH), policy)
+    return policy
+
 
 class BaseProvider(RedisConnectionMixin, BasePlugin("worker")):
     def __init__(self, type, name, command, app, **config):
@@ -72,39 +191,110 @@ class BaseProvider(RedisConnectionMixin, BasePlugin("worker")):
         return 0
 
     def get_task_count(self):
-        task_count = 0
-        for key in self.connection().scan_iter(f"{self.field_worker_type}*"):
-            task_count += self.connection().llen(key)
-        return task_count
+        connection = self.connection()
+        pipeline = connection.pipeline(transaction=False)
+        for key in self.get_queue_keys():
+            pipeline.llen(key)
+        return sum(pipeline.execute())
 
-    def ensure(self):
+    def get_queue_keys(self):
+        from kombu.transport.redis import DEFAULT_PRIORITY_STEPS, Channel
+
+        # Redis transport stores each priority step of a queue in a separate list
+        priority_steps = settings.CELERY_BROKER_TRANSPORT_OPTIONS.get("priority_steps", DEFAULT_PRIORITY_STEPS)
+        return [
+            f"{self.field_worker_type}{Channel.sep}{step}" if step else self.field_worker_type for step in priority_steps
+        ]
+
+    @property
+    def scaling_policy(self):
+        return get_scaling_policy(self.command, self.field_worker_type)
+
+    def ensure(self, task_rate=0):
         def ensure_workers():
-            count = self.check_workers()
+            count = self.check_workers(task_rate)
+            if count:
+                self.start_workers(count)
+            return count
+
+        if self.connection():
+            return self.command.run_exclusive("ensure_workers", ensure_workers)
+        return 0
+
+    def prewarm(self):
+        def prewarm_workers():
+            worker_reserve = self.set_worker_reserve(self.scaling_policy.get_worker_reserve(timezone.now()))
+            count = max(worker_reserve - self.get_worker_count(), 0)
             if count:
                 self.start_workers(count)
+            return count
 
         if self.connection():
-            self.command.run_exclusive("ensure_workers", ensure_workers)
+            return self.command.run_exclusive("ensure_workers", prewarm_workers)
+        return 0
 
-    def check_workers(self):
+    def check_workers(self, task_rate=0):
+        policy = self.scaling_policy
+        now = timezone.now()
         worker_count = self.get_worker_count()
         task_count = self.get_task_count()
-        worker_max_created = settings.WORKER_MAX_COUNT - worker_count
-        workers_created = 1 if worker_count == 0 or (task_count > 0 and worker_max_created > 0) else 0
+        worker_max_created = max(settings.WORKER_MAX_COUNT - worker_count, 0)
+
+        worker_desired = policy.get_worker_desired(now, task_count, task_rate)
+        workers_created = min(max(worker_desired - worker_count, 0), worker_max_created)
+        policy.record(now, task_count, task_rate)
+        self.set_worker_reserve(policy.get_worker_reserve(now))
 
         worker_metrics = {
             "command": self.field_command_name,
             "worker_type": self.field_worker_type,
             "worker_max_count": settings.WORKER_MAX_COUNT,
             "worker_count": worker_count,
+            "worker_desired": worker_desired,
             "task_count": task_count,
+            "task_rate": round(task_rate, 3),
             "worker_max_created": worker_max_created,
             "workers_created": workers_created,
         }
-        print(worker_metrics)
+        logger.info(f"Worker scaling metrics: {worker_metrics}")
         self.command.send("worker:scaling", worker_metrics)
         return workers_created
 
+    def set_worker_reserve(self, count):
+        count = min(count, settings.WORKER_MAX_COUNT)
+        if count > 0:
+            # Idle workers within the reserve stay running until it lapses
+            self.connection().set(
+                worker_reserve_key(self.field_worker_type), count, ex=max(settings.WORKER_SCALE_DOWN_DELAY, 1)
+            )
+        return count
+
+    def simulate_scaling(self, policy_name, history):
+        policy = get_scaling_policy(self.command, self.field_worker_type, policy_name, history=[])
+        metrics = {"events": 0, "cold_starts": 0, "worker_shortfall": 0, "worker_peak": 0, "worker_hours": 0.0}
+        worker_count = 0
+        last_time = None
+
+        for created, task_count, task_rate in history:
+            if last_time:
+                metrics["worker_hours"] += worker_count * (created - last_time).total_seconds() / 3600
+
+            # Workers requested at the previous event are warm while any additional demand waits on a cold start
+            worker_demand = min(policy.get_task_workers(task_count, task_rate), settings.WORKER_MAX_COUNT)
+            if worker_demand > worker_count:
+                metrics["cold_starts"] += 1
+                metrics["worker_shortfall"] += worker_demand - worker_count
+
+            worker_desired = policy.get_worker_desired(created, task_count, task_rate)
+            policy.record(created, task_count, task_rate)
+            worker_count = min(max(worker_desired, policy.get_worker_reserve(created)), settings.WORKER_MAX_COUNT)
+
+            metrics["events"] += 1
+            metrics["worker_peak"] = max(metrics["worker_peak"], worker_count)
+            last_time = created
+
+        return metrics
+
     def start_workers(self, count):
         time = Time(date_format="%Y%m%d", time_format="%H%M%S", spacer="")
 
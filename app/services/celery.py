@@ -44,11 +44,8 @@ def capture_service_name(sender, instance, **kwargs):
 
 @before_task_publish.connect
 def task_sent_handler(sender, headers=None, body=None, **kwargs):
-    from django.conf import settings
-    from systems.commands.action import ActionCommand
+    from systems.celery.worker import get_worker_scaler
 
-    active_command = settings.MANAGER.active_command
-    worker_command = ActionCommand("worker")
     queue = None
 
     for entity in kwargs["declare"]:
@@ -57,18 +54,8 @@ def task_sent_handler(sender, headers=None, body=None, **kwargs):
             break
     if queue and body and body[0] and body[1]:
         logger.info(f"Executing worker {queue} task with: {dump_json(body, indent=2)}")
-        try:
-            worker = worker_command.get_provider(
-                "worker", settings.WORKER_PROVIDER, app, worker_type=queue, command_name=body[0][0], command_options=body[1]
-            )
-            worker.ensure()
-
-        except Exception as e:
-            if active_command:
-                active_command.error(f"Worker processor failed to start: {e}", terminate=False)
-                active_command.set_status(False)
-                active_command.log_status(False)
-                active_command.publish_exit()
+        # Workers are scaled out of band so publishing stays fast for large task batches
+        get_worker_scaler(app).add(queue, body[0][0], body[1])
 
 
 @worker_shutting_down.connect
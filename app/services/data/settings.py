@@ -41,4 +41,5 @@ REST_FRAMEWORK = {
 }
 
 LIMIT_PARAM = "limit"
+OFFSET_PARAM = "offset"
 FIELDS_PARAM = "fields"
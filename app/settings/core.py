@@ -68,8 +68,11 @@ ENCRYPT_DATA_API = Config.boolean("ZIMAGI_ENCRYPT_DATA_API", False)
 
 PARALLEL = Config.boolean("ZIMAGI_PARALLEL", True)
 THREAD_COUNT = Config.integer("ZIMAGI_THREAD_COUNT", 10)
+PARALLEL_MAX_THREADS = Config.integer("ZIMAGI_PARALLEL_MAX_THREADS", THREAD_COUNT * 4)
+PARALLEL_THREAD_IDLE_TIMEOUT = Config.integer("ZIMAGI_PARALLEL_THREAD_IDLE_TIMEOUT", 300)
 QUEUE_COMMANDS = Config.boolean("ZIMAGI_QUEUE_COMMANDS", True)
 FOLLOW_QUEUE_COMMAND = Config.boolean("ZIMAGI_FOLLOW_QUEUE_COMMAND", True)
+LAZY_GENERATION = Config.boolean("ZIMAGI_LAZY_GENERATION", APP_SERVICE == "cli")
 
 NO_MIGRATE = Config.boolean("ZIMAGI_NO_MIGRATE", False)
 AUTO_MIGRATE_TIMEOUT = Config.integer("ZIMAGI_AUTO_MIGRATE_TIMEOUT", 300)
@@ -143,6 +146,9 @@ if COLOR_SOLARIZED:
 BASE_DATA_PATH = os.path.join(DATA_DIR, "cli")
 RUNTIME_PATH = f"{BASE_DATA_PATH}.yml"
 
+SPEC_CACHE = Config.boolean("ZIMAGI_SPEC_CACHE", True)
+SPEC_CACHE_PATH = Config.string("ZIMAGI_SPEC_CACHE_PATH", os.path.join(DATA_DIR, "cache", "spec.pickle"))
+
 DEFAULT_HOST_NAME = Config.string("ZIMAGI_DEFAULT_HOST_NAME", "default")
 TEST_HOST_NAME = Config.string("ZIMAGI_TEST_HOST_NAME", "test")
 DEFAULT_RUNTIME_IMAGE = Config.string("ZIMAGI_DEFAULT_RUNTIME_IMAGE", "zimagi/server:latest")
@@ -211,6 +217,8 @@ LOGGING = {
 
 LOG_RETENTION_DAYS = Config.integer("ZIMAGI_LOG_RETENTION_DAYS", 30)
 LOG_MESSAGE_RETENTION_DAYS = Config.integer("ZIMAGI_LOG_MESSAGE_RETENTION_DAYS", 10)
+LOG_MESSAGE_BATCH_SIZE = Config.integer("ZIMAGI_LOG_MESSAGE_BATCH_SIZE", 500)
+LOG_MESSAGE_FLUSH_INTERVAL = Config.decimal("ZIMAGI_LOG_MESSAGE_FLUSH_INTERVAL", 1)
 
 #
 # System check settings
@@ -247,6 +255,17 @@ WORKER_CHECK_INTERVAL = Config.integer("ZIMAGI_WORKER_CHECK_INTERVAL", 2)
 
 WORKER_DEFAULT_TASK_PRIORITY = Config.integer("ZIMAGI_WORKER_DEFAULT_TASK_PRIORITY", 5)
 WORKER_MAX_COUNT = Config.integer("ZIMAGI_WORKER_MAX_COUNT", 20)
+WORKER_TASKS_PER_WORKER = Config.integer("ZIMAGI_WORKER_TASKS_PER_WORKER", 5)
+WORKER_SCALE_INTERVAL = Config.decimal("ZIMAGI_WORKER_SCALE_INTERVAL", 10)
+WORKER_SCALE_DEBOUNCE = Config.decimal("ZIMAGI_WORKER_SCALE_DEBOUNCE", 0.5)
+WORKER_SCALE_DOWN_DELAY = Config.integer("ZIMAGI_WORKER_SCALE_DOWN_DELAY", 600)
+WORKER_PREWARM_SECONDS = Config.integer("ZIMAGI_WORKER_PREWARM_SECONDS", 300)
+
+WORKER_SCALING_POLICY = Config.string("ZIMAGI_WORKER_SCALING_POLICY", "reactive")
+WORKER_SCALING_HISTORY_DAYS = Config.integer("ZIMAGI_WORKER_SCALING_HISTORY_DAYS", 14)
+WORKER_SCALING_HISTORY_REFRESH = Config.integer("ZIMAGI_WORKER_SCALING_HISTORY_REFRESH", 900)
+WORKER_SCALING_BUCKET_MINUTES = Config.integer("ZIMAGI_WORKER_SCALING_BUCKET_MINUTES", 15)
+WORKER_SCALING_SMOOTHING = Config.decimal("ZIMAGI_WORKER_SCALING_SMOOTHING", 0.3)
 AGENT_MAX_LIFETIME = Config.integer("ZIMAGI_AGENT_MAX_LIFETIME", 86400)
 
 #
@@ -254,6 +273,11 @@ AGENT_MAX_LIFETIME = Config.integer("ZIMAGI_AGENT_MAX_LIFETIME", 86400)
 #
 FIELD_TYPE_MAP = Config.dict("ZIMAGI_FIELD_TYPE_MAP", {})
 
+#
+# SSH configuration
+#
+SSH_MAX_CHANNELS = Config.integer("ZIMAGI_SSH_MAX_CHANNELS", 8)
+
 #
 # GitHub configuration
 #
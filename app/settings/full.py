@@ -126,6 +126,10 @@ DB_LOCK = threading.Semaphore(DB_MAX_CONNECTIONS)
 
 DB_SNAPSHOT_RENTENTION = Config.integer("ZIMAGI_DB_SNAPSHOT_RENTENTION", 3)
 
+QUERY_PARSER_CACHE_SIZE = Config.integer("ZIMAGI_QUERY_PARSER_CACHE_SIZE", 1000)
+
+CALCULATION_VECTOR_BATCH_SIZE = Config.integer("ZIMAGI_CALCULATION_VECTOR_BATCH_SIZE", 1000)
+
 #
 # Redis configurations
 #
@@ -200,6 +204,10 @@ CACHE_MIDDLEWARE_SECONDS = Config.integer("ZIMAGI_PAGE_CACHE_SECONDS", 86400)  #
 
 CACHE_PARAM = "refresh"
 
+RECORD_CACHE_SECONDS = Config.decimal("ZIMAGI_RECORD_CACHE_SECONDS", 300)
+RECORD_CACHE_LOCAL_SECONDS = Config.decimal("ZIMAGI_RECORD_CACHE_LOCAL_SECONDS", 5)
+RECORD_CACHE_RECONNECT_INTERVAL = Config.decimal("ZIMAGI_RECORD_CACHE_RECONNECT_INTERVAL", 5)
+
 #
 # Email configuration
 #
@@ -228,6 +236,15 @@ ALLOWED_HOSTS = Config.list("ZIMAGI_ALLOWED_HOSTS", ["*"])
 
 REST_PAGE_COUNT = Config.integer("ZIMAGI_REST_PAGE_COUNT", 50)
 REST_API_TEST = Config.boolean("ZIMAGI_REST_API_TEST", False)
+DATA_API_EXPORT_CHUNK_SIZE = Config.integer("ZIMAGI_DATA_API_EXPORT_CHUNK_SIZE", 1000)
+
+COMMAND_API_MESSAGE_BATCH = Config.boolean("ZIMAGI_COMMAND_API_MESSAGE_BATCH", True)
+COMMAND_API_MESSAGE_BATCH_SIZE = Config.integer("ZIMAGI_COMMAND_API_MESSAGE_BATCH_SIZE", 100)
+COMMAND_API_FLUSH_WINDOW = Config.decimal("ZIMAGI_COMMAND_API_FLUSH_WINDOW", 0.05)
+
+API_TOKEN_CACHE_SECONDS = Config.integer("ZIMAGI_API_TOKEN_CACHE_SECONDS", 60)
+API_TOKEN_CACHE_SIZE = Config.integer("ZIMAGI_API_TOKEN_CACHE_SIZE", 10000)
+API_LAST_LOGIN_INTERVAL = Config.integer("ZIMAGI_API_LAST_LOGIN_INTERVAL", 60)
 
 CORS_ALLOWED_ORIGINS = Config.list("ZIMAGI_CORS_ALLOWED_ORIGINS", [])
 CORS_ALLOWED_ORIGIN_REGEXES = Config.list("ZIMAGI_CORS_ALLOWED_ORIGIN_REGEXES", [])
@@ -1,14 +1,43 @@
+import datetime
+import hashlib
+import hmac
 import logging
 import re
+import time
 
+from django.conf import settings
 from django.utils.timezone import now
 from rest_framework import authentication, exceptions
 from systems.encryption.cipher import Cipher
 from systems.models.index import Model
+from utility.data import LRUCache
 
 logger = logging.getLogger(__name__)
 
 
+class TokenCache:
+    def __init__(self):
+        self.tokens = LRUCache(settings.API_TOKEN_CACHE_SIZE)
+
+    def get_key(self, user, token):
+        # Stored password hash is part of the digest so rotated credentials never match
+        message = "\0".join([user.name, user.password or "", str(token)])
+        return hmac.new(settings.SECRET_KEY.encode(), message.encode(), hashlib.sha256).hexdigest()
+
+    def check(self, user, token):
+        expiration = self.tokens.get(self.get_key(user, token))
+        return expiration is not None and expiration > time.monotonic()
+
+    def add(self, user, token):
+        self.tokens.set(self.get_key(user, token), time.monotonic() + settings.API_TOKEN_CACHE_SECONDS)
+
+    def clear(self):
+        self.tokens.clear()
+
+
+token_cache = TokenCache()
+
+
 class APITokenAuthentication(authentication.TokenAuthentication):
     user_class = Model("user")
     api_type = None
@@ -53,11 +82,29 @@ class APITokenAuthentication(authentication.TokenAuthentication):
 
         if not user.is_active:
             raise exceptions.AuthenticationFailed("User account is inactive. Contact administrator")
-        if not user.check_password(token):
+        if not self.check_token(user, token):
             raise exceptions.AuthenticationFailed("Invalid token: User credentials are invalid")
 
-        user.last_login = now()
-        user.save()
+        self.update_last_login(user)
 
         self.user_class.facade.set_active_user(user)
         return (user, token)
+
+    def check_token(self, user, token):
+        if settings.API_TOKEN_CACHE_SECONDS > 0 and token_cache.check(user, token):
+            return True
+        if not user.check_password(token):
+            return False
+
+        if settings.API_TOKEN_CACHE_SECONDS > 0:
+            token_cache.add(user, token)
+        return True
+
+    def update_last_login(self, user):
+        login_time = now()
+
+        if not user.last_login or (login_time - user.last_login) >= datetime.timedelta(
+            seconds=settings.API_LAST_LOGIN_INTERVAL
+        ):
+            user.last_login = login_time
+            user.save(update_fields=["last_login"])
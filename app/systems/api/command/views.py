@@ -31,7 +31,10 @@ class Command(APIView):
             options = self._format_options(request.POST)
             command = type(self.command)(self.command.name, self.command.parent_instance).bootstrap(options)
 
-            response = StreamingHttpResponse(streaming_content=command.handle_api(options), content_type="application/json")
+            batch_messages = request.headers.get("X-Zimagi-Message-Batch", "").lower() == "true"
+            response = StreamingHttpResponse(
+                streaming_content=command.handle_api(options, batch_messages=batch_messages), content_type="application/json"
+            )
             response["Cache-Control"] = "no-cache"
             return response
 
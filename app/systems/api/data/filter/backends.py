@@ -309,9 +309,9 @@ class LimitFilterBackend(FilterValidationMixin, BaseFilterBackend):
     limit_description = "Maximum number of results to return"
 
     def filter_queryset(self, request, queryset, view):
-        limit = request.query_params.get(self.limit_param, None)
+        limit = self.get_limit(request)
         if limit:
-            queryset = queryset[: int(limit)]
+            queryset = queryset[:limit]
 
         return queryset
 
@@ -327,19 +327,56 @@ class LimitFilterBackend(FilterValidationMixin, BaseFilterBackend):
         ]
 
     def check_parameter_errors(self, view, request, action, facade):
-        limit_input = request.query_params.get(self.limit_param, None)
-        if limit_input is not None:
-            try:
-                limit = int(limit_input)
-                if limit <= 0:
-                    raise ValueError()
-
-            except ValueError:
-                return {
-                    "detail": f"{self.limit_title} parameter '{self.limit_param}' must be a positive integer greater than 0"
-                }
+        if request.query_params.get(self.limit_param, None) is not None and not self.get_limit(request):
+            return {"detail": f"{self.limit_title} parameter '{self.limit_param}' must be a positive integer greater than 0"}
+        return None
+
+    def get_limit(self, request):
+        return self._get_integer(request, self.limit_param, 1)
+
+    def _get_integer(self, request, param, minimum):
+        try:
+            value = int(request.query_params.get(param, None))
+            return value if value >= minimum else None
+
+        except (TypeError, ValueError):
+            return None
+
+
+class ValuesLimitFilterBackend(LimitFilterBackend):
+    limit_description = "Maximum number of distinct values to return"
+    offset_param = settings.OFFSET_PARAM
+    offset_title = "Offset"
+    offset_description = "Number of distinct values to skip before returning results"
+
+    def filter_queryset(self, request, queryset, view):
+        # Limit and offset are applied to distinct field values by the view
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            *super().get_schema_operation_parameters(view),
+            {
+                "name": self.offset_param,
+                "required": False,
+                "in": "query",
+                "description": force_str(self.offset_description),
+                "schema": {"type": "number"},
+            },
+        ]
+
+    def check_parameter_errors(self, view, request, action, facade):
+        error = super().check_parameter_errors(view, request, action, facade)
+        if error:
+            return error
+
+        if request.query_params.get(self.offset_param, None) is not None and self.get_offset(request) is None:
+            return {"detail": f"{self.offset_title} parameter '{self.offset_param}' must be a non-negative integer"}
         return None
 
+    def get_offset(self, request):
+        return self._get_integer(request, self.offset_param, 0)
+
 
 class SearchFilterBackend(FilterValidationMixin, SearchFilter):
     search_title = "Search"
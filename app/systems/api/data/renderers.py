@@ -1,9 +1,49 @@
+import csv
+import io
+import itertools
+import json
+
 from rest_framework import renderers
 from systems.api.encoders import SafeJSONEncoder
-from utility.data import dump_json
+from utility.data import dump_json, iterate_chunks
 
 
 class DataSchemaJSONRenderer(renderers.JSONOpenAPIRenderer):
     def render(self, data, media_type=None, renderer_context=None):
         indent = int(renderer_context.get("indent", 2))
         return dump_json(data, cls=SafeJSONEncoder, indent=indent).encode("utf-8")
+
+
+def iterate_records(queryset, chunk_size):
+    # The first chunk is fetched up front so query errors are raised before the response starts
+    chunks = iterate_chunks(queryset.iterator(chunk_size=chunk_size), chunk_size)
+    first_chunk = next(chunks, [])
+    return itertools.chain([first_chunk], chunks) if first_chunk else iter([])
+
+
+def get_record_fields(queryset):
+    return [*queryset.query.extra_select, *queryset.query.values_select, *queryset.query.annotation_select]
+
+
+def stream_csv(queryset, chunks):
+    buffer = io.StringIO()
+    writer = None
+
+    for records in chunks:
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(records[0].keys()), lineterminator="\n")
+            writer.writeheader()
+
+        writer.writerows(records)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+
+    if writer is None:
+        csv.writer(buffer, lineterminator="\n").writerow(get_record_fields(queryset))
+        yield buffer.getvalue()
+
+
+def stream_json(chunks):
+    for records in chunks:
+        yield "".join(f"{json.dumps(record, cls=SafeJSONEncoder)}\n" for record in records)
@@ -3,3 +3,7 @@ from systems.api import response as shared_responses
 
 class EncryptedResponse(shared_responses.EncryptedResponse):
     api_type = "data_api"
+
+
+class EncryptedStreamingResponse(shared_responses.EncryptedStreamingResponse):
+    api_type = "data_api"
@@ -1,9 +1,15 @@
-import copy
 from collections.abc import Mapping
+from functools import lru_cache
 
 from rest_framework import fields
 from rest_framework.relations import HyperlinkedIdentityField
-from rest_framework.serializers import HyperlinkedModelSerializer, ModelSerializer, Serializer, SerializerMethodField
+from rest_framework.serializers import (
+    HyperlinkedModelSerializer,
+    ListSerializer,
+    ModelSerializer,
+    Serializer,
+    SerializerMethodField,
+)
 from systems.commands import action
 from systems.models import fields as zimagi_fields
 from utility.data import ensure_list, normalize_value
@@ -14,8 +20,7 @@ from .fields import HyperlinkedRelatedField, JSONDataField
 def get_field_map(facade, fields=None, api_url=True, id=True, dynamic=True, short=True):
     def get_dynamic_field(field_name):
         def _dynamic_display(self, instance):
-            instance = copy.deepcopy(instance)
-            instance.initialize(self.command)
+            self.initialize_instance(instance)
 
             value = getattr(instance, field_name, None)
             if "<locals>.RelatedManager" in str(type(value)):
@@ -94,6 +99,13 @@ class BaseItemSerializer(HyperlinkedModelSerializer):
 
         self.serializer_field_mapping[zimagi_fields.DataField] = JSONDataField
 
+    def initialize_instance(self, instance):
+        # Dynamic fields share one initialization per instance and command
+        if getattr(instance, "_serializer_command", False) is not self.command:
+            instance.initialize(self.command)
+            instance._serializer_command = self.command
+        return instance
+
     @property
     def view(self):
         return self._context.get("view", None)
@@ -159,6 +171,31 @@ def DetailSerializer(facade):
     return serializer
 
 
+@lru_cache(maxsize=None)
+def get_related_fields(serializer_class):
+    select_fields = []
+    prefetch_fields = []
+
+    def add_fields(declared_fields, prefix="", prefetch=False):
+        for field_name, field in declared_fields.items():
+            multiple = isinstance(field, ListSerializer)
+            if multiple:
+                field = field.child
+
+            if isinstance(field, Serializer):
+                field_path = f"{prefix}{field_name}"
+
+                if prefetch or multiple:
+                    prefetch_fields.append(field_path)
+                else:
+                    select_fields.append(field_path)
+
+                add_fields(field._declared_fields, f"{field_path}__", prefetch or multiple)
+
+    add_fields(getattr(serializer_class, "_declared_fields", {}))
+    return select_fields, prefetch_fields
+
+
 class ValuesSerializer(BaseSerializer):
     count = fields.IntegerField(min_value=0)
     results = fields.ListField(allow_empty=True)
@@ -229,7 +266,7 @@ def get_update_field_map(facade, exclude_fields, parent_data):
 
 def save_relation(command, facade, field_name, data):
     if isinstance(data, dict):
-        facade = copy.deepcopy(facade)
+        facade = facade.query()
         scope_fields = facade.scope_parents
         instance = None
 
@@ -3,6 +3,7 @@ import traceback
 from functools import lru_cache
 
 import pandas
+from django.conf import settings
 from django.core.exceptions import FieldError
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
@@ -13,7 +14,7 @@ from systems.api.views import wrap_api_call
 from systems.commands import action
 from systems.encryption.cipher import Cipher
 from utility.data import rank_similar
-from utility.query import get_field_values
+from utility.query import get_distinct_values, get_field_count, get_field_values
 
 from . import filters, pagination, renderers, schema, serializers
 from .filter.backends import (
@@ -24,8 +25,9 @@ from .filter.backends import (
     OrderingFilterBackend,
     RelatedFilterBackend,
     SearchFilterBackend,
+    ValuesLimitFilterBackend,
 )
-from .response import EncryptedResponse
+from .response import EncryptedResponse, EncryptedStreamingResponse
 
 logger = logging.getLogger(__name__)
 
@@ -104,7 +106,7 @@ class BaseDataViewSet(ModelViewSet):
     action_filters = {
         "count": (SearchFilterBackend, CompoundFilterBackend, RelatedFilterBackend, CacheRefreshBackend),
         "list": (OrderingFilterBackend, "count"),
-        "values": "list",
+        "values": (ValuesLimitFilterBackend, "list"),
         "csv": (FieldSelectFilterBackend, LimitFilterBackend, "list"),
         "json": "csv",
     }
@@ -142,6 +144,17 @@ class BaseDataViewSet(ModelViewSet):
         except (KeyError, AttributeError) as e:
             return super().get_serializer_class()
 
+    def get_queryset(self):
+        queryset = super().get_queryset()
+
+        if self.action in ("list", "retrieve"):
+            select_fields, prefetch_fields = serializers.get_related_fields(self.get_serializer_class())
+            if select_fields:
+                queryset = queryset.select_related(*select_fields)
+            if prefetch_fields:
+                queryset = queryset.prefetch_related(*prefetch_fields)
+        return queryset
+
     def filter_queryset(self, queryset):
         self.filter_class = filters.DataFilterSet(self.facade)
         self.filter_backends = self.get_filter_classes()
@@ -170,7 +183,7 @@ class BaseDataViewSet(ModelViewSet):
         if validation_errors:
             return EncryptedResponse(
                 data=validation_errors if len(validation_errors) > 1 else validation_errors[0],
-                status=status.HTTP_501_NOT_IMPLEMENTED,
+                status=status.HTTP_400_BAD_REQUEST,
                 user=request.user.name if request.user else None,
             )
         return None
@@ -256,11 +269,15 @@ class BaseDataViewSet(ModelViewSet):
     def values(self, request, *args, **kwargs):
         def processor(queryset):
             command = action.primary("api values", user=request.user)
-            values = get_field_values(queryset, kwargs["field_lookup"])
+            field = kwargs["field_lookup"]
+            values_backend = ValuesLimitFilterBackend()
+            values = get_distinct_values(
+                queryset, field, limit=values_backend.get_limit(request), offset=values_backend.get_offset(request)
+            )
 
             return EncryptedResponse(
                 data=self.get_serializer(
-                    {"count": len(values), "results": sorted(values)}, many=False, command=command
+                    {"count": get_field_count(queryset, field), "results": values}, many=False, command=command
                 ).data,
                 user=request.user.name if request.user else None,
             )
@@ -272,20 +289,38 @@ class BaseDataViewSet(ModelViewSet):
             command = action.primary("api count", user=request.user)
             return EncryptedResponse(
                 data=self.get_serializer(
-                    {"count": len(get_field_values(queryset, kwargs["field_lookup"]))}, many=False, command=command
+                    {"count": get_field_count(queryset, kwargs["field_lookup"])}, many=False, command=command
                 ).data,
                 user=request.user.name if request.user else None,
             )
 
         return self.api_query("count", request, processor)
 
+    def accepts_stream(self, request, media_type, **params):
+        # Streamed exports change the wire format so clients opt in through the Accept header
+        for accept_type in request.META.get("HTTP_ACCEPT", "").split(","):
+            accept_type, *accept_params = [component.strip() for component in accept_type.split(";")]
+            if accept_type.lower() == media_type and all(
+                f"{name}={value}" in accept_params for name, value in params.items()
+            ):
+                return True
+        return False
+
     def csv(self, request, *args, **kwargs):
         def processor(queryset):
-            response = EncryptedResponse(
-                content_type="text/csv",
-                data=pandas.DataFrame(list(queryset)).to_csv(index=False),
-                user=request.user.name if request.user else None,
-            )
+            if self.accepts_stream(request, "text/csv", stream="lines"):
+                chunks = renderers.iterate_records(queryset, settings.DATA_API_EXPORT_CHUNK_SIZE)
+                response = EncryptedStreamingResponse(
+                    streaming_content=renderers.stream_csv(queryset, chunks),
+                    content_type="text/csv; stream=lines",
+                    user=request.user.name if request.user else None,
+                )
+            else:
+                response = EncryptedResponse(
+                    content_type="text/csv",
+                    data=pandas.DataFrame(list(queryset)).to_csv(index=False),
+                    user=request.user.name if request.user else None,
+                )
             response["Content-Disposition"] = 'attachment; filename="zimagi-export-data.csv"'
             return response
 
@@ -293,6 +328,13 @@ class BaseDataViewSet(ModelViewSet):
 
     def json(self, request, *args, **kwargs):
         def processor(queryset):
+            if self.accepts_stream(request, "application/x-ndjson"):
+                chunks = renderers.iterate_records(queryset, settings.DATA_API_EXPORT_CHUNK_SIZE)
+                return EncryptedStreamingResponse(
+                    streaming_content=renderers.stream_json(chunks),
+                    content_type="application/x-ndjson",
+                    user=request.user.name if request.user else None,
+                )
             return EncryptedResponse(data=list(queryset), user=request.user.name if request.user else None)
 
         return self.api_query("json", request, processor)
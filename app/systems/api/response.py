@@ -1,8 +1,13 @@
 from django.conf import settings
+from django.http import StreamingHttpResponse
 from rest_framework.response import Response
 from systems.encryption.cipher import Cipher
 
 
+def check_api_encryption(api_type):
+    return bool(api_type) and getattr(settings, "ENCRYPT_{}_API".format(api_type.replace("_api", "").upper()), True)
+
+
 class EncryptedResponse(Response):
     api_type = None
 
@@ -15,8 +20,26 @@ class EncryptedResponse(Response):
 
     @property
     def rendered_content(self):
-        if not self.api_type or not getattr(
-            settings, "ENCRYPT_{}_API".format(self.api_type.replace("_api", "").upper()), True
-        ):
+        if not check_api_encryption(self.api_type):
             return super().rendered_content
         return Cipher.get(self.api_type, user=self.user).encrypt(super().rendered_content)
+
+
+class EncryptedStreamingResponse(StreamingHttpResponse):
+    api_type = None
+
+    def __init__(self, streaming_content=(), user=None, api_type=None, **kwargs):
+        self.user = user
+
+        if api_type:
+            self.api_type = api_type
+
+        super().__init__(streaming_content=self.encrypt_content(streaming_content), **kwargs)
+
+    def encrypt_content(self, streaming_content):
+        # Encrypted streams are delivered as one encrypted frame per line
+        if not check_api_encryption(self.api_type):
+            return streaming_content
+
+        cipher = Cipher.get(self.api_type, user=self.user)
+        return (cipher.encrypt(chunk) + b"\n" for chunk in streaming_content)
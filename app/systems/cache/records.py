@@ -0,0 +1,183 @@
+import logging
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.db import connection, transaction
+from utility.python import ProcessLocal
+
+logger = logging.getLogger(__name__)
+
+
+RECORD_CACHE_CHANNEL = "record-cache"
+
+
+class RecordCache:
+    def __init__(self, name):
+        self.name = name
+        self.lock = threading.Lock()
+        self.records = {}
+        self.snapshot = None
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, loader):
+        with self.lock:
+            entry = self.records.get(key, None)
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+                return entry[1]
+
+            self.misses += 1
+            version = self.version
+
+        record = loader(key)
+        self._save(version, lambda expiration: self.records.__setitem__(key, (expiration, record)))
+        return record
+
+    def get_all(self, loader):
+        with self.lock:
+            if self.snapshot and self.snapshot[0] > time.monotonic():
+                self.hits += 1
+                return self.snapshot[1]
+
+            self.misses += 1
+            version = self.version
+
+        records = loader()
+        self._save(version, lambda expiration: setattr(self, "snapshot", (expiration, records)))
+        return records
+
+    def _save(self, version, callback):
+        # Records read inside a transaction may be rolled back and other processes only invalidate on commit
+        if connection.in_atomic_block:
+            return
+
+        lifetime = self.lifetime
+        with self.lock:
+            # Records loaded while an invalidation arrived may already be stale
+            if version == self.version and lifetime > 0:
+                callback(time.monotonic() + lifetime)
+
+    @property
+    def lifetime(self):
+        listener = get_record_cache_listener()
+        if listener and listener.connected:
+            return settings.RECORD_CACHE_SECONDS
+        return settings.RECORD_CACHE_LOCAL_SECONDS
+
+    def invalidate(self, key=None):
+        with self.lock:
+            self.version += 1
+            self.snapshot = None
+
+            if key is None:
+                self.records = {}
+            else:
+                self.records.pop(key, None)
+
+
+class RecordCacheListener(threading.Thread):
+    def __init__(self):
+        super().__init__()
+        self.id = uuid.uuid4().hex
+        self.connected = False
+
+        self.daemon = True
+        self.stop_signal = threading.Event()
+        self.start()
+
+    def run(self):
+        while not self.terminated:
+            subscription = None
+            try:
+                subscription = settings.MANAGER.subscribe(RECORD_CACHE_CHANNEL)
+                if not subscription:
+                    return
+
+                self.connected = True
+                while not self.terminated:
+                    package = settings.MANAGER.receive(subscription)
+                    if package and package.sender != self.id:
+                        invalidate_local_record_cache(package.message["name"], package.message["key"])
+
+            except Exception as error:
+                logger.warning(f"Record cache listener disconnected: {error}")
+            finally:
+                self.disconnect()
+                if subscription:
+                    subscription.close()
+
+            self.stop_signal.wait(settings.RECORD_CACHE_RECONNECT_INTERVAL)
+
+    def disconnect(self):
+        if self.connected:
+            # Invalidations may have been missed while disconnected
+            self.connected = False
+            invalidate_local_record_cache()
+
+    def terminate(self, timeout=None):
+        self.stop_signal.set()
+        super().join(timeout)
+
+    @property
+    def terminated(self):
+        return self.stop_signal.is_set()
+
+
+class RecordCacheIndex:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.caches = {}
+        self.listener = RecordCacheListener()
+
+    def get(self, name):
+        with self.lock:
+            if name not in self.caches:
+                self.caches[name] = RecordCache(name)
+            return self.caches[name]
+
+    def invalidate(self, name=None, key=None):
+        with self.lock:
+            if name is None:
+                caches = list(self.caches.values())
+            else:
+                caches = [self.caches[name]] if name in self.caches else []
+
+        for cache in caches:
+            cache.invalidate(key)
+
+
+_index = ProcessLocal(RecordCacheIndex)
+
+
+def get_record_cache_listener():
+    index = _index.peek()
+    return index.listener if index else None
+
+
+def get_record_cache(name):
+    return _index.get().get(name)
+
+
+def invalidate_local_record_cache(name=None, key=None):
+    index = _index.peek()
+    if index:
+        index.invalidate(name, key)
+
+
+def invalidate_record_cache(name, key=None):
+    def broadcast():
+        invalidate_local_record_cache(name, key)
+        try:
+            listener = get_record_cache_listener()
+            settings.MANAGER.broadcast(
+                RECORD_CACHE_CHANNEL, {"name": name, "key": key}, sender=listener.id if listener else ""
+            )
+        except Exception as error:
+            logger.warning(f"Record cache invalidation of {name} {key} could not be broadcast: {error}")
+
+    invalidate_local_record_cache(name, key)
+    transaction.on_commit(broadcast)
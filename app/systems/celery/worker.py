@@ -1,3 +1,5 @@
+import atexit
+import logging
 import os
 import signal
 import threading
@@ -5,7 +7,19 @@ import time
 
 import redis
 from django.conf import settings
+from django.db import connections
 from utility.data import ensure_list
+from utility.python import ProcessLocal
+
+logger = logging.getLogger(__name__)
+
+
+def worker_reserve_key(worker_type):
+    return f"worker:reserve:{worker_type}"
+
+
+def worker_exit_key(worker_type):
+    return f"worker:exit:{worker_type}"
 
 
 def start_worker_manager(app):
@@ -73,8 +87,10 @@ class WorkerManager(RedisConnectionMixin, threading.Thread):
 
                         if worker_queues and not self.check_queues(worker_queues, app=self.app, worker_name=worker_name):
                             if (current_time - start_time) > settings.WORKER_TIMEOUT:
-                                os.kill(os.getpid(), signal.SIGTERM)
-                                break
+                                if not self.check_reserve(worker_queues):
+                                    os.kill(os.getpid(), signal.SIGTERM)
+                                    break
+                                start_time = time.time()
                         else:
                             start_time = time.time()
 
@@ -83,6 +99,25 @@ class WorkerManager(RedisConnectionMixin, threading.Thread):
         finally:
             self.connection().close()
 
+    def check_reserve(self, queue_names):
+        for queue_name in ensure_list(queue_names):
+            worker_reserve = int(self.connection().get(worker_reserve_key(queue_name)) or 0)
+            if worker_reserve > 0:
+                worker_queues = self.inspector.active_queues() or {}
+                worker_count = len(
+                    [
+                        name
+                        for name, queue_info in worker_queues.items()
+                        if queue_name in [queue["name"] for queue in queue_info]
+                    ]
+                )
+                # Idle workers exit one at a time so the remaining count stays accurate
+                if worker_count <= worker_reserve or not self.connection().set(
+                    worker_exit_key(queue_name), 1, nx=True, ex=max(settings.WORKER_CHECK_INTERVAL * 2, 1)
+                ):
+                    return True
+        return False
+
     def terminate(self, timeout=None):
         self.stop_signal.set()
         super().join(timeout)
@@ -90,3 +125,133 @@ class WorkerManager(RedisConnectionMixin, threading.Thread):
     @property
     def terminated(self):
         return self.stop_signal.isSet()
+
+
+class WorkerQueueState:
+    def __init__(self, queue):
+        self.queue = queue
+        self.command_name = None
+        self.command_options = None
+        self.published = 0
+        self.task_rate = 0.0
+        self.checked = time.monotonic()
+        self.scaling = False
+
+
+class WorkerScaler(threading.Thread):
+    rate_smoothing = 0.5
+
+    def __init__(self, app):
+        super().__init__()
+        self.app = app
+        self.lock = threading.Lock()
+        self.queues = {}
+
+        self.daemon = True
+        self.scale_signal = threading.Event()
+        self.stop_signal = threading.Event()
+        self.start()
+
+    def add(self, queue, command_name, command_options):
+        with self.lock:
+            state = self.queues.get(queue, None)
+            if state is None:
+                state = WorkerQueueState(queue)
+                self.queues[queue] = state
+
+            state.command_name = command_name
+            state.command_options = command_options
+            state.published += 1
+
+        if settings.WORKER_SCALE_DEBOUNCE <= 0:
+            self.scale()
+        else:
+            self.scale_signal.set()
+
+    def run(self):
+        try:
+            while not self.terminated:
+                if self.scale_signal.wait(max(settings.WORKER_SCALE_INTERVAL, 1)):
+                    # Coalesce a burst of task publications into a single scaling cycle
+                    self.stop_signal.wait(settings.WORKER_SCALE_DEBOUNCE)
+                    self.scale_signal.clear()
+                self._scale_background()
+
+            self._scale_background()
+        finally:
+            connections.close_all()
+
+    def scale(self):
+        from systems.commands.action import ActionCommand
+
+        current_time = time.monotonic()
+
+        with self.lock:
+            states = []
+            for state in self.queues.values():
+                if state.published or state.scaling:
+                    # Published task rate per second, smoothed across scaling cycles
+                    task_rate = state.published / max(current_time - state.checked, 0.001)
+                    state.task_rate = (self.rate_smoothing * task_rate) + ((1 - self.rate_smoothing) * state.task_rate)
+                    state.published = 0
+                    state.checked = current_time
+                    states.append((state, state.command_name, state.command_options, state.task_rate))
+
+        if not states:
+            return
+
+        worker_command = ActionCommand("worker")
+        for state, command_name, command_options, task_rate in states:
+            try:
+                worker = worker_command.get_provider(
+                    "worker",
+                    settings.WORKER_PROVIDER,
+                    self.app,
+                    worker_type=state.queue,
+                    command_name=command_name,
+                    command_options=command_options,
+                )
+                # Keep checking the queue until the requested workers are running
+                state.scaling = bool(worker.ensure(task_rate))
+
+            except Exception as error:
+                state.scaling = False
+                logger.error(f"Worker processor for {state.queue} failed to start: {error}")
+                try:
+                    # Publishing commands may have finished or belong to other requests so failures are only reported
+                    worker_command.send(
+                        "worker:scaling", {"command": command_name, "worker_type": state.queue, "error": str(error)}
+                    )
+                except Exception as send_error:
+                    logger.error(f"Worker processor failure for {state.queue} could not be sent: {send_error}")
+
+    def _scale_background(self):
+        try:
+            self.scale()
+        except Exception as error:
+            logger.error(f"Worker scaler failed to check queues: {error}")
+
+    def terminate(self, timeout=None):
+        self.stop_signal.set()
+        self.scale_signal.set()
+        super().join(timeout)
+
+    @property
+    def terminated(self):
+        return self.stop_signal.is_set()
+
+
+_scaler = ProcessLocal(WorkerScaler, check=lambda scaler: scaler.is_alive())
+
+
+def get_worker_scaler(app):
+    return _scaler.get(app)
+
+
+@atexit.register
+def shutdown_worker_scaler():
+    scaler = _scaler.peek()
+
+    # Queues published to just before exit still need workers to process them
+    if scaler and scaler.is_alive():
+        scaler.terminate()
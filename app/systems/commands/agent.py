@@ -1,3 +1,4 @@
+import copy
 import logging
 import queue
 import re
@@ -30,7 +31,7 @@ class AgentCommand(exec.ExecCommand):
         super().signal_shutdown()
 
     def run_from_argv(self, argv, options=None):
-        return super().run_from_argv(argv, self.spec.get("options", {}))
+        return super().run_from_argv(argv, copy.deepcopy(self.spec.get("options", {})))
 
     def _exec_local_handler(self, log_key, primary=True):
         profiler_name = "exec.agent.local.primary" if primary else "exec.agent.local"
@@ -83,6 +84,7 @@ class AgentCommand(exec.ExecCommand):
                 exec_process,
                 thread_count=len(self.processes),
                 disable_parallel=False,
+                shared_pool=False,
             )
         else:
             self.exec_loop("main", self.exec)
@@ -1,5 +1,4 @@
 import argparse
-import copy
 import cProfile
 import logging
 import os
@@ -489,7 +488,7 @@ class BaseCommand(
             self.error(f"Plugin {type} provider {name} error: {e}", system=True)
 
         if facade and provider.facade != facade:
-            provider._facade = copy.deepcopy(facade)
+            provider._facade = facade.query()
 
         return provider
 
@@ -698,7 +697,7 @@ class BaseCommand(
                 try:
                     state_id = f"lock_{lock_id}"
                     if run_once:
-                        results = self.get_state(state_id, None)
+                        results = self.get_state(state_id, None, cache=False)
                         if results is not None:
                             if isinstance(results, str) and results == none_token:
                                 results = None
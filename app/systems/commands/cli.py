@@ -24,6 +24,17 @@ class CLI(TerminalMixin):
         super().__init__()
         self.argv = argv if argv else []
 
+        self.profile_startup = False
+
+        # Only options before the command path belong to the CLI, later arguments are passed to the command
+        for index, arg in enumerate(self.argv[1:], 1):
+            if arg == "--profile-startup":
+                self.profile_startup = True
+                self.argv = self.argv[:index] + self.argv[index + 1 :]
+                break
+            if not arg.startswith("-"):
+                break
+
     def handle_error(self, error):
         if not isinstance(error, CommandError) and error.args:
             self.print("** " + self.error_color(error.args[0]), sys.stderr)
@@ -93,7 +104,31 @@ class CLI(TerminalMixin):
 
         return args
 
+    def display_startup_profile(self, startup_profile, startup_time):
+        profile = settings.MANAGER.index.startup_profile
+        execution_profile = {
+            phase: phase_time - startup_profile.get(phase, 0)
+            for phase, phase_time in profile.items()
+            if phase_time > startup_profile.get(phase, 0)
+        }
+        width = max([len(phase) for phase in profile.keys()] + [15])
+
+        def display(title, phases, total_time=None):
+            self.print(self.header_color(title), stream=sys.stderr)
+            for phase, phase_time in phases.items():
+                self.print(f"  {phase:<{width}}  {phase_time:.4f}", stream=sys.stderr)
+            if total_time is not None:
+                self.print(f"  {'other':<{width}}  {max(total_time - sum(phases.values()), 0):.4f}", stream=sys.stderr)
+                self.print(f"  {'total':<{width}}  {total_time:.4f}", stream=sys.stderr)
+
+        display("Startup generation profile (seconds)", startup_profile, startup_time)
+        if execution_profile:
+            display("Generated during command execution (seconds)", execution_profile)
+
     def execute(self):
+        start_time = time.perf_counter()
+        startup_time = None
+        startup_profile = None
         try:
             django.setup()
 
@@ -115,6 +150,9 @@ class CLI(TerminalMixin):
                 else:
                     command = settings.MANAGER.index.find_command(args)
 
+                startup_time = time.perf_counter() - start_time
+                startup_profile = dict(settings.MANAGER.index.startup_profile)
+
                 if settings.INIT_PROFILE:
                     init_profiler.disable()
 
@@ -139,6 +177,9 @@ class CLI(TerminalMixin):
         finally:
             connection.close()
 
+            if self.profile_startup and startup_time is not None:
+                self.display_startup_profile(startup_profile, startup_time)
+
             if settings.INIT_PROFILE:
                 init_profiler.dump_stats(self.get_profiler_path("init"))
 
@@ -1,5 +1,6 @@
 import copy
 import logging
+import queue
 import re
 import threading
 import time
@@ -49,6 +50,8 @@ class ExecCommand(
                 self.log_status(False)
                 self.publish_exit()
 
+            self.close_ssh()
+
         except Exception as error:
             logger.info(f"Signal shutdown for base executable command errored with: {error}")
 
@@ -423,7 +426,7 @@ class ExecCommand(
             log_key=log_key,
         )
 
-    def handle_api(self, options):
+    def handle_api(self, options, batch_messages=False):
         self._register_signal_handlers()
 
         logger.debug(f"Running API command: {self.get_full_name()}\n\n{yaml.dump(options)}")
@@ -433,21 +436,18 @@ class ExecCommand(
 
         logger.debug(f"Command thread started: {self.get_full_name()}")
 
+        batch_messages = batch_messages and settings.COMMAND_API_MESSAGE_BATCH
         try:
-            while True:
-                self.sleep(0.25)
-                logger.debug("Checking messages")
-
-                for data in iter(self.messages.get, None):
-                    logger.debug(f"Receiving data: {data}")
+            for batch in self._collect_api_messages(action, batch_messages):
+                logger.debug(f"Receiving data: {batch}")
 
-                    msg = self.create_message(data, decrypt=False)
-                    package = msg.to_package()
-                    yield package
+                app_messages = [self.create_message(data, decrypt=False) for data in batch]
+                if batch_messages and len(app_messages) > 1:
+                    yield messages.AppMessage.to_batch_package(app_messages, user=self.active_user.name)
+                else:
+                    for msg in app_messages:
+                        yield msg.to_package()
 
-                if not action.is_alive():
-                    logger.debug("Command thread is no longer active")
-                    break
         except Exception as e:
             logger.warning(f"Command transport exception: {e}")
             raise e
@@ -456,6 +456,44 @@ class ExecCommand(
             self.disconnect()
             self.export_profiler_data()
 
+    def _collect_api_messages(self, action, batch_messages):
+        batch_size = settings.COMMAND_API_MESSAGE_BATCH_SIZE if batch_messages else 1
+        batch = []
+        flush_time = None
+
+        while True:
+            if batch:
+                timeout = flush_time - time.monotonic()
+                if timeout <= 0 or len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+                    continue
+            else:
+                timeout = 1
+
+            try:
+                data = self.messages.get(timeout=timeout)
+            except queue.Empty:
+                if not batch and not action.is_alive():
+                    logger.debug("Command thread is no longer active")
+                    break
+                continue
+
+            if data is None:
+                if batch:
+                    yield batch
+                    batch = []
+
+                # Command thread flushes its queue just before exiting
+                action.join(0.1)
+                if not action.is_alive():
+                    logger.debug("Command thread is no longer active")
+                    break
+            else:
+                if not batch:
+                    flush_time = time.monotonic() + settings.COMMAND_API_FLUSH_WINDOW
+                batch.append(data)
+
     def _exec_init(self, primary=True, log_key=None, task=None, signals=True):
         log_key = self.log_init(task=task, log_key=log_key, worker=self.worker_type)
 
@@ -547,6 +585,7 @@ class ExecCommand(
             self.log_status(real_status, True, schedule=schedule)
             if primary:
                 self.shutdown()
+                self.close_ssh()
                 self.set_status(real_status)
                 if notify and self.require_db():
                     self.send_notifications(real_status)
@@ -593,6 +632,7 @@ class ExecCommand(
                     self.manager.restart_scheduler()
 
                 self.shutdown()
+                self.close_ssh()
                 self.set_status(success)
                 self.publish_exit()
                 self.manager.delete_task_status(log_key)
@@ -92,14 +92,28 @@ def generate_command_tree(spec, name="root", parent_command=None, lookup_path=""
                 return Command(lookup_path)
 
     for sub_name, sub_spec in spec.items():
-        if isinstance(sub_spec, dict):
-            subcommand = generate_command_tree(sub_spec, sub_name, command, f"{lookup_path}.{sub_name}".strip("."))
-            if subcommand:
-                command[sub_name] = subcommand
+        if isinstance(sub_spec, dict) and _check_command_spec(sub_spec):
+            command.add_loader(
+                sub_name, _get_command_loader(sub_spec, sub_name, command, f"{lookup_path}.{sub_name}".strip("."))
+            )
 
     return command if not command.is_empty else None
 
 
+def _check_command_spec(spec):
+    if "base" in spec:
+        return True
+    return any(isinstance(sub_spec, dict) and _check_command_spec(sub_spec) for sub_spec in spec.values())
+
+
+def _get_command_loader(spec, name, parent_command, lookup_path):
+    def load():
+        with settings.MANAGER.index.profile_phase("commands (lazy)"):
+            return generate_command_tree(spec, name, parent_command, lookup_path)
+
+    return load
+
+
 def find_command(full_name, parent=None):
     from systems.commands.router import RouterCommand
 
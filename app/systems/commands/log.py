@@ -0,0 +1,157 @@
+import atexit
+import logging
+import os
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class LogWriter(threading.Thread):
+    save_attempts = 3
+
+    def __init__(self):
+        super().__init__()
+        self.pid = os.getpid()
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.messages = []
+        self.last_timestamp = None
+
+        self.daemon = True
+        self.flush_signal = threading.Event()
+        self.stop_signal = threading.Event()
+        self.start()
+
+    def _timestamp(self):
+        # Message identifiers are derived from the creation time so they must be unique per log
+        timestamp = timezone.now()
+        if self.last_timestamp and timestamp <= self.last_timestamp:
+            timestamp = self.last_timestamp + timedelta(microseconds=1)
+
+        self.last_timestamp = timestamp
+        return timestamp
+
+    def add(self, messages):
+        with self.lock:
+            # Timestamps are assigned under the buffer lock so messages are always saved in creation order
+            timestamp = self._timestamp()
+            for message in messages:
+                if message.created is None:
+                    message.created = timestamp
+                    message.updated = timestamp
+                    message.get_id()
+
+            self.messages.extend(messages)
+            batch_ready = len(self.messages) >= settings.LOG_MESSAGE_BATCH_SIZE
+
+        if settings.LOG_MESSAGE_FLUSH_INTERVAL <= 0:
+            self.flush()
+        elif batch_ready:
+            self.flush_signal.set()
+
+    def flush(self):
+        with self.flush_lock:
+            with self.lock:
+                messages = self.messages
+                self.messages = []
+
+            if messages:
+                try:
+                    self._save(messages)
+                except Exception as error:
+                    # Saving one message at a time keeps the rest of the batch when a single message fails
+                    failed = []
+                    for message in messages:
+                        try:
+                            self._save([message])
+                        except Exception as message_error:
+                            failed.append(message)
+                            error = message_error
+
+                    if failed:
+                        self._requeue(failed)
+                        raise error
+
+    def _save(self, messages):
+        messages[0].__class__.objects.bulk_create(messages, batch_size=settings.LOG_MESSAGE_BATCH_SIZE)
+
+    def _requeue(self, messages):
+        retry_messages = []
+
+        for message in messages:
+            message._save_attempts = getattr(message, "_save_attempts", 0) + 1
+            if message._save_attempts < self.save_attempts:
+                retry_messages.append(message)
+            else:
+                logger.error(f"Log message writer dropped message {message.id} after {self.save_attempts} attempts")
+
+        with self.lock:
+            self.messages = retry_messages + self.messages
+
+    def run(self):
+        try:
+            while not self.terminated:
+                self.flush_signal.wait(max(settings.LOG_MESSAGE_FLUSH_INTERVAL, 0.1))
+                self.flush_signal.clear()
+                self._flush_background()
+
+            self._flush_background()
+        finally:
+            connection.close()
+
+    def _flush_background(self):
+        try:
+            self.flush()
+        except Exception as error:
+            logger.error(f"Log message writer failed to save messages: {error}")
+
+    def terminate(self, timeout=None):
+        self.stop_signal.set()
+        self.flush_signal.set()
+        super().join(timeout)
+
+    @property
+    def terminated(self):
+        return self.stop_signal.is_set()
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def get_log_writer():
+    global _writer
+
+    with _writer_lock:
+        # Threads do not survive a fork so worker processes start their own writer
+        if _writer is None or _writer.pid != os.getpid():
+            _writer = LogWriter()
+        elif not _writer.is_alive():
+            messages = _writer.messages
+            last_timestamp = _writer.last_timestamp
+            _writer = LogWriter()
+            _writer.last_timestamp = last_timestamp
+            _writer.add(messages)
+        return _writer
+
+
+def flush_log_messages():
+    with _writer_lock:
+        writer = _writer
+
+    if writer and writer.pid == os.getpid():
+        writer._flush_background()
+
+
+@atexit.register
+def shutdown_log_writer():
+    with _writer_lock:
+        writer = _writer
+
+    if writer and writer.pid == os.getpid() and writer.is_alive():
+        writer.terminate()
@@ -22,6 +22,13 @@ class AppMessage(TerminalMixin):
         message.load(data)
         return message
 
+    @classmethod
+    def to_batch_package(cls, messages, user=None):
+        cipher = Cipher.get("command_api", user=user)
+        json_text = dump_json([message.render() for message in messages])
+        cipher_text = cipher.encrypt(json_text).decode(cipher.field_decoder)
+        return dump_json({"packages": cipher_text}) + "\n"
+
     def __init__(self, message="", name=None, prefix=None, silent=False, system=False, user=None):
         super().__init__()
 
@@ -1,7 +1,10 @@
 import threading
 
+from django.conf import settings
 from utility import shell, ssh
 
+_ssh_pool_lock = threading.Lock()
+
 
 class ExecMixin:
     def sh(self, command_args, input=None, display=True, line_prefix="", env=None, cwd=None, sudo=False):
@@ -43,21 +46,55 @@ class ExecMixin:
         thrd_out.join()
         thrd_err.join()
 
-    def ssh(self, hostname, username, password=None, key=None, timeout=10, port=22, env=None):
+    @property
+    def ssh_pool(self):
+        # Commands executed within a parent command share its connections
+        if getattr(self, "exec_parent", None):
+            return self.exec_parent.ssh_pool
+
+        with _ssh_pool_lock:
+            if getattr(self, "_ssh_pool", None) is None:
+                self._ssh_pool = ssh.SSHPool()
+            return self._ssh_pool
+
+    def ssh(self, hostname, username, password=None, key=None, timeout=10, port=22, env=None, pool=False):
         if not env:
             env = {}
-        try:
-            conn = ssh.SSH(
-                hostname, username, password, key=key, callback=self._ssh_callback, timeout=timeout, port=port, env=env
-            )
-            conn.wrap_exec(self._ssh_exec)
-            conn.wrap_file(self._ssh_file)
-
-        except Exception as e:
-            self.error(f"SSH connection to {hostname} failed: {e}")
 
+        def connect(env):
+            try:
+                conn = ssh.SSH(
+                    hostname,
+                    username,
+                    password,
+                    key=key,
+                    callback=self._ssh_callback,
+                    timeout=timeout,
+                    port=port,
+                    env=env,
+                    max_channels=settings.SSH_MAX_CHANNELS,
+                )
+                conn.wrap_exec(self._ssh_exec)
+                conn.wrap_file(self._ssh_file)
+
+            except Exception as e:
+                self.error(f"SSH connection to {hostname} failed: {e}")
+
+            return conn
+
+        if not pool:
+            return connect(env)
+
+        conn = self.ssh_pool.get((hostname, port, username, key, password), lambda: connect({})).session(env)
+        conn.callback = self._ssh_callback
+        conn.wrap_exec(self._ssh_exec)
+        conn.wrap_file(self._ssh_file)
         return conn
 
+    def close_ssh(self):
+        if getattr(self, "_ssh_pool", None):
+            self._ssh_pool.close()
+
     def _ssh_exec(self, ssh, executer, command, args, options):
         id_prefix = f"[{ssh.hostname}]"
 
@@ -1,4 +1,3 @@
-import copy
 import re
 
 from utility import data
@@ -18,9 +17,9 @@ class QueryMixin:
             facade = self.manager.index.get_facade_index()[name]
 
         if use_cache and not self._facade_cache.get(name, None):
-            self._facade_cache[name] = copy.deepcopy(facade)
+            self._facade_cache[name] = facade.query()
         else:
-            result = copy.deepcopy(facade)
+            result = facade.query()
 
         return self._facade_cache[name] if use_cache else result
 
@@ -242,6 +241,13 @@ class QueryMixin:
         self.send(f"data:save:{facade.meta.data_name}", getattr(instance, facade.pk))
         return instance
 
+    def save_instances(self, facade, records, batch_size=None):
+        instances = facade.bulk_store(records, batch_size=batch_size)
+
+        for instance in instances:
+            self.send(f"data:save:{facade.meta.data_name}", getattr(instance, facade.pk))
+        return instances
+
     def remove_instance(self, facade, key, scope=None):
         if scope:
             facade.set_scope(scope)
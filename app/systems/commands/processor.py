@@ -69,11 +69,9 @@ class Processor:
 
     def _parse_values(self, item):
         if isinstance(item, (list, tuple)):
-            for index, element in enumerate(item):
-                item[index] = self._parse_values(element)
+            item = [self._parse_values(element) for element in item]
         elif isinstance(item, dict):
-            for name, element in item.items():
-                item[name] = self._parse_values(element)
+            item = {name: self._parse_values(element) for name, element in item.items()}
         elif isinstance(item, str):
             item = self.parser.parse(item)
         return item
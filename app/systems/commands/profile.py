@@ -5,8 +5,8 @@ import re
 import yaml
 from django.conf import settings
 from systems.models.base import BaseModel
-from utility.data import Collection, clean_dict, dump_json, ensure_list, flatten, format_value, normalize_value, prioritize
-from utility.parallel import Parallel
+from utility.data import Collection, clean_dict, dump_json, ensure_list, flatten, format_value, normalize_value
+from utility.parallel import ParallelGraph
 
 logger = logging.getLogger(__name__)
 
@@ -218,6 +218,10 @@ class CommandProfile:
 
     def process_components(self, operation, include_method=None, display_only=False, extra_config=None):
         component_map = self.manager.index.load_components(self)
+        critical_path = []
+        critical_path_time = 0
+
+        self.critical_paths = {}
         for priority, components in sorted(component_map.items()):
 
             def process(component):
@@ -236,10 +240,21 @@ class CommandProfile:
 
             self.command.run_list(components, process)
 
-    def _process_component_instances(self, component, component_method, include_method=None, display_only=False):
-        instance_index = Collection()
-        processed_index = Collection()
+            # Component groups run one after another so the profile critical path chains the slowest of each group
+            paths = [
+                self.critical_paths[component.name] for component in components if component.name in self.critical_paths
+            ]
+            if paths:
+                path, path_time = max(paths, key=lambda info: info[1])
+                critical_path.extend(path)
+                critical_path_time += path_time
+
+        if critical_path:
+            self.command.data(
+                "Critical path:", f"{critical_path_time:.3f}s ({' > '.join(critical_path)})", "profile_critical_path"
+            )
 
+    def _process_component_instances(self, component, component_method, include_method=None, display_only=False):
         def check_include(config):
             if not callable(include_method):
                 return True
@@ -272,58 +287,49 @@ class CommandProfile:
             return rendered_instances
 
         def get_instances(interpolate_references, data=None):
-            instances = self.expand_instances(component.name, interpolate_references=interpolate_references, data=data)
-            for name, config in instances.items():
-                instance_index[name] = config
-            return instances
+            return self.expand_instances(component.name, interpolate_references=interpolate_references, data=data)
 
         def process_instances():
-            parallel = Parallel(command=self.command)
+            graph = ParallelGraph(command=self.command)
+            instance_index = {}
 
-            def completed_successfully(name, requirements):
-                if requirements is not None:
-                    for child_name in flatten(ensure_list(requirements)):
-                        if child_name not in instance_index:
-                            raise ComponentError(f"Component instance {child_name} not found (referenced by: {name})")
+            def add_instance(name, instance, dependent=True):
+                instance = copy.deepcopy(instance)
+                requires = instance.pop("_requires", None) if isinstance(instance, dict) else None
 
-                        while child_name not in processed_index:
-                            self.command.sleep(0.25)
+                # Includes are evaluated once and excluded instances complete right away without waiting on requirements
+                include = check_include(instance)
+                instance_index[name] = (instance, include)
 
-                        if not processed_index[child_name]:
-                            return False
-                return True
+                if dependent and include and requires is not None:
+                    requires = flatten(ensure_list(self.interpolate_config_value(requires)))
+                else:
+                    requires = []
+                graph.add(name, process_instance, name, requires=requires)
 
             def process_instance(name):
-                instance = copy.deepcopy(instance_index[name])
-                requirements = instance.pop("_requires", []) if isinstance(instance, dict) else []
+                instance, include = instance_index[name]
 
-                if check_include(instance):
-                    if not completed_successfully(name, requirements):
-                        processed_index[name] = False
-                        return
-
-                    if self.include_instance(name, instance):
-                        if isinstance(instance, dict) and "_foreach" in instance:
-                            for index, exp_name in enumerate(get_instances(True, {component.name: {name: instance}}).keys()):
-                                parallel.exec(process_instance, index, exp_name)
-                        else:
-                            config = self.interpolate_config_value(instance)
-
-                            if settings.DEBUG_COMMAND_PROFILES:
-                                self.command.info(yaml.dump({name: config}, Dumper=noalias_dumper))
-                            try:
-                                component_method(name, config)
-                            except Exception as e:
-                                processed_index[name] = False
-                                raise e
+                if include and self.include_instance(name, instance):
+                    if isinstance(instance, dict) and "_foreach" in instance:
+                        for exp_name, exp_instance in get_instances(True, {component.name: {name: instance}}).items():
+                            add_instance(exp_name, exp_instance, False)
+                    else:
+                        config = self.interpolate_config_value(instance)
 
-                processed_index[name] = True
+                        if settings.DEBUG_COMMAND_PROFILES:
+                            self.command.info(yaml.dump({name: config}, Dumper=noalias_dumper))
+                        component_method(name, config)
 
-            for priority, names in sorted(self.order_instances(get_instances(False)).items()):
-                for index, name in enumerate(names):
-                    parallel.exec(process_instance, index, name)
+            # Instances are dispatched as soon as their requirements complete (failed requirements skip dependents)
+            for name, instance in sorted(get_instances(False).items()):
+                add_instance(name, instance)
 
-            parallel.wait()
+            try:
+                graph.wait()
+            finally:
+                path, path_time = graph.critical_path()
+                self.critical_paths[component.name] = ([f"{component.name}:{name}" for name in path], path_time)
 
         if display_only:
             self.command.notice(yaml.dump({component.name: render_instances()}, Dumper=noalias_dumper))
@@ -425,13 +431,6 @@ class CommandProfile:
 
         return instance_map
 
-    def order_instances(self, configs):
-        for name, value in configs.items():
-            if isinstance(value, dict) and "_requires" in value and value["_requires"] is not None:
-                value["_requires"] = self.interpolate_config_value(value["_requires"])
-
-        return prioritize(configs, keep_requires=True, requires_field="_requires")
-
     def include(self, component, force=False, check_data=True):
         if component == "profile" and "profile" in self.data:
             return True
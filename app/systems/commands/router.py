@@ -1,4 +1,5 @@
 import inspect
+import threading
 from collections import OrderedDict
 
 from django.conf import settings
@@ -7,11 +8,15 @@ from utility.text import wrap
 
 
 class RouterCommand(base.BaseCommand):
+    generation_lock = threading.RLock()
+
     def __init__(self, name, parent=None, priority=1):
         super().__init__(name, parent)
 
         self._priority = priority
         self._subcommands = OrderedDict()
+        self._subcommand_loaders = OrderedDict()
+        self._subcommand_names = []
         self.is_empty = True
 
     def get_priority(self):
@@ -21,7 +26,13 @@ class RouterCommand(base.BaseCommand):
         command_index = {}
         subcommands = []
 
-        for name, subcommand in self._subcommands.items():
+        self.load_subcommands()
+
+        for name in self._subcommand_names:
+            subcommand = self._subcommands.get(name, None)
+            if subcommand is None:
+                continue
+
             priority = subcommand.get_priority()
             command_index.setdefault(priority, [])
             command_index[priority].append(subcommand)
@@ -32,22 +43,52 @@ class RouterCommand(base.BaseCommand):
         return subcommands
 
     def exists(self, name):
-        return name in self._subcommands
+        return name in self._subcommands or name in self._subcommand_loaders
 
     def __getitem__(self, name):
+        self.load_subcommand(name)
         return self._subcommands[name]
 
     def get(self, name, default=None):
+        self.load_subcommand(name)
         return self._subcommands.get(name, default)
 
     def __setitem__(self, name, command):
         self.is_empty = False
 
+        if name not in self._subcommand_names:
+            self._subcommand_names.append(name)
+
         if inspect.isclass(command):
             self._subcommands[name] = command(name, self)
         else:
             self._subcommands[name] = command
 
+    def add_loader(self, name, loader):
+        self.is_empty = False
+
+        if name not in self._subcommand_names:
+            self._subcommand_names.append(name)
+        self._subcommand_loaders[name] = loader
+
+    def load_subcommand(self, name):
+        if name in self._subcommand_loaders:
+            with self.generation_lock:
+                if name in self._subcommand_loaders:
+                    command = self._subcommand_loaders[name]()
+                    if command:
+                        self[name] = command
+                    self._subcommand_loaders.pop(name)
+
+    def load_subcommands(self, recursive=False):
+        for name in list(self._subcommand_loaders.keys()):
+            self.load_subcommand(name)
+
+        if recursive:
+            for subcommand in list(self._subcommands.values()):
+                if isinstance(subcommand, RouterCommand):
+                    subcommand.load_subcommands(True)
+
     def add_arguments(self, parser):
         super().add_arguments(parser)
 
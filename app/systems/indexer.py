@@ -1,8 +1,14 @@
+import hashlib
 import logging
 import os
+import pathlib
+import pickle
 import re
 import sys
+import threading
+import time
 from collections import OrderedDict
+from contextlib import contextmanager
 from functools import lru_cache
 
 import oyaml
@@ -39,75 +45,163 @@ class Indexer(module.IndexerModuleMixin, django.IndexerDjangoMixin, component.In
         self._command_tree = {}
 
         self._plugin_providers = {}
+        self._generation_lock = threading.RLock()
+
+        self.startup_profile = OrderedDict()
+        self._profile_lock = threading.Lock()
+        self._profile_state = threading.local()
 
         super().__init__()
 
     @property
     def spec(self):
         if not self._spec:
+            with self.profile_phase("spec"):
+                spec_dirs = list(reversed(self.get_module_dirs("spec")))
+                cache_key = self._get_spec_cache_key(spec_dirs) if settings.SPEC_CACHE else None
 
-            def set_command_module(module_name, spec):
-                if "base" in spec:
-                    spec["_module"] = module_name
-
-                for key, value in spec.items():
-                    if isinstance(value, dict):
-                        set_command_module(module_name, value)
-
-            def load_directory(base_path):
-                if settings.APP_DIR in base_path:
-                    module = "core"
-                    module_path = settings.APP_DIR
-                else:
-                    module = base_path.replace(self.manager.module_path + "/", "").split("/")[0]
-                    module_path = os.path.join(self.manager.module_path, module)
-
-                module_info = Collection(module=module, path=self._get_module_lib_dir(module_path))
-
-                for name in os.listdir(base_path):
-                    file_path = os.path.join(base_path, name)
-                    if os.path.isdir(file_path):
-                        load_directory(file_path)
-
-                    elif name[0] != "_" and re.match(r"^[^\.]+\.(yml|yaml)$", name, re.IGNORECASE):
-                        logger.debug(f"Loading specification from file: {file_path}")
-                        spec_data = load_yaml(file_path)
-
-                        if spec_data:
-                            for key, info in spec_data.items():
-                                if key[0] != "_":
-                                    self.module_map.setdefault(key, {})
-                                    if key == "roles":
-                                        for name, description in info.items():
-                                            self.module_map[key][name] = module_info
-                                    else:
-                                        for name, spec in info.items():
-                                            if key == "command":
-                                                set_command_module(module, spec)
-                                            else:
-                                                app_name = spec.get("app", name)
-                                                self.module_map[key][app_name] = module_info
-
-                                                if key in ("data", "data_base", "data_mixins"):
-                                                    module_name = model_index.get_module_name(key, app_name)
-                                                    model_class = model_index.get_model_name(name, spec)
-                                                    dynamic_class = model_index.get_dynamic_class_name(model_class)
-
-                                                    self.model_class_path[model_class] = module_name
-                                                    self.model_class_path[dynamic_class] = module_name
-
-                            self._spec = deep_merge(self._spec, spec_data)
-
-            for spec_path in reversed(self.get_module_dirs("spec")):
-                load_directory(spec_path)
-
-            self._expand_spec_aliases(self._spec)
+                if not cache_key or not self._load_spec_cache(cache_key):
+                    self._load_spec(spec_dirs)
+                    if cache_key:
+                        self._save_spec_cache(cache_key)
 
         return self._spec
 
     def reset_spec(self):
         self._spec = OrderedDict()
 
+    def clear_spec_cache(self):
+        try:
+            os.remove(settings.SPEC_CACHE_PATH)
+        except FileNotFoundError:
+            pass
+
+    def _load_spec(self, spec_dirs):
+        def set_command_module(module_name, spec):
+            if "base" in spec:
+                spec["_module"] = module_name
+
+            for key, value in spec.items():
+                if isinstance(value, dict):
+                    set_command_module(module_name, value)
+
+        def load_directory(base_path):
+            if settings.APP_DIR in base_path:
+                module = "core"
+                module_path = settings.APP_DIR
+            else:
+                module = base_path.replace(self.manager.module_path + "/", "").split("/")[0]
+                module_path = os.path.join(self.manager.module_path, module)
+
+            module_info = Collection(module=module, path=self._get_module_lib_dir(module_path))
+
+            for name in os.listdir(base_path):
+                file_path = os.path.join(base_path, name)
+                if os.path.isdir(file_path):
+                    load_directory(file_path)
+
+                elif self._check_spec_file(name):
+                    logger.debug(f"Loading specification from file: {file_path}")
+                    spec_data = load_yaml(file_path)
+
+                    if spec_data:
+                        for key, info in spec_data.items():
+                            if key[0] != "_":
+                                self.module_map.setdefault(key, {})
+                                if key == "roles":
+                                    for name, description in info.items():
+                                        self.module_map[key][name] = module_info
+                                else:
+                                    for name, spec in info.items():
+                                        if key == "command":
+                                            set_command_module(module, spec)
+                                        else:
+                                            app_name = spec.get("app", name)
+                                            self.module_map[key][app_name] = module_info
+
+                                            if key in ("data", "data_base", "data_mixins"):
+                                                module_name = model_index.get_module_name(key, app_name)
+                                                model_class = model_index.get_model_name(name, spec)
+                                                dynamic_class = model_index.get_dynamic_class_name(model_class)
+
+                                                self.model_class_path[model_class] = module_name
+                                                self.model_class_path[dynamic_class] = module_name
+
+                        self._spec = deep_merge(self._spec, spec_data)
+
+        for spec_path in spec_dirs:
+            load_directory(spec_path)
+
+        self._expand_spec_aliases(self._spec)
+
+    def _check_spec_file(self, name):
+        return name[0] != "_" and re.match(r"^[^\.]+\.(yml|yaml)$", name, re.IGNORECASE)
+
+    def _get_spec_cache_key(self, spec_dirs):
+        cache_key = hashlib.sha256(f"{settings.VERSION}:{sys.version}".encode())
+
+        def add_directory(base_path):
+            cache_key.update(f"\0{base_path}".encode())
+
+            for name in sorted(os.listdir(base_path)):
+                file_path = os.path.join(base_path, name)
+                if os.path.isdir(file_path):
+                    add_directory(file_path)
+
+                elif self._check_spec_file(name):
+                    file_info = os.stat(file_path)
+                    cache_key.update(f"\0{name}:{file_info.st_mtime_ns}:{file_info.st_size}".encode())
+
+        for spec_path in spec_dirs:
+            add_directory(spec_path)
+
+        return cache_key.hexdigest()
+
+    def _load_spec_cache(self, cache_key):
+        try:
+            with open(settings.SPEC_CACHE_PATH, "rb") as file:
+                cache = pickle.load(file)
+
+        except FileNotFoundError:
+            return False
+        except Exception as error:
+            logger.warning(f"Specification cache {settings.SPEC_CACHE_PATH} could not be loaded: {error}")
+            return False
+
+        if cache.get("key", None) != cache_key:
+            return False
+
+        for key, modules in cache["module_map"].items():
+            self.module_map.setdefault(key, {}).update(modules)
+
+        self.model_class_path.update(cache["model_class_path"])
+        self._spec = cache["spec"]
+
+        logger.debug(f"Loaded specification from cache: {settings.SPEC_CACHE_PATH}")
+        return True
+
+    def _save_spec_cache(self, cache_key):
+        cache = {
+            "key": cache_key,
+            "spec": self._spec,
+            "module_map": self.module_map,
+            "model_class_path": self.model_class_path,
+        }
+        temp_path = f"{settings.SPEC_CACHE_PATH}.{os.getpid()}"
+        try:
+            pathlib.Path(os.path.dirname(settings.SPEC_CACHE_PATH)).mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "wb") as file:
+                pickle.dump(cache, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temp_path, settings.SPEC_CACHE_PATH)
+
+        except Exception as error:
+            logger.warning(f"Specification cache {settings.SPEC_CACHE_PATH} could not be saved: {error}")
+            try:
+                os.remove(temp_path)
+            except FileNotFoundError:
+                pass
+
     def _expand_spec_aliases(self, spec):
         for key, info in spec.items():
             if isinstance(info, dict):
@@ -151,25 +245,55 @@ class Indexer(module.IndexerModuleMixin, django.IndexerDjangoMixin, component.In
         return command_index.find_command(*args, **kwargs)
 
     def get_plugin_base(self, name):
-        return self._plugin_providers[name]["base"]
+        return self._get_plugin(name)["base"]
 
     @lru_cache(maxsize=None)
     def get_plugin_providers(self, name, include_system=False):
         providers = {}
-        for provider, provider_class in self._plugin_providers[name]["providers"].items():
+        for provider, provider_class in self._get_plugin(name)["providers"].items():
             if include_system or not provider_class.check_system():
                 providers[provider] = provider_class
         return providers
 
+    def _get_plugin(self, name):
+        if name not in self._plugin_providers:
+            with self._generation_lock:
+                if name not in self._plugin_providers:
+                    with self.profile_phase("plugins (lazy)"):
+                        self.generate_plugin(name, self.spec.get("plugin", {})[name])
+
+        return self._plugin_providers[name]
+
+    @contextmanager
+    def profile_phase(self, name):
+        # Phase times exclude nested phases so the report adds up to the total time spent generating
+        nested_times = self._profile_state.__dict__.setdefault("nested_times", [])
+        start_time = time.perf_counter()
+        nested_times.append(0)
+        try:
+            yield
+        finally:
+            elapsed_time = time.perf_counter() - start_time
+            phase_time = elapsed_time - nested_times.pop()
+            if nested_times:
+                nested_times[-1] += elapsed_time
+
+            with self._profile_lock:
+                self.startup_profile[name] = self.startup_profile.get(name, 0) + phase_time
+
     def generate(self):
         self.print_spec()
         if getattr(settings, "DB_LOCK", None):
-            self.generate_data_structures()
+            with self.profile_phase("data models"):
+                self.generate_data_structures()
 
-        self.generate_plugins()
+        if not settings.LAZY_GENERATION:
+            with self.profile_phase("plugins"):
+                self.generate_plugins()
 
         if len(sys.argv) > 1 and sys.argv[1] != "makemigrations":
-            self.generate_commands()
+            with self.profile_phase("commands"):
+                self.generate_commands()
 
         self.print_results()
 
@@ -196,6 +320,13 @@ class Indexer(module.IndexerModuleMixin, django.IndexerDjangoMixin, component.In
             logger.info(f"    - {self._models[name].facade_class}")
 
     def generate_commands(self):
+        logger.info("* Generating command tree")
+        self._command_tree = command_index.generate_command_tree(self.spec.get("command", {}))
+
+        if not settings.LAZY_GENERATION:
+            self.generate_command_classes()
+
+    def generate_command_classes(self):
         logger.info("* Generating command mixins")
         for name, spec in self.spec.get("command_mixins", {}).items():
             logger.info(f" > {name}")
@@ -208,22 +339,26 @@ class Indexer(module.IndexerModuleMixin, django.IndexerDjangoMixin, component.In
             self._base_commands[name] = command_index.BaseCommand(name)
             logger.info(f"    - {self._base_commands[name]}")
 
-        logger.info("* Generating command tree")
-        self._command_tree = command_index.generate_command_tree(self.spec.get("command", {}))
+        logger.info("* Loading command tree")
+        if self._command_tree:
+            self._command_tree.load_subcommands(True)
 
     def generate_plugins(self):
         logger.info("* Generating base plugins")
         for name, spec in self.spec.get("plugin", {}).items():
-            logger.info(f" > {name}")
-            self._plugin_providers[name] = {"base": plugin_index.BasePlugin(name, True), "providers": {}}
-            logger.info("    - {}".format(self._plugin_providers[name]["base"]))
+            with self._generation_lock:
+                self.generate_plugin(name, spec)
+
+    def generate_plugin(self, name, spec):
+        logger.info(f" > {name}")
+        plugin = {"base": plugin_index.BasePlugin(name, True), "providers": {}}
+        logger.info("    - {}".format(plugin["base"]))
 
-            providers = {}
-            for provider_name, info in spec.get("providers", {}).items():
-                providers[provider_name] = plugin_index.BaseProvider(name, provider_name, True)
-                logger.info(f"      - {providers[provider_name]}")
+        for provider_name, info in spec.get("providers", {}).items():
+            plugin["providers"][provider_name] = plugin_index.BaseProvider(name, provider_name, True)
+            logger.info("      - {}".format(plugin["providers"][provider_name]))
 
-            self._plugin_providers[name]["providers"] = providers
+        self._plugin_providers[name] = plugin
 
     def print_spec(self):
         if settings.LOG_LEVEL == "debug":
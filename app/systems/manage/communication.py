@@ -11,6 +11,10 @@ def channel_communication_key(key):
     return f"channel:comm:{key}"
 
 
+def channel_broadcast_key(key):
+    return f"channel:broadcast:{key}"
+
+
 def channel_listen_base_state_key(key):
     return f"manager-listen-state-{key}"
 
@@ -107,6 +111,47 @@ class ManagerCommunicationMixin:
             except Exception as error:
                 raise CommunicationError(f"Send to channel {channel} failed with error: {error}")
 
+    def broadcast(self, channel, message, sender=""):
+        connection = self.communication_connection()
+        if connection:
+            try:
+                if isinstance(message, Collection):
+                    message = message.export()
+
+                return connection.publish(
+                    channel_broadcast_key(channel),
+                    dump_json({"time": Time().now_string, "sender": sender, "message": message}),
+                )
+            except Exception as error:
+                raise CommunicationError(f"Broadcast to channel {channel} failed with error: {error}")
+        return None
+
+    def subscribe(self, *channels):
+        connection = self.communication_connection()
+        if connection:
+            try:
+                subscription = connection.pubsub(ignore_subscribe_messages=True)
+                subscription.subscribe(*[channel_broadcast_key(channel) for channel in channels])
+                return subscription
+            except Exception as error:
+                raise CommunicationError(f"Subscription to channels {', '.join(channels)} failed with error: {error}")
+        return None
+
+    def receive(self, subscription, timeout=1):
+        try:
+            package = subscription.get_message(timeout=timeout)
+        except Exception as error:
+            raise CommunicationError(f"Receive from subscription failed with error: {error}")
+
+        if package and package["type"] == "message":
+            package = load_json(package["data"])
+            return Collection(
+                time=Time().to_datetime(package["time"]),
+                sender=package["sender"],
+                message=package["message"],
+            )
+        return None
+
     def delete_stream(self, channel):
         connection = self.communication_connection()
         if connection:
@@ -177,7 +177,7 @@ class ManagerServiceMixin:
 
     def initialize_services(self, names=None):
         if self.client and names:
-            services = self.get_spec("services")
+            services = copy.deepcopy(self.get_spec("services"))
             names = dependents(services, ensure_list(names))
 
             def start_service(service_name):
@@ -6,13 +6,15 @@ import pathlib
 from django.conf import settings
 from systems.indexer import Indexer
 from systems.manage import cluster, communication, runtime, service, task, template
-from utility.data import normalize_value
+from utility.data import freeze, get_size, normalize_value
 from utility.runtime import Runtime
 from utility.terminal import TerminalMixin
 from utility.text import interpolate
 
 logger = logging.getLogger(__name__)
 
+_missing_spec = object()
+
 
 class ProviderError(Exception):
     pass
@@ -38,6 +40,10 @@ class Manager(
         self.index.update_search_path()
         self.index.collect_environment()
 
+        self.spec_views = {}
+        self.spec_view_source = None
+        self.spec_copy_bytes_avoided = 0
+
         self.active_command = None
 
     def set_command(self, command):
@@ -86,11 +92,25 @@ class Manager(
         if default is None:
             default = {}
 
-        for index, element in enumerate(location):
-            inner_default = default if index == len(location) - 1 else {}
-            spec = spec.get(element, inner_default)
+        # Specification views are frozen and shared, so callers that need to make changes must copy them first
+        location = tuple(location)
+        if self.spec_view_source is not spec:
+            self.spec_views = {}
+            self.spec_view_source = spec
+
+        if location in self.spec_views:
+            spec, size = self.spec_views[location]
+            self.spec_copy_bytes_avoided += size
+            return spec
+
+        for element in location:
+            spec = spec.get(element, _missing_spec)
+            if spec is _missing_spec:
+                return copy.deepcopy(default)
 
-        return copy.deepcopy(spec)
+        spec = freeze(spec)
+        self.spec_views[location] = (spec, get_size(spec))
+        return spec
 
     def reset_spec(self):
         self.index.reset_spec()
@@ -1,4 +1,3 @@
-import copy
 import importlib
 import logging
 import time
@@ -107,7 +106,7 @@ class BaseModelMixin(django.Model):
 
     @property
     def facade_clone(self):
-        return copy.deepcopy(self.facade)
+        return self.facade.query()
 
     @property
     def new_facade(self):
@@ -217,7 +216,7 @@ class BaseMetaModel(ModelBase):
 
     @property
     def facade_clone(cls):
-        return copy.deepcopy(cls.facade)
+        return cls.facade.query()
 
     @property
     def new_facade(cls):
@@ -48,7 +48,7 @@ class DataQuery:
     def clone(self):
         instance = DataQuery(self.command, self.name, self.config.export())
         instance.merge_identities = copy.deepcopy(self.merge_identities)
-        instance.facade = copy.deepcopy(self.facade)
+        instance.facade = self.facade.query()
         instance.dataframe = self.dataframe
         return instance
 
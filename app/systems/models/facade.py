@@ -1,7 +1,8 @@
+import copy
 import threading
 
 from django.conf import settings
-from utility.data import flatten
+from utility.data import LRUCache, flatten
 from utility.terminal import TerminalMixin
 
 from .errors import ProviderError
@@ -19,6 +20,7 @@ class ModelFacade(
     render.ModelFacadeRenderMixin,
 ):
     _viewset = {}
+    _parser_cache = {}
 
     thread_lock = threading.Lock()
 
@@ -26,9 +28,22 @@ class ModelFacade(
         self.model = cls
         self.name = self.meta.verbose_name.replace(" ", "_")
         self.plural = self.meta.verbose_name_plural.replace(" ", "_")
+        self._base_facade = self
 
         super().__init__()
 
+    def __deepcopy__(self, memo):
+        return self.query()
+
+    def query(self):
+        # Handles share the facade metadata and carry their own copy of the query state
+        handle = copy.copy(self)
+        handle._order = list(self._order) if self._order else None
+        handle._scope = dict(self._scope)
+        handle._annotations = dict(self._annotations)
+        handle.intermediate_fields = list(self.intermediate_fields)
+        return handle
+
     @property
     def manager(self):
         return settings.MANAGER
@@ -56,6 +71,9 @@ class ModelFacade(
             self._viewset[self.name] = DataViewSet(self)
         return self._viewset[self.name]
 
+    def get_parser_cache(self, type):
+        return self._parser_cache.setdefault(f"{self.name}:{type}", LRUCache(settings.QUERY_PARSER_CACHE_SIZE))
+
     def check_api_enabled(self):
         return False
 
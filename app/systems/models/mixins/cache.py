@@ -0,0 +1,14 @@
+from functools import lru_cache, wraps
+
+
+def facade_cache(method):
+    cached_method = lru_cache(maxsize=None)(method)
+
+    # Query handles share their base facade cache entries instead of filling the cache per copy
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return cached_method(self._base_facade, *args, **kwargs)
+
+    wrapper.cache_clear = cached_method.cache_clear
+    wrapper.cache_info = cached_method.cache_info
+    return wrapper
@@ -1,6 +1,5 @@
 import re
 from collections import OrderedDict
-from functools import lru_cache
 
 from django.conf import settings
 from django.db.models.fields import NOT_PROVIDED, Field
@@ -10,6 +9,7 @@ from django.db.models.fields.reverse_related import ForeignObjectRel
 from utility.data import ensure_list
 
 from ..parsers.fields import FieldParser, FieldProcessor
+from .cache import facade_cache
 
 
 class ModelFacadeFieldMixin:
@@ -41,7 +41,7 @@ class ModelFacadeFieldMixin:
         return self.pk
 
     @property
-    @lru_cache(maxsize=None)
+    @facade_cache
     def field_instances(self):
         fields = list(self.meta.fields)
         for field in self.dynamic_fields:
@@ -49,7 +49,7 @@ class ModelFacadeFieldMixin:
         return fields
 
     @property
-    @lru_cache(maxsize=None)
+    @facade_cache
     def system_field_instances(self):
         fields = []
         for field in self.field_instances:
@@ -64,7 +64,7 @@ class ModelFacadeFieldMixin:
         return fields
 
     @property
-    @lru_cache(maxsize=None)
+    @facade_cache
     def editable_field_instances(self):
         fields = []
         for field in self.field_instances:
@@ -73,7 +73,7 @@ class ModelFacadeFieldMixin:
         return fields
 
     @property
-    @lru_cache(maxsize=None)
+    @facade_cache
     def field_index(self):
         return {field.name: field for field in self.meta.get_fields()}
 
@@ -127,14 +127,14 @@ class ModelFacadeFieldMixin:
         return self._get_field_type_map("dict")
 
     @property
-    @lru_cache(maxsize=None)
+    @facade_cache
     def scope_fields(self):
         if getattr(self.meta, "scope", None):
             return ensure_list(self.meta.scope)
         return []
 
     @property
-    @lru_cache(maxsize=None)
+    @facade_cache
     def scope_parents(self):
         fields = OrderedDict()
         for name in self.scope_fields:
@@ -161,7 +161,7 @@ class ModelFacadeFieldMixin:
 
         if fields:
             with self.thread_lock:
-                parser = FieldParser(self)
+                parser = FieldParser(self, cache=self.get_parser_cache("field"))
 
                 for field in ensure_list(fields):
                     field = re.sub(r"\.+", "__", field)
@@ -210,8 +210,12 @@ class ModelFacadeFieldMixin:
             "DictionaryField": "dict",
             **settings.FIELD_TYPE_MAP,
         }
-        if not getattr(self, "_field_type_map", None):
-            self._field_type_map = {
+
+        # Query handles share the field type map of their base facade
+        facade = self._base_facade
+
+        if not getattr(facade, "_field_type_map", None):
+            field_type_map = {
                 "bool": [],
                 "text": [],
                 "number": [],
@@ -229,11 +233,13 @@ class ModelFacadeFieldMixin:
                     if field_class_name in field_type_index:
                         field_type = field_type_index[field_class_name]
 
-                    if field_type and field_type in self._field_type_map:
-                        self._field_type_map[field_type].append(field_name)
+                    if field_type and field_type in field_type_map:
+                        field_type_map[field_type].append(field_name)
+
+                    field_type_map["atomic"][field_name] = True
 
-                    self._field_type_map["atomic"][field_name] = True
+            facade._field_type_map = field_type_map
 
         if type == "atomic":
-            return list(self._field_type_map[type].keys())
-        return self._field_type_map[type]
+            return list(facade._field_type_map[type].keys())
+        return facade._field_type_map[type]
@@ -1,14 +1,14 @@
 import re
-from functools import lru_cache
 
 from django.db.models import Q
 
 from ..parsers.filters import FilterParser
 from ..parsers.function import FunctionParser
+from .cache import facade_cache
 
 
 class ModelFacadeFilterMixin:
-    @lru_cache(maxsize=None)
+    @facade_cache
     def get_scope_filters(self, instance):
         filters = {}
 
@@ -22,8 +22,8 @@ class ModelFacadeFilterMixin:
 
     def parse_filters(self, filters):
         with self.thread_lock:
-            filter_parser = FilterParser(self)
-            function_parser = FunctionParser(self)
+            filter_parser = FilterParser(self, cache=self.get_parser_cache("filter"))
+            function_parser = FunctionParser(self, cache=self.get_parser_cache("function"))
 
         def _parse_filter_value(value):
             if isinstance(value, dict):
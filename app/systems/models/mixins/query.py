@@ -36,6 +36,15 @@ class ModelFacadeQueryMixin:
     def get_scope(self):
         return self._scope
 
+    def order(self, order):
+        return self.query().set_order(order)
+
+    def limit(self, limit):
+        return self.query().set_limit(limit)
+
+    def scope(self, filters):
+        return self.query().set_scope(dict(filters))
+
     def get_scope_name(self):
         return get_identifier([value for key, value in self.get_scope().items()])
 
@@ -122,7 +131,7 @@ class ModelFacadeQueryMixin:
 
         if fields:
             with self.thread_lock:
-                parser = OrderParser(self)
+                parser = OrderParser(self, cache=self.get_parser_cache("order"))
 
                 for field in ensure_list(fields):
                     field = re.sub(r"\.+", "__", field)
@@ -1,12 +1,13 @@
 import re
-from functools import lru_cache
 
 from django.db.models.fields.related import ForeignKey, ManyToManyField, OneToOneField
 from django.db.models.fields.reverse_related import ManyToManyRel, ManyToOneRel, OneToOneRel
 
+from .cache import facade_cache
+
 
 class ModelFacadeRelationMixin:
-    @lru_cache(maxsize=None)
+    @facade_cache
     def get_children(self, recursive=False):
         children = []
 
@@ -24,7 +25,7 @@ class ModelFacadeRelationMixin:
                             children.extend(model.facade.get_children(True))
         return children
 
-    @lru_cache(maxsize=None)
+    @facade_cache
     def get_parent_relations(self):
         parent_relations = {}
         for field in self.meta.get_fields():
@@ -38,7 +39,7 @@ class ModelFacadeRelationMixin:
                 }
         return parent_relations
 
-    @lru_cache(maxsize=None)
+    @facade_cache
     def get_scope_relations(self):
         scope_relations = {}
         for field in self.meta.get_fields():
@@ -52,7 +53,7 @@ class ModelFacadeRelationMixin:
                 }
         return scope_relations
 
-    @lru_cache(maxsize=None)
+    @facade_cache
     def get_extra_relations(self):
         scope_fields = self.scope_fields
         relations = {}
@@ -73,11 +74,11 @@ class ModelFacadeRelationMixin:
                     }
         return relations
 
-    @lru_cache(maxsize=None)
+    @facade_cache
     def get_referenced_relations(self):
         return {**self.get_scope_relations(), **self.get_extra_relations()}
 
-    @lru_cache(maxsize=None)
+    @facade_cache
     def get_reverse_relations(self):
         relations = {}
         for field in self.meta.get_fields():
@@ -99,7 +100,7 @@ class ModelFacadeRelationMixin:
                     relations[field.name] = field_info
         return relations
 
-    @lru_cache(maxsize=None)
+    @facade_cache
     def get_all_relations(self):
         return {**self.get_referenced_relations(), **self.get_reverse_relations()}
 
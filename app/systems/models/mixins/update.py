@@ -2,6 +2,7 @@ import logging
 import re
 
 from django.db.models import Model
+from django.utils.timezone import now
 from utility.data import ensure_list, normalize_dict
 from utility.query import get_queryset
 
@@ -116,6 +117,76 @@ class ModelFacadeUpdateMixin:
         self.save_relations(instance, relations, relation_key=relation_key, command=command)
         return (instance, created)
 
+    def bulk_update_field(self, field, values, batch_size=None):
+        timestamp = now()
+        instances = []
+
+        for id, value in values.items():
+            instance = self.model(**{self.pk: id, field: value})
+            instance.updated = timestamp
+            instances.append(instance)
+
+        if not instances:
+            return 0
+        return self.model.objects.bulk_update(instances, [field, "updated"], batch_size=batch_size)
+
+    def check_bulk_store(self):
+        if getattr(self, "provider_name", None) or not self.check_bulk_save_methods():
+            return False
+        instance = self.create(None)
+        return "created" not in ensure_list(getattr(instance, "get_id_fields", list)())
+
+    def check_bulk_save_methods(self):
+        # Bulk stores only reproduce the base resource saves, so custom saves and save triggers need instance saves
+        from data.base.id_resource import IdentifierResourceBase
+        from data.base.name_resource import NameResourceBase
+        from systems.models.base import BaseModelMixin
+
+        bulk_classes = (Model, BaseModelMixin, IdentifierResourceBase, NameResourceBase)
+
+        for klass in self.model.__mro__:
+            if "save" in klass.__dict__ and not any(klass is bulk_class for bulk_class in bulk_classes):
+                return False
+        return True
+
+    def bulk_store(self, records, batch_size=None):
+        timestamp = now()
+        instances = {}
+        update_fields = {"updated"}
+
+        for key, values in records:
+            scope, fields, relations, reverse = self.split_field_values(values)
+            if relations or reverse:
+                raise UpdateError(f"Bulk store of {self.name} {key} does not support multiple or reverse relations")
+
+            self.set_scope(scope)
+            instance = self.create(key, dict(scope))
+
+            for field, value in self.process_fields(fields, instance).items():
+                setattr(instance, field, value)
+
+            if getattr(instance, "_prepare_save", None):
+                instance._prepare_save()
+
+            if getattr(instance, "get_id", None):
+                instance.get_id()
+
+            instance.created = timestamp
+            instance.updated = timestamp
+            instances[getattr(instance, self.pk)] = instance
+            update_fields.update(field for field in [*scope.keys(), *fields.keys()] if field != self.pk)
+
+        if not instances:
+            return []
+
+        return self.model.objects.bulk_create(
+            list(instances.values()),
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=[self.pk],
+            update_fields=list(update_fields),
+        )
+
     def save_relations(self, instance, relations, relation_key=False, command=None):
         relation_index = self.get_extra_relations()
         resave = False
@@ -1,7 +1,9 @@
+import copy
 import logging
 import operator
 import sys
-from types import MethodType
+import threading
+from types import MethodType, SimpleNamespace
 
 import ply.lex as lex
 import ply.yacc as yacc
@@ -114,19 +116,73 @@ class BaseParser:
         "^": operator.pow,
     }
 
+    parser_tables = {}
+    parser_lock = threading.Lock()
+
     #
     # Parser initialization
     #
-    def __init__(self, facade=None):
+    def __init__(self, facade=None, cache=None):
         self.facade = facade
+        self.cache = cache
+        self.annotations = None
 
         self.generate()
 
-        self.lexer = lex.lex(module=self, optimize=False, debug=False, errorlog=PlyLogger(sys.stderr))
-        self.parser = yacc.yacc(
-            module=self, start="statement", optimize=False, debug=False, write_tables=False, errorlog=PlyLogger(sys.stderr)
+        self.lexer = None
+        self.parser = None
+
+    def get_parser(self):
+        # Bind the shared class tables to this instance on first parse
+        if self.parser is None:
+            lexer, parser = self.get_tables()
+
+            self.lexer = lexer.clone(self)
+            self.lexer.begin(self.lexer.lexstate)
+            self.parser = yacc.LRParser(
+                SimpleNamespace(
+                    lr_productions=[self._bind_production(production) for production in parser.productions],
+                    lr_action=parser.action,
+                    lr_goto=parser.goto,
+                ),
+                self.p_error,
+            )
+        return self.parser
+
+    @classmethod
+    def get_tables(cls):
+        # Lexer and LALR tables only depend on the parser class
+        with cls.parser_lock:
+            if cls not in cls.parser_tables:
+                cls.parser_tables[cls] = cls.build_tables()
+            return cls.parser_tables[cls]
+
+    @classmethod
+    def build_tables(cls):
+        parser = cls.__new__(cls)
+        parser.facade = None
+        parser.cache = None
+        parser.annotations = None
+        parser.lexer = None
+        parser.parser = None
+        parser.generate()
+
+        lexer = lex.lex(module=parser, optimize=False, debug=False, errorlog=PlyLogger(sys.stderr))
+        return lexer, yacc.yacc(
+            module=parser,
+            start="statement",
+            optimize=False,
+            debug=False,
+            write_tables=False,
+            errorlog=PlyLogger(sys.stderr),
         )
 
+    def _bind_production(self, production):
+        production = copy.copy(production)
+        if production.func:
+            production.callable = getattr(self, production.func)
+        return production
+
     #
     # Parser evaluation
     #
@@ -144,7 +200,27 @@ class BaseParser:
     def evaluate(self, value):
         logger.debug(f"===== Query filter statement ===== ( {value} )")
         logger.debug(f"  === Active base parsers === {self.base_parsers}")
-        return self.parser.parse(value)
+
+        if self.cache is None:
+            return self.get_parser().parse(value, lexer=self.lexer)
+
+        cached = self.cache.get(value)
+        if cached is None:
+            self.annotations = {}
+            try:
+                cached = self.cache.set(value, (self.get_parser().parse(value, lexer=self.lexer), self.annotations))
+            finally:
+                self.annotations = None
+        elif self.facade:
+            self.facade.add_annotations(**cached[1])
+
+        return cached[0]
+
+    def add_annotations(self, **annotations):
+        if self.annotations is not None:
+            self.annotations.update(annotations)
+        if self.facade:
+            self.facade.add_annotations(**annotations)
 
     def process(self, statement):
         # Override in subclass if needed
@@ -429,8 +505,7 @@ def p_db_function(self, p):
     field_name = ":".join(p[1])
     function = p[1][1]
     annotations = {field_name: [function, F(p[1][0])]}
-    if self.facade:
-        self.facade.add_annotations(**annotations)
+    self.add_annotations(**annotations)
 
     p[0] = F(field_name)
     logger.debug(f"db_function: {p[0]} {annotations}")
@@ -452,9 +527,7 @@ def p_db_function_with_params(self, p):
             options[parameter[1]] = parameter[2]
 
     annotations = {field_name: [function, *arguments, options]}
-
-    if self.facade:
-        self.facade.add_annotations(**annotations)
+    self.add_annotations(**annotations)
 
     p[0] = F(field_name)
     logger.debug(f"db_function: {p[0]} {annotations}")
@@ -25,9 +25,7 @@ class FieldParser(FieldProcessorParser, BaseParser):
             logger.debug(f"name = processor: {p[0]}")
         else:
             annotations = {p[1]: p[3]}
-
-            if self.facade:
-                self.facade.add_annotations(**annotations)
+            self.add_annotations(**annotations)
 
             p[0] = p[1]
             logger.debug(f"name = value: {p[0]} {annotations}")
@@ -7,3 +7,30 @@ class BaseTest:
 
     def exec(self):
         raise NotImplementedError("Subclasses of BaseTest must implement exec method")
+
+    def exec_methods(self, prefix, message=None):
+        # Assertion helpers defined here share the check_ prefix with test methods
+        for name in sorted(dir(self)):
+            if name.startswith(prefix) and not hasattr(BaseTest, name):
+                tag = name.removeprefix(prefix)
+
+                if (not self.tags or tag in self.tags) and tag not in self.exclude_tags:
+                    if message:
+                        self.command.notice(message.format(tag))
+                    getattr(self, name)()
+
+    def check(self, success, message, error=None):
+        if not success:
+            self.command.error(error if error else f"Failed: {message}")
+        self.command.success(message)
+
+    def check_equal(self, value, expected, message):
+        self.check(value == expected, message, f"Failed: {message}\n\n{value}\n\n!=\n\n{expected}")
+
+    def check_raises(self, exception_class, callback, message):
+        try:
+            callback()
+        except exception_class:
+            self.command.success(message)
+            return
+        self.command.error(f"Failed: {message} (no {exception_class.__name__} raised)")
@@ -0,0 +1,146 @@
+import copy
+import time
+
+from django.conf import settings
+from systems.models.parsers.fields import FieldParser
+from systems.models.parsers.filters import FilterParser
+from systems.models.parsers.order import OrderParser
+from tests.base import BaseTest
+from utility.parallel import Parallel, get_thread_pool
+
+
+class Test(BaseTest):
+    iterations = 200
+
+    def exec(self):
+        self.exec_methods("benchmark_", "Running {} benchmark...")
+
+    def measure(self, name, function, iterations=None):
+        iterations = iterations if iterations else self.iterations
+
+        start_time = time.perf_counter()
+        for index in range(iterations):
+            function()
+        average_time = (time.perf_counter() - start_time) / iterations * 1000
+
+        self.command.data(name, f"{average_time:.4f} ms")
+        return average_time
+
+    def benchmark_query_parser(self):
+        facade = self.command.facade("group", False)
+        filters = {"name__startswith": "test", "created__lt": "(updated)"}
+        order = ["-name", "(created)"]
+        fields = ["name", "provider=provider_type", "(id:COUNT)"]
+
+        def parse_rebuild():
+            for parser_class in (FilterParser, OrderParser, FieldParser):
+                parser_class.build_tables()
+            parse_uncached()
+
+        def parse_uncached():
+            FilterParser(facade).evaluate(filters["created__lt"][1:-1])
+            OrderParser(facade).evaluate(order[0])
+            for field in fields:
+                FieldParser(facade).evaluate(field.strip("()"))
+
+        def parse_cached():
+            facade.parse_filters(filters)
+            facade.parse_order(order)
+            facade.parse_fields(fields)
+
+        rebuild_time = self.measure("Per query parse (rebuilt tables)", parse_rebuild, 20)
+        self.measure("Per query parse (shared tables)", parse_uncached)
+        cached_time = self.measure("Per query parse (shared tables + expression cache)", parse_cached)
+
+        self.command.data("Speedup", f"{rebuild_time / cached_time:.1f}x")
+
+    def benchmark_spec_access(self):
+        manager = self.command.manager
+        locations = [["command", *self.command.get_full_name().split()], ["data"], ["plugin"], ["services"]]
+
+        def copy_spec():
+            for location in locations:
+                spec = manager.index.spec
+                for element in location:
+                    spec = spec.get(element, {})
+                copy.deepcopy(spec)
+
+        def shared_spec():
+            for location in locations:
+                manager.get_spec(location)
+
+        copy_time = self.measure("Spec access (deep copy)", copy_spec, 20)
+        start_bytes = manager.spec_copy_bytes_avoided
+        shared_time = self.measure("Spec access (shared views)", shared_spec)
+
+        self.command.data("Speedup", f"{copy_time / shared_time:.1f}x")
+        self.command.data(
+            "Copy bytes avoided per iteration", (manager.spec_copy_bytes_avoided - start_bytes) // self.iterations
+        )
+
+    def benchmark_spec_cache(self):
+        index = self.command.manager.index
+        spec_dirs = list(reversed(index.get_module_dirs("spec")))
+
+        def parse_spec():
+            index.reset_spec()
+            index._load_spec(spec_dirs)
+
+        def load_spec_cache():
+            index.reset_spec()
+            if not index._load_spec_cache(index._get_spec_cache_key(spec_dirs)):
+                self.command.error(f"Specification cache {settings.SPEC_CACHE_PATH} could not be loaded")
+
+        try:
+            parse_time = self.measure("Spec load (parse YAML files)", parse_spec, 5)
+            index._save_spec_cache(index._get_spec_cache_key(spec_dirs))
+            cache_time = self.measure("Spec load (compiled cache)", load_spec_cache, 20)
+        finally:
+            index.reset_spec()
+
+        self.command.data("Spec modules", len(spec_dirs))
+        self.command.data("Speedup", f"{parse_time / cache_time:.1f}x")
+
+    def benchmark_parallel(self):
+        items = list(range(settings.THREAD_COUNT))
+
+        def nested_list(shared_pool):
+            def process(item):
+                Parallel.list(items, lambda inner: inner, disable_parallel=False, shared_pool=shared_pool)
+
+            Parallel.list(items, process, disable_parallel=False, shared_pool=shared_pool)
+
+        private_time = self.measure("Nested parallel lists (thread pool per call)", lambda: nested_list(False), 20)
+        shared_time = self.measure("Nested parallel lists (shared thread pool)", lambda: nested_list(True), 20)
+
+        self.command.data("Speedup", f"{private_time / shared_time:.1f}x")
+        self.command.data("Shared pool threads", len(get_thread_pool().workers))
+        self.command.data("Shared pool tasks", get_thread_pool().metrics)
+
+    def benchmark_facade_query(self):
+        facade = self.command.facade("group", False)
+        cache_size = type(facade).field_index.fget.cache_info().currsize
+
+        def query_handle():
+            handle = facade.query().scope({"name__isnull": False}).order("name").limit(10)
+            return handle.field_index, handle.scope_parents
+
+        self.measure("Facade query handle", query_handle, 1000)
+        self.command.data(
+            "Field index cache entries added", type(facade).field_index.fget.cache_info().currsize - cache_size
+        )
+
+    def benchmark_record_cache(self):
+        names = list(self.command._config.keys())[:10]
+        if not names:
+            self.command.warning("Skipping record cache benchmark: no config records exist")
+            return
+
+        def get_config(cache):
+            for name in names:
+                self.command.get_config(name, cache=cache)
+
+        query_time = self.measure("Config lookup (database)", lambda: get_config(False))
+        cache_time = self.measure("Config lookup (record cache)", lambda: get_config(True))
+
+        self.command.data("Speedup", f"{query_time / cache_time:.1f}x")
@@ -0,0 +1,80 @@
+from django.db import transaction
+from django.test import override_settings
+from systems.cache.records import RecordCache, get_record_cache, get_record_cache_listener
+from tests.base import BaseTest
+
+
+class RollbackError(Exception):
+    pass
+
+
+class Test(BaseTest):
+    state_name = "cache_test_state"
+
+    def exec(self):
+        with override_settings(RECORD_CACHE_SECONDS=60, RECORD_CACHE_LOCAL_SECONDS=5):
+            self.exec_methods("check_")
+
+    def get_loader(self, calls, callback=None):
+        def loader(key):
+            calls.append(key)
+            if callback:
+                callback()
+            return len(calls)
+
+        return loader
+
+    def check_version(self):
+        cache = RecordCache("cache_test")
+        calls = []
+
+        cache.get("record", self.get_loader(calls, lambda: cache.invalidate("record")))
+        cache.get("record", self.get_loader(calls))
+        self.check_equal(len(calls), 2, "Records invalidated while loading are not cached")
+
+        self.check_equal(cache.get("record", self.get_loader(calls)), 2, "Loaded records are cached")
+        cache.invalidate()
+        self.check_equal(cache.get("record", self.get_loader(calls)), 3, "Invalidated records are reloaded")
+        self.check_equal((cache.hits, cache.misses), (1, 3), "Record cache hits and misses are counted")
+
+    def check_transaction(self):
+        cache = RecordCache("cache_test")
+        calls = []
+
+        with transaction.atomic():
+            cache.get("record", self.get_loader(calls))
+            cache.get("record", self.get_loader(calls))
+        self.check_equal(len(calls), 2, "Records loaded inside a transaction are not cached")
+
+    def check_rollback(self):
+        try:
+            self.command.set_state(self.state_name, 1)
+            self.check_equal(self.command.get_state(self.state_name), 1, "Committed state is cached")
+            try:
+                with transaction.atomic():
+                    self.command.set_state(self.state_name, 2)
+                    self.check_equal(self.command.get_state(self.state_name), 2, "Uncommitted state is visible")
+                    raise RollbackError()
+            except RollbackError:
+                pass
+
+            self.check_equal(self.command.get_state(self.state_name), 1, "Rolled back state is not cached")
+        finally:
+            self.command.delete_state(self.state_name)
+
+    def check_listener(self):
+        cache = get_record_cache("cache_test_listener")
+        listener = get_record_cache_listener()
+        connected = listener.connected
+        calls = []
+        try:
+            listener.connected = True
+            cache.get("record", self.get_loader(calls))
+            self.check_equal(cache.lifetime, 60, "Connected caches use the shared lifetime")
+
+            listener.disconnect()
+            cache.get("record", self.get_loader(calls))
+            self.check_equal(len(calls), 2, "Listener disconnects clear cached records")
+            self.check_equal(cache.lifetime, 5, "Disconnected caches use the local lifetime")
+        finally:
+            listener.connected = connected
@@ -0,0 +1,166 @@
+from tests.base import BaseTest
+
+
+class Test(BaseTest):
+    host_prefix = "calculation_test_"
+    hosts = {
+        "a1": {"user": "calculation_a", "command_port": 10, "data_port": 0},
+        "a2": {"user": "calculation_a", "command_port": 20, "data_port": 0},
+        "a3": {"user": "calculation_a", "command_port": 30, "data_port": 0},
+        "b1": {"user": "calculation_b", "command_port": 5, "data_port": 0},
+        "b2": {"user": "calculation_b", "command_port": 15, "data_port": 0},
+    }
+    # Parameter "b" reads values saved earlier in the same run
+    saved_params = {
+        "a": "command_port",
+        "b": {"field": "data_port", "filters": {"user": "@user"}, "order": "-data_port", "limit": 1},
+    }
+
+    # Ordered series with a tie (equal values) and a missing value in the first scope
+    series_hosts = {
+        "s1": {"user": "calculation_a", "command_port": 1, "data_port": 4},
+        "s2": {"user": "calculation_a", "command_port": 2, "data_port": 7},
+        "s3": {"user": "calculation_a", "command_port": 2, "data_port": 7},
+        "s4": {"user": "calculation_a", "command_port": 3, "data_port": 9},
+        "s5": {"user": "calculation_a", "command_port": 5, "data_port": 1},
+        "s6": {"user": "calculation_a", "command_port": 6, "data_port": None},
+        "s7": {"user": "calculation_a", "command_port": 8, "data_port": 6},
+        "s8": {"user": "calculation_b", "command_port": 1, "data_port": 2},
+        "s9": {"user": "calculation_b", "command_port": 4, "data_port": 8},
+        "s10": {"user": "calculation_b", "command_port": 7, "data_port": 5},
+    }
+
+    def exec(self):
+        self.facade = self.command.facade("host", False)
+        try:
+            self.exec_methods("check_")
+        finally:
+            self.facade.clear(name__startswith=self.host_prefix)
+
+    def load_hosts(self, hosts):
+        self.facade.clear(name__startswith=self.host_prefix)
+
+        for name, values in hosts.items():
+            self.facade.store(f"{self.host_prefix}{name}", {"host": "https://calculation.example.com", **values})
+
+    def get_host_values(self, field, **filters):
+        return {
+            record["name"]: record[field]
+            for record in self.facade.values("name", field, name__startswith=self.host_prefix, **filters)
+        }
+
+    def run_calculation(self, provider, field, hosts, reset=True, **config):
+        self.load_hosts(hosts)
+        self.command.get_provider(
+            "calculation",
+            provider,
+            f"test:{provider}:{field}",
+            {"data": "host", "field": field, "filters": {"name__startswith": self.host_prefix}, **config},
+        ).process(reset)
+
+    def capture_calculation(self, provider, **config):
+        calculation = self.command.get_provider(
+            "calculation",
+            provider,
+            f"test:{provider}:capture",
+            {"data": "host", "field": "data_port", "filters": {"name__startswith": self.host_prefix}, **config},
+        )
+        results = {}
+        calculation._save_column = lambda facade, value, record: results.__setitem__(record[facade.pk], value)
+        calculation._save_columns = lambda facade, values: results.update(values)
+        calculation.process(True)
+        return results
+
+    def compare_close(self, values, expected, message):
+        def close(value, expected_value):
+            if value is None or expected_value is None:
+                return value is None and expected_value is None
+            return abs(value - expected_value) <= 1e-9 * max(1, abs(expected_value))
+
+        self.check(
+            values.keys() == expected.keys() and all(close(values[key], expected[key]) for key in expected),
+            message,
+            f"Failed: {message}\n\n{values}\n\n!=\n\n{expected}",
+        )
+
+    def check_batch(self):
+        column_params = {
+            "a": "command_port",
+            "b": {"field": "command_port", "filters": {"user": "@user"}, "order": "command_port", "limit": 1},
+        }
+
+        def run(params, batch_size):
+            self.run_calculation("addition", "data_port", self.hosts, params=params, batch_size=batch_size)
+            return self.get_host_values("data_port")
+
+        self.check(
+            not self.command.facade("config", False).check_bulk_save_methods(),
+            "Records with custom model saves are not bulk updated",
+        )
+        self.check_equal(run(column_params, 2), run(column_params, None), "Batch calculations match per record calculations")
+        self.check_equal(
+            run(self.saved_params, 2),
+            run(self.saved_params, None),
+            "Batch calculations reading saved values match per record calculations",
+        )
+
+    def check_query_cache(self):
+        record_hosts = {**self.hosts, "r0": {"user": "calculation_record", "command_port": 0}}
+        record_config = {
+            "filters": {"name__startswith": self.host_prefix, "user": "calculation_a"},
+            "record": {
+                "_data": "host",
+                "name": "@{name}_record",
+                "host": "https://calculation.example.com",
+                "user": "calculation_record",
+            },
+            "params": {
+                "a": "command_port",
+                "b": {
+                    "field": "command_port",
+                    "filters": {"user": "calculation_record"},
+                    "order": "-command_port",
+                    "limit": 1,
+                },
+            },
+        }
+
+        def run_column(cache_size):
+            self.run_calculation("addition", "data_port", self.hosts, params=self.saved_params, query_cache_size=cache_size)
+            return self.get_host_values("data_port")
+
+        def run_record(cache_size):
+            self.run_calculation("addition", "command_port", record_hosts, query_cache_size=cache_size, **record_config)
+            return self.get_host_values("command_port", user="calculation_record")
+
+        self.check_equal(run_column(1000), run_column(0), "Cached column calculations match uncached calculations")
+        self.check_equal(run_record(1000), run_record(0), "Cached record calculations match uncached calculations")
+
+    def check_vectorize(self):
+        self.load_hosts(self.series_hosts)
+
+        def series_query(descending=True, limit=None):
+            query = {
+                "field": "data_port",
+                "filters": {"user": "@user", f"command_port__{'lte' if descending else 'gte'}": "@command_port"},
+                "order": "-command_port" if descending else "command_port",
+            }
+            if limit:
+                query["limit"] = limit
+            return query
+
+        for provider, config in (
+            ("stdev", {"params": {"a": series_query(limit=3)}}),
+            ("stdev", {"params": {"a": series_query(descending=False, limit=3)}}),
+            ("stdev", {"params": {"a": series_query(limit=2)}, "min_values": 3}),
+            ("cov", {"params": {"a": series_query()}}),
+            ("zscore", {"params": {"a": series_query(limit=3)}}),
+            ("zscore", {"params": {"a": series_query(limit=3)}, "reverse": True}),
+            ("min_max_scale", {"params": {"a": series_query(limit=4)}, "min_values": 3}),
+            ("min_max_scale", {"params": {"a": series_query(descending=False, limit=4)}, "reverse": True}),
+        ):
+            self.compare_close(
+                self.capture_calculation(provider, vectorize=True, window_scope="user", **config),
+                self.capture_calculation(provider, **config),
+                f"Vectorized {provider} calculations match per record calculations: {config}",
+            )
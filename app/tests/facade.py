@@ -0,0 +1,53 @@
+from tests.base import BaseTest
+
+
+class Test(BaseTest):
+    group_prefix = "facade_test_"
+
+    def exec(self):
+        self.facade = self.command.facade("group", False)
+        try:
+            for index in range(5):
+                self.facade.store(f"{self.group_prefix}{index}", {"provider_type": "base"})
+
+            self.exec_methods("check_")
+        finally:
+            self.facade.clear(name__startswith=self.group_prefix)
+
+    def get_state(self, facade):
+        return {
+            "order": facade._order,
+            "limit": facade._limit,
+            "scope": dict(facade._scope),
+            "annotations": {field: str(annotation) for field, annotation in facade._annotations.items()},
+            "intermediate_fields": list(facade.intermediate_fields),
+        }
+
+    def check_handles(self):
+        base_state = self.get_state(self.facade)
+        scoped = self.facade.scope({"name__startswith": self.group_prefix})
+        ordered = scoped.order("-name")
+        limited = ordered.limit(2)
+        annotated = limited.query()
+        annotated.parse_fields(["name", "(id:COUNT)"])
+
+        self.check_equal(self.get_state(self.facade), base_state, "Query handles leave the base facade unchanged")
+        self.check_equal(
+            (scoped._order, scoped._limit, ordered._limit, self.get_state(limited)["annotations"]),
+            (None, None, None, base_state["annotations"]),
+            "Query builders return new handles",
+        )
+        self.check(annotated.get_annotations(False), "Query handles carry their own annotations")
+        self.check_equal(
+            list(limited.field_values("name")),
+            [f"{self.group_prefix}4", f"{self.group_prefix}3"],
+            "Query handles apply their own scope, order and limit",
+        )
+        self.check(
+            len(self.facade.field_values("name", name__startswith=self.group_prefix)) == 5,
+            "Base facade queries ignore handle scope, order and limit",
+        )
+        self.check(
+            limited.field_index is self.facade.field_index and limited._base_facade is self.facade._base_facade,
+            "Query handles share base facade metadata",
+        )
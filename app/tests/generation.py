@@ -0,0 +1,86 @@
+from systems.commands import index as command_index
+from systems.commands.router import RouterCommand
+from systems.indexer import Indexer
+from tests.base import BaseTest
+
+
+class Test(BaseTest):
+    def exec(self):
+        self.exec_methods("check_")
+
+    def get_listing(self, command, listing=None):
+        if listing is None:
+            listing = {}
+
+        if isinstance(command, RouterCommand):
+            subcommands = command.get_subcommands()
+            listing[command.get_full_name()] = [subcommand.name for subcommand in subcommands]
+
+            for subcommand in subcommands:
+                self.get_listing(subcommand, listing)
+        return listing
+
+    def find_commands(self, command_tree, names):
+        index = self.manager.index
+        base_tree = index._command_tree
+        results = {}
+        try:
+            index._command_tree = command_tree
+            for name in names:
+                command = index.find_command(name)
+                results[name] = (command.get_full_name(), type(command).__name__)
+        finally:
+            index._command_tree = base_tree
+        return results
+
+    def check_command_tree(self):
+        spec = self.manager.index.spec.get("command", {})
+        eager_tree = command_index.generate_command_tree(spec)
+        eager_tree.load_subcommands(True)
+        eager_listing = self.get_listing(eager_tree)
+
+        names = [
+            f"{parent} {name}".strip()
+            for parent, subcommands in eager_listing.items()
+            for name in subcommands
+            if f"{parent} {name}".strip() not in eager_listing
+        ]
+        lazy_tree = command_index.generate_command_tree(spec)
+        lazy_results = self.find_commands(lazy_tree, names[:1])
+
+        self.check(lazy_tree._subcommand_loaders, "Finding a lazy command only generates the commands on its path")
+        self.check_equal(
+            self.get_listing(lazy_tree), eager_listing, "Lazy command tree subcommands match the eager command tree"
+        )
+        self.check_equal(
+            {**lazy_results, **self.find_commands(lazy_tree, names)},
+            self.find_commands(eager_tree, names),
+            "Lazy command tree lookups match the eager command tree",
+        )
+
+    def check_plugins(self):
+        index = self.manager.index
+        lazy_index = Indexer(self.manager)
+        lazy_index._spec = index.spec
+        eager_index = Indexer(self.manager)
+        eager_index._spec = index.spec
+
+        plugin_names = list(index.spec.get("plugin", {}).keys())
+        lazy_index.get_plugin_providers(plugin_names[0], True)
+        self.check(
+            list(lazy_index._plugin_providers.keys()) == plugin_names[:1],
+            "Plugin providers are generated on first lookup before generate_plugins runs",
+        )
+
+        lazy_providers = {name: lazy_index.get_plugin_providers(name, True) for name in plugin_names}
+        eager_index.generate_plugins()
+        self.check_equal(
+            lazy_providers,
+            {name: eager_index.get_plugin_providers(name, True) for name in plugin_names},
+            "Lazy plugin providers match eagerly generated plugin providers",
+        )
+        self.check_equal(
+            {name: lazy_index.get_plugin_base(name) for name in plugin_names},
+            {name: eager_index.get_plugin_base(name) for name in plugin_names},
+            "Lazy plugin bases match eagerly generated plugin bases",
+        )
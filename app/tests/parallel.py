@@ -0,0 +1,164 @@
+import threading
+import time
+
+from tests.base import BaseTest
+from utility.parallel import ParallelError, ParallelGraph, TaskGroup, ThreadPool
+
+
+class Test(BaseTest):
+    def exec(self):
+        self.exec_methods("check_")
+
+    def get_graph(self, disable_parallel):
+        graph = ParallelGraph(disable_parallel=disable_parallel)
+        graph.executed = []
+        lock = threading.Lock()
+
+        def run(name, fails=False, duration=0, hook=None):
+            time.sleep(duration)
+            with lock:
+                graph.executed.append(name)
+            if hook:
+                hook(graph)
+            if fails:
+                raise ParallelError(f"Graph node {name} failed")
+
+        graph.run = run
+        return graph
+
+    def get_errors(self, graph):
+        return {error.index: str(error.error) for error in graph.results.errors}
+
+    def check_graph_failures(self):
+        for disable_parallel in (False, True):
+            mode = "sequential" if disable_parallel else "parallel"
+            graph = self.get_graph(disable_parallel)
+            graph.add("a", graph.run, "a", fails=True)
+            graph.add("b", graph.run, "b", requires=["a"])
+            graph.add("c", graph.run, "c", requires=["b"])
+            graph.add("d", graph.run, "d")
+            graph.wait(raise_errors=False)
+            graph.add("e", graph.run, "e", requires=["c"])
+            graph.wait(raise_errors=False)
+
+            self.check_equal(sorted(graph.executed), ["a", "d"], f"Dependents of failed nodes are skipped ({mode})")
+            self.check_equal(
+                graph.status, {"a": False, "b": False, "c": False, "d": True, "e": False}, f"Skipped nodes fail ({mode})"
+            )
+            self.check_equal(list(self.get_errors(graph).keys()), ["a"], f"Only failed nodes report errors ({mode})")
+
+    def check_graph_requirements(self):
+        for disable_parallel in (False, True):
+            mode = "sequential" if disable_parallel else "parallel"
+            graph = self.get_graph(disable_parallel)
+            graph.add("a", graph.run, "a", requires=["missing"])
+            graph.add("b", graph.run, "b", requires=["c"])
+            graph.add("c", graph.run, "c", requires=["b"])
+            graph.add("d", graph.run, "d", requires=["a"])
+            graph.add("e", graph.run, "e")
+            graph.wait(raise_errors=False)
+            errors = self.get_errors(graph)
+
+            self.check_equal(graph.executed, ["e"], f"Nodes with unresolved requirements are not run ({mode})")
+            self.check_equal(sorted(errors.keys()), ["a", "b", "c", "d"], f"Unresolved nodes report errors ({mode})")
+            self.check("missing do not exist" in errors["a"], f"Missing requirements are reported ({mode})")
+            self.check(
+                "circular" in errors["b"] and "circular" in errors["c"], f"Circular requirements are reported ({mode})"
+            )
+
+            self.check_raises(ParallelError, lambda: graph.add("e", graph.run, "e"), "Graph node names are unique")
+
+    def check_graph_added_nodes(self):
+        def expand(graph):
+            # Nodes added while running (profile _foreach expansion) are scheduled with the rest of the graph
+            graph.add("b", graph.run, "b", duration=0.02)
+            graph.add("c", graph.run, "c", requires=["b"])
+
+        for disable_parallel in (False, True):
+            mode = "sequential" if disable_parallel else "parallel"
+            graph = self.get_graph(disable_parallel)
+            graph.add("d", graph.run, "d", requires=["b", "a"])
+            graph.add("a", graph.run, "a", hook=expand)
+            graph.wait()
+
+            self.check_equal(sorted(graph.executed), ["a", "b", "c", "d"], f"Added nodes are run ({mode})")
+            self.check(
+                graph.executed.index("b") < graph.executed.index("c")
+                and graph.executed.index("b") < graph.executed.index("d"),
+                f"Added nodes satisfy waiting requirements ({mode})",
+            )
+
+    def check_graph_sequential(self):
+        graph = self.get_graph(True)
+        thread_ids = set()
+
+        def record(graph):
+            thread_ids.add(threading.get_ident())
+
+        for name, requires in (("c", ["b"]), ("b", ["a"]), ("a", []), ("d", [])):
+            graph.add(name, graph.run, name, requires=requires, hook=record)
+        graph.wait()
+
+        self.check_equal(graph.executed, ["a", "d", "b", "c"], "Sequential graphs run nodes in dependency order")
+        self.check_equal(thread_ids, {threading.get_ident()}, "Sequential graphs run nodes on the calling thread")
+
+    def check_graph_critical_path(self):
+        for disable_parallel in (False, True):
+            mode = "sequential" if disable_parallel else "parallel"
+            graph = self.get_graph(disable_parallel)
+            graph.add("a", graph.run, "a", duration=0.05)
+            graph.add("b", graph.run, "b", requires=["a"], duration=0.1)
+            graph.add("c", graph.run, "c", duration=0.02)
+            graph.add("d", graph.run, "d", requires=["c"], duration=0.02)
+            graph.wait()
+            path, path_time = graph.critical_path()
+
+            self.check_equal(path, ["a", "b"], f"Critical path follows the longest requirement chain ({mode})")
+            self.check(0.15 <= path_time < graph.elapsed_time + 0.001, f"Critical path time is the chain duration ({mode})")
+
+    def check_pool_nested(self):
+        pool = ThreadPool(2, idle_timeout=1)
+        outer_group = TaskGroup(2)
+        inner_group = TaskGroup(1)
+        lock = threading.Lock()
+        active = {"outer": 0, "inner": 0}
+        peak = {"outer": 0, "inner": 0}
+        threads = set()
+
+        def wrapper(callback, index, args, kwargs):
+            callback(*args, **kwargs)
+
+        def run(name, callback=None):
+            with lock:
+                active[name] += 1
+                peak[name] = max(peak[name], active[name])
+                threads.add(threading.current_thread())
+            try:
+                time.sleep(0.01)
+                if callback:
+                    callback()
+            finally:
+                with lock:
+                    active[name] -= 1
+
+        def run_inner():
+            # Every pool worker is busy with an outer task so nested tasks run inline on the joining workers
+            for index in range(3):
+                pool.exec(inner_group, wrapper, run, index, ("inner",), {})
+            pool.join(inner_group)
+
+        try:
+            for index in range(4):
+                pool.exec(outer_group, wrapper, run, index, ("outer", run_inner), {})
+            pool.join(outer_group)
+        finally:
+            pool.terminate()
+
+        self.check_equal(
+            (outer_group.metrics.count, inner_group.metrics.count), (4, 12), "Nested tasks complete with every worker busy"
+        )
+        self.check(peak["outer"] <= 2 and peak["inner"] <= 1, "Task group limits hold for nested tasks run inline")
+        self.check(
+            threading.current_thread() not in threads and all(thread.pool is pool for thread in threads),
+            "Tasks only run inline on pool workers",
+        )
@@ -0,0 +1,36 @@
+from tests.base import BaseTest
+
+
+class Test(BaseTest):
+    fields = ["name", "(id:COUNT)", "(created:MAX)"]
+    order = ["-name", "(updated:MAX)"]
+
+    def exec(self):
+        self.exec_methods("check_")
+
+    def parse(self, type, method, values):
+        facade = self.command.facade("group", False)
+        cache = facade.get_parser_cache(type)
+        cache.clear()
+        results = []
+
+        for attempt in ("uncached", "cached"):
+            handle = facade.query()
+            handle.set_annotations()
+            parsed = getattr(handle, method)(values)
+            results.append(
+                (
+                    [str(value) for value in parsed],
+                    {field: str(annotation) for field, annotation in handle.get_annotations(False).items()},
+                )
+            )
+
+        self.check(cache.hits > 0, f"Cached {type} expressions are reused")
+        self.check(results[0][1], f"Parsed {type} expressions add annotations")
+        self.check_equal(results[1], results[0], f"Cached {type} expressions re-apply annotations")
+
+    def check_fields(self):
+        self.parse("field", "parse_fields", self.fields)
+
+    def check_order(self):
+        self.parse("order", "parse_order", self.order)
@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+from systems.api.data.views import DataViewSet
+from tests.base import BaseTest
+
+
+class Test(BaseTest):
+    data_types = ("group", "config", "user", "host", "schedule", "log")
+
+    def exec(self):
+        self.factory = APIRequestFactory()
+        self.admin = self.command._user.admin
+
+        for data_type in self.data_types:
+            if (not self.tags or data_type in self.tags) and data_type not in self.exclude_tags:
+                self.check_list_queries(self.command.facade(data_type, False))
+
+    def check_list_queries(self, facade):
+        if facade.count() < 2:
+            self.command.warning(f"Skipping {facade.name} query count check: at least two records are required")
+            return
+
+        record_queries = self.get_list_queries(facade, 1)
+        page_queries = self.get_list_queries(facade, settings.REST_PAGE_COUNT)
+
+        if page_queries != record_queries:
+            self.command.error(
+                f"Data API {facade.name} list executed {record_queries} queries for one record"
+                f" but {page_queries} queries for a page of {settings.REST_PAGE_COUNT} records"
+            )
+        self.command.success(f"Data API {facade.name} list executes {page_queries} queries per page")
+
+    def get_list_queries(self, facade, count):
+        request = self.factory.get(f"/{facade.name}/", {"count": count})
+        force_authenticate(request, user=self.admin)
+
+        with CaptureQueriesContext(connection) as context:
+            response = DataViewSet(facade).as_view({"get": "list"})(request)
+            response.render()
+
+        if response.status_code != 200:
+            self.command.error(f"Data API {facade.name} list request failed ({response.status_code}): {response.data}")
+        return len(context.captured_queries)
@@ -1,6 +1,8 @@
 from django.test import tag
 from tests.sdk_python.data.base import DataBaseTest
 
+from zimagi.exceptions import ResponseError
+
 DATA_TYPE = "group"
 
 
@@ -25,6 +27,23 @@ class GroupTest(DataBaseTest):
         self.assertEqual(len(objects), 1)
         self.assertObjectEqual(objects[0], {"name": "test__1", "first": 1})
 
+    @tag("group_values")
+    def test_group_values(self):
+        values = sorted({fields["provider_type"] for fields in self.group_data.values()})
+
+        response = self.data_api.values(DATA_TYPE, "provider_type", name__startswith="test__")
+        self.assertEqual(response["count"], len(values))
+        self.assertEqual(response["results"], values)
+
+        response = self.data_api.values(DATA_TYPE, "provider_type", name__startswith="test__", limit=2, offset=1)
+        self.assertEqual(response["count"], len(values))
+        self.assertEqual(response["results"], values[1:3])
+
+        for options in ({"limit": "abc"}, {"limit": 0}, {"offset": -1}):
+            with self.assertRaises(ResponseError) as context:
+                self.data_api.values(DATA_TYPE, "provider_type", **options)
+            self.assertEqual(context.exception.code, 400)
+
     @tag("group_csv")
     def test_group_csv(self):
         data = self.data_api.csv(
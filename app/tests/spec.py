@@ -0,0 +1,63 @@
+import copy
+import os
+import pathlib
+import tempfile
+
+from django.test import override_settings
+from tests.base import BaseTest
+from utility.data import FrozenDict, FrozenList
+
+
+class Test(BaseTest):
+    def exec(self):
+        self.exec_methods("check_")
+
+    def check_views(self):
+        manager = self.command.manager
+        spec = manager.get_spec(["data"])
+        name, data_spec = next(iter(spec.items()))
+
+        self.check(manager.get_spec(["data"]) is spec, "Specification views are shared between lookups")
+        self.check(isinstance(spec, FrozenDict) and isinstance(data_spec, FrozenDict), "Specification views are frozen")
+        self.check_raises(TypeError, lambda: spec.__setitem__("test", {}), "Specification views can not be assigned")
+        self.check_raises(TypeError, lambda: data_spec.update(test=True), "Nested specification views can not be updated")
+        self.check_raises(TypeError, lambda: spec.pop(name), "Specification views can not be removed from")
+        self.check_raises(TypeError, lambda: FrozenList([1]).append(2), "Specification list views can not be appended to")
+
+        spec_copy = copy.deepcopy(spec)
+        spec_copy[name]["test"] = True
+
+        self.check(type(spec_copy) is dict and type(spec_copy[name]) is dict, "Copied specification views are mutable")
+        self.check("test" not in manager.get_spec(["data", name]), "Copied specification changes are not shared")
+
+    def check_cache(self):
+        index = self.command.manager.index
+        spec_dirs = list(reversed(index.get_module_dirs("spec")))
+
+        with tempfile.TemporaryDirectory() as module_dir:
+            spec_file = pathlib.Path(module_dir, "test.yml")
+            spec_file.write_text("test_spec: {}\n")
+            cache_key = index._get_spec_cache_key(spec_dirs)
+            module_key = index._get_spec_cache_key([*spec_dirs, module_dir])
+
+            self.check(module_key != cache_key, "Adding a module specification directory changes the cache key")
+
+            file_info = spec_file.stat()
+            os.utime(spec_file, ns=(file_info.st_atime_ns, file_info.st_mtime_ns + 1000000000))
+            self.check(
+                index._get_spec_cache_key([*spec_dirs, module_dir]) != module_key,
+                "Changing a specification file modification time changes the cache key",
+            )
+
+            with override_settings(SPEC_CACHE_PATH=os.path.join(module_dir, "cache", "spec.pickle")):
+                try:
+                    index._save_spec_cache(cache_key)
+                    self.check(index._load_spec_cache(cache_key), "Saved specification cache is loaded")
+                    self.check(not index._load_spec_cache(module_key), "Specification cache with a stale key is ignored")
+
+                    index.clear_spec_cache()
+                    self.check(
+                        not index._load_spec_cache(cache_key), "Specification cache is cleared (module install and save)"
+                    )
+                finally:
+                    index.reset_spec()
@@ -0,0 +1,134 @@
+import socket
+import subprocess
+import threading
+import time
+
+import paramiko
+from tests.base import BaseTest
+from utility.parallel import Parallel
+from utility.ssh import SSH
+
+
+class SSHServerInterface(paramiko.ServerInterface):
+    def __init__(self, server):
+        self.server = server
+
+    def get_allowed_auths(self, username):
+        return "password"
+
+    def check_auth_password(self, username, password):
+        if username == self.server.username and password == self.server.password:
+            return paramiko.AUTH_SUCCESSFUL
+        return paramiko.AUTH_FAILED
+
+    def check_channel_request(self, kind, chanid):
+        if kind == "session":
+            return paramiko.OPEN_SUCCEEDED
+        return paramiko.OPEN_FAILED_ADMINISTRATIVELY_PROHIBITED
+
+    def check_channel_exec_request(self, channel, command):
+        threading.Thread(target=self.server.exec, args=(channel, command.decode("utf-8")), daemon=True).start()
+        return True
+
+
+class SSHServer(threading.Thread):
+    # Local stand-in for a remote host that runs exec requests as local shell commands
+    def __init__(self, username, password):
+        super().__init__()
+        self.username = username
+        self.password = password
+        self.host_key = paramiko.RSAKey.generate(2048)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.transports = []
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind(("127.0.0.1", 0))
+        self.socket.listen(100)
+        self.port = self.socket.getsockname()[1]
+
+        self.daemon = True
+        self.start()
+
+    def run(self):
+        while True:
+            try:
+                client, address = self.socket.accept()
+            except OSError:
+                break
+
+            threading.Thread(target=self.serve, args=(client,), daemon=True).start()
+
+    def serve(self, client):
+        transport = paramiko.Transport(client)
+        transport.add_server_key(self.host_key)
+        transport.start_server(server=SSHServerInterface(self))
+
+        with self.lock:
+            self.connections += 1
+            self.transports.append(transport)
+
+    def exec(self, channel, command):
+        process = subprocess.run(command, shell=True, capture_output=True)
+        channel.sendall(process.stdout)
+        channel.sendall_stderr(process.stderr)
+        channel.send_exit_status(process.returncode)
+        # Closing here could race the exec request reply so the client closes the channel after EOF
+        channel.shutdown_write()
+
+    def terminate(self):
+        self.socket.close()
+        for transport in self.transports:
+            transport.close()
+
+
+class Test(BaseTest):
+    username = "zimagi"
+    task_count = 20
+    task_seconds = 0.5
+
+    def exec(self):
+        password = SSH.create_password()
+        servers = [SSHServer(self.username, password) for index in range(2)]
+        try:
+            self.check_pooled_connections(servers, password)
+            self.check_parallel_hosts(servers, password)
+        finally:
+            for server in servers:
+                server.terminate()
+
+    def run_tasks(self, tasks, password, pool):
+        def run_task(task):
+            server, command = task
+            ssh = self.command.ssh("127.0.0.1", self.username, password=password, port=server.port, pool=pool)
+            ssh.exec(command)
+
+        start_time = time.perf_counter()
+        Parallel.list(tasks, run_task, disable_parallel=False)
+        return time.perf_counter() - start_time
+
+    def check_pooled_connections(self, servers, password):
+        tasks = [(server, "true") for server in servers for index in range(self.task_count)]
+
+        connect_time = self.run_tasks(tasks, password, False)
+        connections = [server.connections for server in servers]
+        pool_time = self.run_tasks(tasks, password, True)
+        pool_connections = [server.connections - count for server, count in zip(servers, connections)]
+
+        self.command.data(f"{len(tasks)} remote tasks (connection per task)", f"{connect_time:.3f}s")
+        self.command.data(f"{len(tasks)} remote tasks (pooled connections)", f"{pool_time:.3f}s")
+
+        if pool_connections != [1] * len(servers):
+            self.command.error(f"Pooled SSH tasks opened {pool_connections} connections instead of one per host")
+        self.command.success("Pooled SSH tasks share one connection per host")
+
+    def check_parallel_hosts(self, servers, password):
+        tasks = [(server, f"sleep {self.task_seconds}") for server in servers]
+        parallel_time = self.run_tasks(tasks, password, True)
+
+        self.command.data("Remote tasks on separate hosts", f"{parallel_time:.3f}s")
+
+        if parallel_time >= self.task_seconds * len(servers):
+            self.command.error(f"Remote tasks on {len(servers)} hosts did not run in parallel")
+        self.command.success("Remote tasks on separate hosts run in parallel")
@@ -0,0 +1,50 @@
+from decimal import Decimal
+
+import pandas
+from tests.base import BaseTest
+
+
+class Test(BaseTest):
+    number_values = [
+        "5",
+        " 5 ",
+        "5.7",
+        "5.4",
+        "1e3",
+        "1_000",
+        "0x10",
+        "abc",
+        "",
+        "nan",
+        "inf",
+        None,
+        5.7,
+        5,
+        11,
+        Decimal("5.7"),
+    ]
+    date_values = ["2020-01-05", "2020-02-30", "1500-01-01", "3000-12-31", "20200105", "abc", "", None, 20200105.0, 20200105]
+    string_values = ["abc", "ABC", "", None, 5]
+
+    def exec(self):
+        self.exec_methods("check_")
+
+    def compare_validator(self, provider, values, **config):
+        validator = self.command.get_provider("validator", provider, {"id": f"test:{provider}", **config})
+        self.check_equal(
+            validator.validate_series(pandas.Series(values, dtype=object), None).tolist(),
+            [validator.validate(value, {}) for value in values],
+            f"Validator {provider} series results match record results: {config}",
+        )
+
+    def check_number(self):
+        for config in ({}, {"min": 5.5, "max": 10}, {"nan": True, "min": 5.5}):
+            self.compare_validator("number", self.number_values, **config)
+
+    def check_date_time(self):
+        for config in ({"format": "%Y-%m-%d"}, {"format": ["%Y%m%d", "%Y-%m-%d"], "empty": True}):
+            self.compare_validator("date_time", self.date_values, **config)
+
+    def check_string(self):
+        for config in ({}, {"empty": True, "pattern": r"^[a-z]+$"}):
+            self.compare_validator("string", self.string_values, **config)
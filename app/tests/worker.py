@@ -0,0 +1,104 @@
+import datetime
+
+from django.conf import settings
+from django.test import override_settings
+from django.utils import timezone
+from plugins.worker.base import PredictiveScalingPolicy, ScalingPolicy
+from services.celery import app
+from tests.base import BaseTest
+
+
+class Test(BaseTest):
+    worker_type = "worker_test"
+
+    def exec(self):
+        with override_settings(
+            WORKER_MAX_COUNT=20,
+            WORKER_TASKS_PER_WORKER=5,
+            WORKER_SCALE_INTERVAL=10,
+            WORKER_SCALE_DOWN_DELAY=600,
+            WORKER_PREWARM_SECONDS=300,
+            WORKER_SCALING_BUCKET_MINUTES=15,
+            WORKER_SCALING_SMOOTHING=0.5,
+        ):
+            self.exec_methods("check_")
+
+    def get_time(self, day, hour, minute=0):
+        return timezone.make_aware(datetime.datetime(2026, 1, 5 + day, hour, minute))
+
+    def check_reactive(self):
+        policy = ScalingPolicy(self.worker_type, [(self.get_time(0, 12), 50, 0)])
+
+        self.check_equal(policy.get_task_workers(12, 0.5), 4, "Task workers cover queued and arriving tasks")
+        self.check_equal(policy.get_worker_desired(self.get_time(1, 12), 0, 0), 1, "Reactive policies keep one worker")
+        self.check_equal(policy.get_worker_reserve(self.get_time(1, 12)), 0, "Reactive policies reserve no workers")
+
+    def check_forecast(self):
+        policy = PredictiveScalingPolicy(self.worker_type, [(self.get_time(0, 12), 50, 0), (self.get_time(0, 12, 5), 20, 0)])
+
+        self.check_equal(policy.get_forecast(self.get_time(0, 12, 10)), 10, "Bucket demand keeps the largest recorded need")
+        self.check_equal(policy.get_forecast(self.get_time(1, 11, 56)), 10, "Buckets within the prewarm window are forecast")
+        self.check_equal(policy.get_forecast(self.get_time(1, 11, 40)), 0, "Buckets after the prewarm window are ignored")
+        self.check_equal(policy.get_forecast(self.get_time(1, 12, 15)), 0, "Other time of day buckets are not forecast")
+
+    def check_decay(self):
+        policy = PredictiveScalingPolicy(self.worker_type, [(self.get_time(0, 12), 50, 0)])
+
+        self.check_equal(
+            [policy.get_forecast(self.get_time(day, 12)) for day in range(1, 4)],
+            [10, 5, 3],
+            "Bucket demand fades each day it does not recur",
+        )
+
+        policy.record(self.get_time(3, 12), 50, 0)
+        self.check_equal(policy.get_forecast(self.get_time(4, 12)), 10, "Recurring bucket demand is restored")
+
+    def check_peak(self):
+        policy = PredictiveScalingPolicy(self.worker_type)
+        start_time = self.get_time(0, 12)
+
+        self.check_equal(policy.get_worker_desired(start_time, 50, 0), 10, "Queued tasks raise desired workers")
+        self.check_equal(
+            policy.get_worker_desired(start_time + datetime.timedelta(seconds=60), 0, 0),
+            10,
+            "Desired workers hold through short lulls",
+        )
+        self.check_equal(
+            policy.get_worker_reserve(start_time + datetime.timedelta(seconds=60)), 10, "Recent peaks are reserved"
+        )
+        self.check_equal(
+            policy.get_worker_desired(start_time + datetime.timedelta(seconds=700), 0, 0),
+            1,
+            "Desired workers drop once the scale down delay passes",
+        )
+
+    def check_simulation(self):
+        worker = self.command.get_provider(
+            "worker",
+            settings.WORKER_PROVIDER,
+            app,
+            worker_type=self.worker_type,
+            command_name=self.command.get_full_name(),
+            command_options={},
+        )
+        history = [
+            (self.get_time(0, 12), 50, 0),
+            (self.get_time(0, 13), 0, 0),
+            (self.get_time(1, 11, 56), 0, 0),
+            (self.get_time(1, 12), 50, 0),
+        ]
+
+        def simulate(policy_name):
+            metrics = worker.simulate_scaling(policy_name, history)
+            return {**metrics, "worker_hours": round(metrics["worker_hours"], 3)}
+
+        self.check_equal(
+            simulate("reactive"),
+            {"events": 4, "cold_starts": 2, "worker_shortfall": 19, "worker_peak": 10, "worker_hours": 33.0},
+            "Reactive simulations cold start recurring bursts",
+        )
+        self.check_equal(
+            simulate("predictive"),
+            {"events": 4, "cold_starts": 1, "worker_shortfall": 10, "worker_peak": 10, "worker_hours": 33.6},
+            "Predictive simulations prewarm recurring bursts",
+        )
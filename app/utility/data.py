@@ -1,4 +1,5 @@
 import codecs
+import collections
 import copy
 import datetime
 import hashlib
@@ -8,6 +9,7 @@ import pickle
 import random
 import re
 import string
+import sys
 import threading
 import uuid
 from difflib import SequenceMatcher
@@ -107,6 +109,12 @@ class Collection:
             setattr(result, key, copy.deepcopy(value, memo))
         return result
 
+    def __getstate__(self):
+        return self.__dict__
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
 
 class RecursiveCollection(Collection):
     def __init__(self, **attributes):
@@ -147,6 +155,113 @@ class RecursiveCollection(Collection):
         return conversion
 
 
+class LRUCache:
+    def __init__(self, size=1000):
+        self.lock = threading.Lock()
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self._data = collections.OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        if self.size <= 0:
+            return value
+
+        with self.lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.size:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self.lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{self.__class__.__name__} is read only (use copy.deepcopy to get a mutable copy)")
+
+
+class FrozenDict(dict):
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        data = {}
+        memo[id(self)] = data
+        for key, value in self.items():
+            data[copy.deepcopy(key, memo)] = copy.deepcopy(value, memo)
+        return data
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class FrozenList(list):
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        data = []
+        memo[id(self)] = data
+        for value in self:
+            data.append(copy.deepcopy(value, memo))
+        return data
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+for _dumper in (oyaml.Dumper, oyaml.SafeDumper):
+    oyaml.add_representer(FrozenDict, lambda dumper, data: dumper.represent_dict(data.items()), Dumper=_dumper)
+    oyaml.add_representer(FrozenList, lambda dumper, data: dumper.represent_list(data), Dumper=_dumper)
+
+
+def freeze(data):
+    if isinstance(data, dict):
+        return FrozenDict((key, freeze(value)) for key, value in data.items())
+    if isinstance(data, list):
+        return FrozenList(freeze(value) for value in data)
+    if isinstance(data, tuple):
+        return tuple(freeze(value) for value in data)
+    return data
+
+
+def get_size(data):
+    size = sys.getsizeof(data)
+    if isinstance(data, dict):
+        size += sum(get_size(key) + get_size(value) for key, value in data.items())
+    elif isinstance(data, (list, tuple)):
+        size += sum(get_size(value) for value in data)
+    return size
+
+
 def ensure_list(data, preserve_null=False):
     if preserve_null and data is None:
         return None
@@ -225,6 +340,15 @@ def chunk_list(data, chunk_size=10):
     return [data[index : index + chunk_size] for index in range(0, len(data), chunk_size)]
 
 
+def iterate_chunks(data, chunk_size=10):
+    iterator = iter(data)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            break
+        yield chunk
+
+
 def clean_list(data, check_value=None):
     return [value for value in data if value is not check_value]
 
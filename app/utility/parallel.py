@@ -1,11 +1,16 @@
+import logging
 import multiprocessing
-import queue
 import threading
+import time
+from collections import deque
 
 from django.conf import settings
 from django.db import connection
 
 from .display import format_exception_info
+from .python import ProcessLocal
+
+logger = logging.getLogger(__name__)
 
 
 class ParallelError(Exception):
@@ -13,14 +18,14 @@ class ParallelError(Exception):
 
 
 class WorkerThread(threading.Thread):
-    def __init__(self, tasks=None, target=None, args=None, kwargs=None):
+    def __init__(self, pool=None, target=None, args=None, kwargs=None):
         if not args:
             args = []
         if not kwargs:
             kwargs = {}
 
         super().__init__()
-        self.tasks = tasks
+        self.pool = pool
         self.target = target
         self.args = args
         self.kwargs = kwargs
@@ -30,17 +35,8 @@ class WorkerThread(threading.Thread):
 
     def run(self):
         try:
-            if self.tasks:
-                while not self.terminated:
-                    try:
-                        wrapper, callback, index, args, kwargs = self.tasks.get(True, 0.05)
-                        try:
-                            wrapper(callback, index, args, kwargs)
-                        finally:
-                            self.tasks.task_done()
-
-                    except queue.Empty:
-                        continue
+            if self.pool:
+                self.pool.work(self)
 
             elif self.target:
                 if callable(self.target):
@@ -50,34 +46,174 @@ class WorkerThread(threading.Thread):
 
     def terminate(self, timeout=None):
         self.stop_signal.set()
+        if self.pool:
+            self.pool.wake()
         super().join(timeout)
 
     @property
     def terminated(self):
-        return self.stop_signal.isSet()
+        return self.stop_signal.is_set()
+
+
+class TaskMetrics:
+    def __init__(self):
+        self.count = 0
+        self.queue_time = 0
+        self.max_queue_time = 0
+        self.exec_time = 0
+
+    def record(self, queue_time, exec_time):
+        self.count += 1
+        self.queue_time += queue_time
+        self.max_queue_time = max(self.max_queue_time, queue_time)
+        self.exec_time += exec_time
+
+    def export(self):
+        return {
+            "tasks": self.count,
+            "queue_time": self.queue_time,
+            "average_queue_time": (self.queue_time / self.count) if self.count else 0,
+            "max_queue_time": self.max_queue_time,
+            "exec_time": self.exec_time,
+            "average_exec_time": (self.exec_time / self.count) if self.count else 0,
+        }
+
+    def __str__(self):
+        metrics = self.export()
+        return (
+            f"{metrics['tasks']} tasks, queue wait {metrics['average_queue_time'] * 1000:.3f} ms average"
+            f" ({metrics['max_queue_time'] * 1000:.3f} ms max),"
+            f" execution {metrics['average_exec_time'] * 1000:.3f} ms average"
+        )
+
+
+class TaskGroup:
+    def __init__(self, limit):
+        self.limit = max(limit, 1)
+        self.tasks = deque()
+        self.active = 0
+        self.metrics = TaskMetrics()
+
+    @property
+    def runnable(self):
+        return min(len(self.tasks), self.limit - self.active)
 
 
 class ThreadPool:
-    def __init__(self, count=None):
-        self.tasks = queue.Queue()
-        self.workers = {}
+    def __init__(self, count=None, idle_timeout=None):
+        self.lock = threading.Lock()
+        self.work_ready = threading.Condition(self.lock)
+        self.task_done = threading.Condition(self.lock)
+        self.groups = []
+        self.workers = set()
+        self.idle = 0
+        self.metrics = TaskMetrics()
+
+        self.max_workers = count if count else settings.PARALLEL_MAX_THREADS
+        self.idle_timeout = idle_timeout
+
+    def exec(self, group, wrapper, callback, index, args, kwargs):
+        with self.lock:
+            group.tasks.append((time.perf_counter(), wrapper, callback, index, args, kwargs))
+            if group not in self.groups:
+                self.groups.append(group)
+
+            # Workers are started on demand up to the pool limit and then kept for later calls
+            if self.idle < sum(group.runnable for group in self.groups) and len(self.workers) < self.max_workers:
+                self.workers.add(WorkerThread(self))
+            else:
+                self.work_ready.notify()
+
+            self.task_done.notify_all()
+
+    def work(self, worker):
+        while True:
+            with self.lock:
+                task = self._next_task()
+                while task is None:
+                    if worker.terminated:
+                        self.workers.discard(worker)
+                        return
+
+                    self.idle += 1
+                    notified = self.work_ready.wait(self.idle_timeout)
+                    self.idle -= 1
+
+                    task = self._next_task()
+                    if task is None and not notified:
+                        self.workers.discard(worker)
+                        return
+
+            self._run(*task)
+            connection.close_if_unusable_or_obsolete()
+
+    def join(self, group):
+        # Waiting pool workers run their own queued tasks so nested calls make progress when every worker is busy,
+        # other callers only wait so tasks never share their database connection, transaction or thread locals
+        current_thread = threading.current_thread()
+        inline = isinstance(current_thread, WorkerThread) and current_thread.pool is self
+
+        while True:
+            with self.lock:
+                while not inline or not group.tasks or group.active >= group.limit:
+                    if not group.tasks and not group.active:
+                        return
+                    self.task_done.wait()
+
+                task = self._take_task(group)
+            self._run(*task)
+
+    def _next_task(self):
+        for group in self.groups:
+            if group.active < group.limit:
+                return self._take_task(group)
+        return None
+
+    def _take_task(self, group):
+        task = group.tasks.popleft()
+        group.active += 1
+
+        self.groups.remove(group)
+        if group.tasks:
+            self.groups.append(group)
+        return group, task
+
+    def _run(self, group, task):
+        queued_time, wrapper, callback, index, args, kwargs = task
+        start_time = time.perf_counter()
+        try:
+            wrapper(callback, index, args, kwargs)
+        finally:
+            end_time = time.perf_counter()
 
-        if count is None:
-            count = settings.THREAD_COUNT
-        for index in range(count):
-            self.workers[index] = WorkerThread(self.tasks)
+            with self.lock:
+                group.active -= 1
+                group.metrics.record(start_time - queued_time, end_time - start_time)
+                self.metrics.record(start_time - queued_time, end_time - start_time)
 
-    def exec(self, wrapper, callback, index, args, kwargs):
-        self.tasks.put((wrapper, callback, index, args, kwargs))
+                if group.tasks:
+                    self.work_ready.notify()
+                self.task_done.notify_all()
 
-    def wait(self):
-        self.tasks.join()
+    def wake(self):
+        with self.lock:
+            self.work_ready.notify_all()
 
     def terminate(self):
-        for index, thread in self.workers.items():
+        with self.lock:
+            workers = list(self.workers)
+
+        for thread in workers:
             thread.terminate()
 
 
+_thread_pool = ProcessLocal(lambda: ThreadPool(idle_timeout=settings.PARALLEL_THREAD_IDLE_TIMEOUT))
+
+
+def get_thread_pool():
+    return _thread_pool.get()
+
+
 class ThreadError:
     def __init__(self, index, error):
         self.index = index
@@ -149,10 +285,11 @@ class ThreadResults:
 
 
 class Parallel:
-    def __init__(self, disable_parallel=None, thread_count=None, command=None, error_cls=None):
+    def __init__(self, disable_parallel=None, thread_count=None, command=None, error_cls=None, shared_pool=True):
         self.disable_parallel = disable_parallel
         self.command = command
         self.error_cls = error_cls
+        self.shared_pool = shared_pool
 
         if self.disable_parallel is None:
             self.disable_parallel = not settings.MANAGER.runtime.parallel()
@@ -160,11 +297,17 @@ class Parallel:
         self.results = ThreadResults()
 
         if not self.disable_parallel:
-            self.threads = ThreadPool(thread_count)
+            self.tasks = TaskGroup(thread_count if thread_count else settings.THREAD_COUNT)
+            # Long running tasks that must all run at once get dedicated threads
+            self.threads = get_thread_pool() if shared_pool else ThreadPool(self.tasks.limit)
+
+    @property
+    def metrics(self):
+        return self.tasks.metrics if not self.disable_parallel else None
 
     def exec(self, callback, index, *args, **kwargs):
         if not self.disable_parallel:
-            self.threads.exec(self._exec, callback, index, args, kwargs)
+            self.threads.exec(self.tasks, self._exec, callback, index, args, kwargs)
         else:
             self._exec(callback, index, args, kwargs)
 
@@ -176,10 +319,17 @@ class Parallel:
         except Exception as e:
             self.results.add_error(index, e)
 
+    def join(self):
+        if not self.disable_parallel:
+            self.threads.join(self.tasks)
+
     def wait(self, raise_errors=True):
         if not self.disable_parallel:
-            self.threads.wait()
-            self.threads.terminate()
+            self.join()
+            if not self.shared_pool:
+                self.threads.terminate()
+
+            logger.debug(f"Parallel execution: {self.tasks.metrics}")
 
         if raise_errors:
             self.results.raise_errors(self.command, self.error_cls)
@@ -196,6 +346,7 @@ class Parallel:
         command=None,
         error_cls=None,
         raise_errors=True,
+        shared_pool=True,
         **kwargs,
     ):
         count = len(list(items))
@@ -203,7 +354,13 @@ class Parallel:
         if (thread_count and count < thread_count) or (not thread_count and count < settings.THREAD_COUNT):
             thread_count = count
 
-        parallel = cls(disable_parallel=disable_parallel, thread_count=thread_count, command=command, error_cls=error_cls)
+        parallel = cls(
+            disable_parallel=disable_parallel,
+            thread_count=thread_count,
+            command=command,
+            error_cls=error_cls,
+            shared_pool=shared_pool,
+        )
         if count > 0:
             parallel.results.initialize(count)
             for index, item in enumerate(items):
@@ -250,6 +407,7 @@ class Parallel:
                 thread_count=len(indexes),
                 command=command,
                 error_cls=error_cls,
+                shared_pool=False,
                 **kwargs,
             )
         finally:
@@ -258,3 +416,171 @@ class Parallel:
                 process.join()
 
         return results
+
+
+class GraphNode:
+    def __init__(self, name, callback, requires, args, kwargs):
+        self.name = name
+        self.callback = callback
+        self.requires = requires
+        self.args = args
+        self.kwargs = kwargs
+        self.waiting = set()
+        self.dependents = []
+        self.start_time = None
+        self.end_time = None
+        self.path_time = 0
+        self.path_parent = None
+
+    @property
+    def duration(self):
+        if self.start_time is None:
+            return 0
+        return self.end_time - self.start_time
+
+
+class ParallelGraph:
+    def __init__(self, disable_parallel=None, thread_count=None, command=None, error_cls=None):
+        self.parallel = Parallel(disable_parallel, thread_count, command, error_cls)
+        self.lock = threading.Lock()
+        self.nodes = {}
+        self.status = {}
+        self.blocked = {}
+        self.ready = deque()
+        self.start_time = time.perf_counter()
+        self.end_time = None
+
+    @property
+    def disable_parallel(self):
+        return self.parallel.disable_parallel
+
+    @property
+    def results(self):
+        return self.parallel.results
+
+    def add(self, name, callback, *args, requires=None, **kwargs):
+        with self.lock:
+            if name in self.nodes:
+                raise ParallelError(f"Graph node {name} already exists")
+
+            node = GraphNode(name, callback, list(dict.fromkeys(requires or [])), args, kwargs)
+            self.nodes[name] = node
+            failed = False
+
+            for require in node.requires:
+                if require not in self.status:
+                    node.waiting.add(require)
+                    if require in self.nodes:
+                        self.nodes[require].dependents.append(name)
+                    else:
+                        self.blocked.setdefault(require, []).append(name)
+                elif not self.status[require]:
+                    failed = True
+
+            for dependent in self.blocked.pop(name, []):
+                node.dependents.append(dependent)
+
+            if failed:
+                ready = self._finish(node, False)
+            elif not node.waiting:
+                ready = [node]
+            else:
+                ready = []
+
+        self._dispatch(ready)
+
+    def _dispatch(self, nodes):
+        # Sequential execution drains the ready queue from wait() instead of recursing through dependents
+        if self.disable_parallel:
+            self.ready.extend(nodes)
+        else:
+            for node in nodes:
+                self.parallel.exec(self._exec, node.name, node)
+
+    def _exec(self, node):
+        node.start_time = time.perf_counter()
+        success = False
+        try:
+            result = node.callback(*node.args, **node.kwargs)
+            success = True
+            return result
+        finally:
+            node.end_time = time.perf_counter()
+
+            with self.lock:
+                ready = self._finish(node, success)
+
+            self._dispatch(ready)
+
+    def _finish(self, node, success):
+        ready = []
+        finished = [(node, success)]
+
+        while finished:
+            node, success = finished.pop()
+            self.status[node.name] = success
+
+            for require in node.requires:
+                require_node = self.nodes[require]
+                if require_node.path_time >= node.path_time:
+                    node.path_time = require_node.path_time
+                    node.path_parent = require
+            node.path_time += node.duration
+
+            for dependent_name in node.dependents:
+                dependent = self.nodes[dependent_name]
+                if dependent_name in self.status or node.name not in dependent.waiting:
+                    continue
+
+                dependent.waiting.discard(node.name)
+                if not success:
+                    dependent.waiting.clear()
+                    finished.append((dependent, False))
+                elif not dependent.waiting:
+                    ready.append(dependent)
+        return ready
+
+    def wait(self, raise_errors=True):
+        while self.ready:
+            node = self.ready.popleft()
+            self.parallel.exec(self._exec, node.name, node)
+
+        # Dependents are dispatched before their requirement's task completes so the pool drains the whole graph
+        self.parallel.join()
+
+        with self.lock:
+            for name, node in self.nodes.items():
+                if name not in self.status:
+                    missing = sorted(require for require in node.waiting if require not in self.nodes)
+                    if missing:
+                        error = ParallelError(f"Required graph nodes {', '.join(missing)} do not exist")
+                    else:
+                        error = ParallelError(
+                            f"Graph node requirements are circular or unresolved: {', '.join(sorted(node.waiting))}"
+                        )
+
+                    self.status[name] = False
+                    self.results.add_error(name, error)
+
+        self.end_time = time.perf_counter()
+        return self.parallel.wait(raise_errors=raise_errors)
+
+    @property
+    def elapsed_time(self):
+        return (self.end_time if self.end_time else time.perf_counter()) - self.start_time
+
+    def critical_path(self):
+        with self.lock:
+            path = []
+            path_time = 0
+            finished = [node for name, node in self.nodes.items() if name in self.status]
+
+            if finished:
+                node = max(finished, key=lambda node: node.path_time)
+                path_time = node.path_time
+
+                while node:
+                    if node.start_time is not None:
+                        path.insert(0, node.name)
+                    node = self.nodes[node.path_parent] if node.path_parent else None
+        return path, path_time
@@ -1,7 +1,9 @@
 import importlib
 import logging
+import os
 import re
 import sys
+import threading
 import types
 
 from .data import dump_json
@@ -9,6 +11,28 @@ from .data import dump_json
 logger = logging.getLogger(__name__)
 
 
+class ProcessLocal:
+    def __init__(self, factory, check=None):
+        self.factory = factory
+        self.check = check
+        self.lock = threading.Lock()
+        self.pid = None
+        self.value = None
+
+    def get(self, *args, **kwargs):
+        with self.lock:
+            # Threads do not survive a fork so each process lazily creates its own value
+            if self.pid != os.getpid() or (self.check and not self.check(self.value)):
+                self.value = self.factory(*args, **kwargs)
+                self.pid = os.getpid()
+            return self.value
+
+    def peek(self):
+        # Current process value without creating it
+        value = self.value
+        return value if self.pid == os.getpid() else None
+
+
 def create_module(module_path):
     module = types.ModuleType(module_path)
     sys.modules[module_path] = module
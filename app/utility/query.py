@@ -1,5 +1,7 @@
 import copy
 
+from django.db.models import Count
+
 from .data import ensure_list
 
 
@@ -43,3 +45,17 @@ def init_filters(filters, default=None):
 def get_field_values(queryset, field):
     values = queryset.values_list(field, flat=True)
     return [value for value in list(set(values)) if value is not None]
+
+
+def get_field_count(queryset, field):
+    return queryset.order_by().aggregate(count=Count(field, distinct=True))["count"]
+
+
+def get_distinct_values(queryset, field, limit=None, offset=None):
+    values = (
+        queryset.order_by().filter(**{f"{field}__isnull": False}).values_list(field, flat=True).distinct().order_by(field)
+    )
+    offset = offset or 0
+    if limit or offset:
+        values = values[offset : offset + limit if limit else None]
+    return list(values)
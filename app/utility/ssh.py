@@ -1,6 +1,9 @@
+import copy
 import os
 import random
 import string
+import threading
+from contextlib import contextmanager
 from io import StringIO
 from os import path
 
@@ -36,16 +39,21 @@ class SSH:
         chars = string.ascii_lowercase + string.digits
         return "".join(random.SystemRandom().choice(chars) for _ in range(length))
 
-    def __init__(self, hostname, username, password, key=None, callback=None, timeout=30, port=22, env=None):
+    def __init__(
+        self, hostname, username, password, key=None, callback=None, timeout=30, port=22, env=None, max_channels=None
+    ):
         if not env:
             env = {}
 
         self.client = None
-        self.sftp = None
-        self.exec_wrapper = None
+        self.connection = None
         self.exec_wrapper = None
+        self.file_wrapper = None
         self.callback = None
 
+        # Servers limit the channels open on one connection (OpenSSH MaxSessions defaults to 10)
+        self.channels = threading.BoundedSemaphore(max_channels) if max_channels else None
+
         self.env = env
         self.hostname = hostname
         self.port = port
@@ -70,6 +78,18 @@ class SSH:
     def __del__(self):
         self.close()
 
+    @property
+    def active(self):
+        transport = self.client.get_transport() if self.client else None
+        return transport is not None and transport.is_active()
+
+    def session(self, env=None):
+        # Sessions run commands over the channels of this connection with their own environment
+        session = copy.copy(self)
+        session.connection = self
+        session.env = env if env else {}
+        return session
+
     def wrap_file(self, callback):
         self.file_wrapper = callback
 
@@ -102,14 +122,30 @@ class SSH:
         else:
             self.client.connect(self.hostname, self.port, self.username, self.password, timeout=self.timeout)
 
-        self.sftp = self.client.open_sftp()
-
     def close(self):
-        try:
-            self.client.close()
-            self.sftp.close()
-        except Exception:
-            pass
+        # Sessions share the client of the connection that created them
+        if self.connection is None:
+            try:
+                self.client.close()
+            except Exception:
+                pass
+
+    @contextmanager
+    def channel(self):
+        if self.channels:
+            with self.channels:
+                yield
+        else:
+            yield
+
+    @contextmanager
+    def sftp(self):
+        with self.channel():
+            sftp = self.client.open_sftp()
+            try:
+                yield sftp
+            finally:
+                sftp.close()
 
     def download(self, remote_file, local_file, mode=None):
         def callback(remote_file, local_file, mode):
@@ -124,7 +160,8 @@ class SSH:
             self.sudo(f"cp -f {remote_file} {tmp_file}")
             self.sudo(f"chmod 644 {tmp_file}")
 
-            self.sftp.get(tmp_file, local_file)
+            with self.sftp() as sftp:
+                sftp.get(tmp_file, local_file)
             self.sudo(f"rm -f {tmp_file}")
 
             if mode:
@@ -144,7 +181,8 @@ class SSH:
 
             # Since we can't use sudo and sftp together we need to
             # jump through some hoops
-            self.sftp.put(local_file, tmp_file)
+            with self.sftp() as sftp:
+                sftp.put(local_file, tmp_file)
             self.sudo(f"cp -f {tmp_file} {remote_file}")
             self.sudo(f"rm -f {tmp_file}")
 
@@ -187,17 +225,18 @@ class SSH:
             env.append(f"{variable}='{value}'")
         env = " ".join(env) + " "
 
-        stdin, stdout, stderr = self.client.exec_command(f"{env}{command}".strip())
+        with self.channel():
+            stdin, stdout, stderr = self.client.exec_command(f"{env}{command}".strip())
 
-        if is_sudo:
-            if self.password:
-                stdin.write(self.password + "\n")
-                stdin.flush()
+            if is_sudo:
+                if self.password:
+                    stdin.write(self.password + "\n")
+                    stdin.flush()
 
-        if self.callback and callable(self.callback):
-            self.callback(self, stdin, stdout, stderr)
+            if self.callback and callable(self.callback):
+                self.callback(self, stdin, stdout, stderr)
 
-        return stdout.channel.recv_exit_status()
+            return stdout.channel.recv_exit_status()
 
     def _format_command(self, command, args, options, separator=" "):
         components = [command]
@@ -212,3 +251,35 @@ class SSH:
             components.append(f"{key}{separator}{value}")
 
         return " ".join(components)
+
+
+class SSHPool:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.connections = {}
+        self.connection_locks = {}
+
+    def get(self, key, connect):
+        with self.lock:
+            connection_lock = self.connection_locks.setdefault(key, threading.Lock())
+
+        # Connections to different hosts handshake in parallel while callers for the same host share one
+        with connection_lock:
+            connection = self.connections.get(key, None)
+            if connection is None or not connection.active:
+                if connection:
+                    connection.close()
+
+                connection = connect()
+                with self.lock:
+                    self.connections[key] = connection
+
+        return connection
+
+    def close(self):
+        with self.lock:
+            connections = list(self.connections.values())
+            self.connections = {}
+
+        for connection in connections:
+            connection.close()
@@ -18,6 +18,16 @@ class Message:
         msg.load(data)
         return msg
 
+    @classmethod
+    def get_batch(cls, data, cipher=None):
+        if "packages" not in data:
+            return [cls.get(data, cipher=cipher)]
+
+        batch = cipher.decrypt(data["packages"], False) if cipher else data["packages"]
+        if isinstance(batch, (str, bytes)):
+            batch = utility.load_json(batch)
+        return [cls.get({"package": message}) for message in batch]
+
     def __init__(self, message="", name=None, prefix="", silent=False, system=False):
         super().__init__()
 
@@ -23,6 +23,7 @@ class CommandHTTPTransport(transports.BaseTransport):
 
     def request_command(self, url, headers, params, decoders):
         command_response = response.CommandResponse()
+        headers = {**headers, "x-zimagi-message-batch": "true"}
         request, request_response = self._request(
             "POST", url, stream=True, headers=headers, params=params, encrypted=True, use_auth=True
         )
@@ -33,14 +34,14 @@ class CommandHTTPTransport(transports.BaseTransport):
             raise exceptions.ResponseError(error["message"], request_response.status_code, error["data"])
         try:
             for line in request_response.iter_lines():
-                message = messages.Message.get(
+                for message in messages.Message.get_batch(
                     self.decode_message(request, request_response, decoders, message=line, decrypt=False),
                     cipher=self.client.cipher,
-                )
-                if self._message_callback and callable(self._message_callback):
-                    self._message_callback(message)
+                ):
+                    if self._message_callback and callable(self._message_callback):
+                        self._message_callback(message)
 
-                command_response.add(message)
+                    command_response.add(message)
 
         except Exception as error:
             logger.debug(f"Stream {url} error response headers: {request_response.headers}")
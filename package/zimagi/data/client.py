@@ -1,3 +1,5 @@
+import pandas
+
 from .. import client
 from .. import codecs as shared_codecs
 from .. import exceptions, parallel, settings, utility
@@ -13,6 +15,7 @@ class Client(client.BaseAPIClient):
             decoders=[
                 codecs.OpenAPIJSONCodec(),  # application/vnd.oai.openapi+json
                 codecs.CSVCodec(),  # text/csv
+                codecs.JSONLinesCodec(),  # application/x-ndjson
                 shared_codecs.JSONCodec(),  # application/json
             ],
             **kwargs,
@@ -153,9 +156,15 @@ class Client(client.BaseAPIClient):
         return self._execute_type_operation("GET", data_type, None, options)
 
     def json(self, data_type, **options):
+        return list(self.json_rows(data_type, **options))
+
+    def json_rows(self, data_type, **options):
         return self._execute_type_operation("GET", data_type, "json", options)
 
     def csv(self, data_type, **options):
+        return pandas.DataFrame(list(self.csv_rows(data_type, **options)))
+
+    def csv_rows(self, data_type, **options):
         return self._execute_type_operation("GET", data_type, "csv", options)
 
     def values(self, data_type, field_name=None, **options):
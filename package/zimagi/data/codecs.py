@@ -1,6 +1,9 @@
+import csv
+
 import pandas
 
-from .. import exceptions, utility
+from .. import codecs as shared_codecs
+from .. import collection, exceptions, utility
 
 
 class OpenAPIJSONCodec:
@@ -16,7 +19,7 @@ class OpenAPIJSONCodec:
 
 
 class CSVCodec:
-    media_types = ["text/csv"]
+    media_types = ["text/csv", "text/csv; stream=lines"]
 
     def decode(self, bytestring, **options):
         try:
@@ -37,3 +40,32 @@ class CSVCodec:
             if csv_line:
                 csv_data.append([utility.normalize_value(value.strip(), strip_quotes=True) for value in csv_line.split(",")])
         return csv_data
+
+    def decode_rows(self, lines, **options):
+        columns = None
+        try:
+            for row in csv.reader(lines):
+                if columns is None:
+                    columns = row
+                elif row:
+                    yield dict(zip(columns, [utility.normalize_value(value.strip()) for value in row]))
+
+        except csv.Error as exc:
+            raise exceptions.ParseError(f"Malformed CSV: {exc}")
+
+
+class JSONLinesCodec(shared_codecs.JSONCodec):
+    media_types = ["application/x-ndjson"]
+
+    def decode(self, bytestring, **options):
+        return list(self.decode_rows(utility.iterate_lines([bytestring]), **options))
+
+    def decode_rows(self, lines, **options):
+        for line in lines:
+            line = line.strip()
+            if line:
+                try:
+                    yield collection.RecursiveCollection(utility.load_json(line))
+
+                except ValueError as exc:
+                    raise exceptions.ParseError(f"Malformed JSON: {exc}")
@@ -17,9 +17,40 @@ class DataHTTPTransport(transports.BaseTransport):
                 return self.request_page(
                     url, headers, None, decoders, encrypted=False, use_auth=True, disable_callbacks=True
                 )
+            if re.match(r"^/.+/(csv|json)/?$", path):
+                return self.request_rows(url, headers, params, decoders)
             return self.request_page(url, headers, params, decoders, encrypted=True, use_auth=True)
         return self.update_data(method, url, headers, params, decoders)
 
+    def request_rows(self, url, headers, params, decoders):
+        request, response = self._request(
+            "GET", url, stream=True, headers=headers, params=params, encrypted=True, use_auth=True
+        )
+        logger.debug(f"Stream {url} request headers: {headers}")
+
+        if response.status_code >= 400:
+            with response:
+                error = utility.format_response_error(response, self.client.cipher)
+            raise exceptions.ResponseError(error["message"], response.status_code, error["data"])
+
+        codec = self._get_decoder(response.headers["content-type"], decoders)
+        if not hasattr(codec, "decode_rows"):
+            # Servers that do not stream the export return one complete document
+            with response:
+                return iter(self.decode_message(request, response, decoders) or [])
+
+        return self._iterate_rows(response, codec)
+
+    def _iterate_rows(self, response, codec):
+        with response:
+            if self.client.cipher:
+                # Encrypted streams deliver one encrypted frame of complete rows per line
+                chunks = (self.client.cipher.decrypt(line) for line in response.iter_lines() if line)
+            else:
+                chunks = response.iter_content(chunk_size=None)
+
+            yield from codec.decode_rows(utility.iterate_lines(chunks))
+
     def update_data(self, method, url, headers, params, decoders, encrypted=True):
         request, response = self._request(
             method,
@@ -12,6 +12,10 @@ DEFAULT_TOKEN = "uy5c8xiahf93j2pl8s00e6nb32h87dn3"
 CONNECTION_RETRIES = 20
 CONNECTION_RETRY_WAIT = 3
 
+CONNECTION_POOL_SIZE = 10
+CONNECTION_POOL_RETRIES = 3
+CONNECTION_POOL_BACKOFF = 0.5
+
 COMMAND_RAISE_ERROR = False
 
 PARALLEL = True
@@ -1,13 +1,16 @@
 import logging
+import threading
 import time
 import urllib
 from http import cookiejar
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError
+from urllib3.util.retry import Retry
 
-from . import exceptions, utility
+from . import exceptions, settings, utility
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +22,17 @@ class BlockAll(cookiejar.CookiePolicy):
 
 
 class BaseTransport:
-    def __init__(self, client=None, verify_cert=False, options_callback=None, request_callback=None, response_callback=None):
+    def __init__(
+        self,
+        client=None,
+        verify_cert=False,
+        options_callback=None,
+        request_callback=None,
+        response_callback=None,
+        pool_size=None,
+        pool_retries=None,
+        pool_backoff=None,
+    ):
         self.client = client
         self.verify_cert = verify_cert
 
@@ -27,8 +40,46 @@ class BaseTransport:
         self.request_callback = request_callback
         self.response_callback = response_callback
 
+        self.pool_size = pool_size if pool_size is not None else settings.CONNECTION_POOL_SIZE
+        self.pool_retries = pool_retries if pool_retries is not None else settings.CONNECTION_POOL_RETRIES
+        self.pool_backoff = pool_backoff if pool_backoff is not None else settings.CONNECTION_POOL_BACKOFF
+
+        self._session = None
+        self._session_lock = threading.Lock()
+
         urllib3.disable_warnings()
 
+    @property
+    def session(self):
+        with self._session_lock:
+            if self._session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=self.pool_size,
+                    pool_maxsize=self.pool_size,
+                    max_retries=Retry(
+                        total=self.pool_retries,
+                        read=0,
+                        status=self.pool_retries,
+                        backoff_factor=self.pool_backoff,
+                        status_forcelist=(502, 503, 504),
+                        allowed_methods=frozenset(["GET", "HEAD", "OPTIONS"]),
+                        raise_on_status=False,
+                    ),
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.cookies.set_policy(BlockAll())
+                self._session = session
+
+            return self._session
+
+    def close(self):
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
     def request(self, method, url, decoders, params=None, tries=3, wait=2, validate_callback=None):
         connection_error_message = "\n".join(
             [
@@ -85,12 +136,9 @@ class BaseTransport:
     def _request(
         self, method, url, headers=None, params=None, encrypted=True, stream=False, use_auth=True, disable_callbacks=False
     ):
-        session = requests.Session()
-
-        if use_auth:
-            session.auth = self.client.auth
+        session = self.session
 
-        options = {"headers": headers or {}}
+        options = {"headers": headers or {}, "auth": self.client.auth if use_auth else None}
         if params:
             parameter_name = "data" if method in ("POST", "PUT") else "params"
             options[parameter_name] = self._encrypt_params(params) if encrypted else params
@@ -102,7 +150,6 @@ class BaseTransport:
         if not disable_callbacks and self.request_callback and callable(self.request_callback):
             self.request_callback(request, settings)
 
-        session.cookies.set_policy(BlockAll())
         return (request, session.send(request, **settings))
 
     def _encrypt_params(self, params):
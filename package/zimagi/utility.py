@@ -1,3 +1,4 @@
+import codecs
 import copy
 import datetime
 import json
@@ -67,6 +68,21 @@ def normalize_value(value, strip_quotes=False, parse_json=False):
     return value
 
 
+def iterate_lines(chunks, encoding="utf-8"):
+    decoder = codecs.getincrementaldecoder(encoding)()
+    buffer = ""
+
+    for chunk in chunks:
+        buffer += decoder.decode(chunk) if isinstance(chunk, (bytes, bytearray)) else chunk
+        lines = buffer.splitlines(keepends=True)
+        buffer = lines.pop() if lines and not lines[-1].endswith(("\n", "\r")) else ""
+        yield from lines
+
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer
+
+
 def format_options(method, options):
     if options is None:
         options = {}